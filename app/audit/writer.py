@@ -1,4 +1,7 @@
 import json
+import logging
+import queue
+import threading
 from datetime import UTC, datetime
 from hashlib import sha256
 from pathlib import Path
@@ -9,6 +12,11 @@ from jsonschema import ValidationError, validate
 
 from app.config.settings import Settings
 
+logger = logging.getLogger("srg.audit")
+
+# Reused for every payload hash instead of json.dumps building an encoder per call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
 
 class AuditValidationError(Exception):
     """Raised when audit payload is invalid."""
@@ -20,29 +28,33 @@ class AuditWriter:
         self._schema_path = settings.contracts_dir / "audit-event.schema.json"
         self._schema = json.loads(self._schema_path.read_text(encoding="utf-8"))
         self._log_path = settings.audit_log_path
+        # Serializes the read-last-hash/append pair so the chain stays intact
+        # when events are written from more than one thread.
+        self._lock = threading.Lock()
 
     def write_event(self, event: dict[str, Any]) -> dict[str, Any]:
         payload = dict(event)
         payload.setdefault("event_id", str(uuid4()))
         payload.setdefault("created_at", datetime.now(UTC).isoformat())
 
-        prev_hash = self._last_payload_hash()
-        payload["prev_hash"] = prev_hash
-        payload["payload_hash"] = self._calculate_payload_hash(payload)
+        with self._lock:
+            prev_hash = self._last_payload_hash()
+            payload["prev_hash"] = prev_hash
+            payload["payload_hash"] = self._calculate_payload_hash(payload)
 
-        try:
-            validate(instance=payload, schema=self._schema)
-        except ValidationError as exc:
-            raise AuditValidationError(str(exc)) from exc
+            try:
+                validate(instance=payload, schema=self._schema)
+            except ValidationError as exc:
+                raise AuditValidationError(str(exc)) from exc
 
-        self._log_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._log_path.open("a", encoding="utf-8") as file_handle:
-            file_handle.write(json.dumps(payload, ensure_ascii=True) + "\n")
+            self._log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._log_path.open("a", encoding="utf-8") as file_handle:
+                file_handle.write(json.dumps(payload, ensure_ascii=True) + "\n")
 
         return payload
 
     def _calculate_payload_hash(self, payload: dict[str, Any]) -> str:
-        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        canonical = _CANONICAL_ENCODER.encode(payload)
         return sha256(canonical.encode("utf-8")).hexdigest()
 
     def _last_payload_hash(self) -> str:
@@ -77,3 +89,57 @@ class AuditWriter:
 
             file_handle.seek(position)
             return file_handle.read().decode("utf-8").strip()
+
+
+class BackgroundAuditWriter:
+    """Persists audit events from a single background thread.
+
+    Events are written in submission order, so the hash chain matches what
+    synchronous writes would produce. ``submit`` returns ``False`` when the
+    queue is full so the caller can write synchronously instead. Validation
+    failures are logged, since no request is waiting on the result.
+    """
+
+    def __init__(self, writer: AuditWriter, max_queue: int = 1000):
+        self._writer = writer
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=max(max_queue, 1))
+        self._thread = threading.Thread(
+            target=self._drain, name="srg-audit-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, event: dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every submitted event has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the remaining events and stop the worker thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                self._queue.task_done()
+                return
+            try:
+                self._writer.write_event(event)
+            except AuditValidationError as exc:
+                logger.warning(
+                    "audit_write_failed_background",
+                    extra={"request_id": event.get("request_id"), "error": str(exc)},
+                )
+            except Exception:
+                logger.exception("audit_writer_error")
+            finally:
+                self._queue.task_done()
@@ -29,6 +29,19 @@ except Exception:  # pragma: no cover - optional dependency at runtime
     redis = None
 
 
+def _budget_summary(
+    tenant_id: str, window_seconds: int, ceiling: int, used: int
+) -> dict[str, object]:
+    return {
+        "tenant_id": tenant_id,
+        "window_seconds": window_seconds,
+        "ceiling": ceiling,
+        "used": used,
+        "remaining": max(0, ceiling - used),
+        "utilization_pct": round(used / ceiling * 100, 2) if ceiling > 0 else 0.0,
+    }
+
+
 class BudgetExceededError(Exception):
     """Raised when a tenant's token usage exceeds their budget ceiling."""
 
@@ -48,11 +61,18 @@ class BudgetBackendError(Exception):
 
 
 class BudgetTracker(Protocol):
-    def check(self, tenant_id: str, requested_tokens: int) -> None:
-        """Raise BudgetExceededError if this request would exceed the ceiling."""
+    def check(self, tenant_id: str, requested_tokens: int) -> dict[str, object] | None:
+        """Raise BudgetExceededError if this request would exceed the ceiling.
+
+        May return the tenant summary computed from the same usage read, which
+        saves callers a separate :meth:`summary` round-trip.
+        """
 
-    def record(self, tenant_id: str, tokens: int) -> None:
-        """Record actual token usage after a successful request."""
+    def record(self, tenant_id: str, tokens: int) -> dict[str, object] | None:
+        """Record actual token usage after a successful request.
+
+        May return the tenant summary after recording, as with :meth:`check`.
+        """
 
     def summary(self, tenant_id: str) -> dict[str, object]:
         """Return budget summary for this tenant."""
@@ -122,8 +142,11 @@ class TokenBudgetTracker:
         """Return the effective token ceiling for a tenant."""
         return self._tenant_ceilings.get(tenant_id, self._default_ceiling)
 
-    def check(self, tenant_id: str, requested_tokens: int) -> None:
-        """Raise ``BudgetExceededError`` if this request would exceed the ceiling."""
+    def check(self, tenant_id: str, requested_tokens: int) -> dict[str, object]:
+        """Raise ``BudgetExceededError`` if this request would exceed the ceiling.
+
+        Returns the tenant summary from the same usage read.
+        """
         ceiling = self.ceiling_for(tenant_id)
         with self._lock:
             bucket = self._buckets[tenant_id]
@@ -137,13 +160,15 @@ class TokenBudgetTracker:
                     ceiling=ceiling,
                     window_seconds=self._window_seconds,
                 )
+        return _budget_summary(tenant_id, self._window_seconds, ceiling, current)
 
-    def record(self, tenant_id: str, tokens: int) -> None:
-        """Record actual token usage after a successful request."""
+    def record(self, tenant_id: str, tokens: int) -> dict[str, object]:
+        """Record actual token usage and return the updated tenant summary."""
         with self._lock:
             self._buckets[tenant_id].entries.append(
                 UsageEntry(timestamp=monotonic(), tokens=tokens)
             )
+        return self.summary(tenant_id)
 
     def usage(self, tenant_id: str) -> int:
         """Return current token usage for a tenant within the window."""
@@ -175,15 +200,7 @@ class TokenBudgetTracker:
     def summary(self, tenant_id: str) -> dict[str, object]:
         """Return a summary dict suitable for API responses and audit events."""
         ceiling = self.ceiling_for(tenant_id)
-        used = self.usage(tenant_id)
-        return {
-            "tenant_id": tenant_id,
-            "window_seconds": self._window_seconds,
-            "ceiling": ceiling,
-            "used": used,
-            "remaining": max(0, ceiling - used),
-            "utilization_pct": round(used / ceiling * 100, 2) if ceiling > 0 else 0.0,
-        }
+        return _budget_summary(tenant_id, self._window_seconds, ceiling, self.usage(tenant_id))
 
 
 class RedisTokenBudgetTracker:
@@ -249,7 +266,7 @@ class RedisTokenBudgetTracker:
             raise BudgetBackendError(f"Redis read failed: {exc}") from exc
         return sum(self._member_tokens(member) for member in members)
 
-    def check(self, tenant_id: str, requested_tokens: int) -> None:
+    def check(self, tenant_id: str, requested_tokens: int) -> dict[str, object]:
         ceiling = self.ceiling_for(tenant_id)
         current = self._current_usage(tenant_id)
         if current + requested_tokens > ceiling:
@@ -259,8 +276,9 @@ class RedisTokenBudgetTracker:
                 ceiling=ceiling,
                 window_seconds=self._window_seconds,
             )
+        return _budget_summary(tenant_id, self._window_seconds, ceiling, current)
 
-    def record(self, tenant_id: str, tokens: int) -> None:
+    def record(self, tenant_id: str, tokens: int) -> dict[str, object]:
         key = self._key(tenant_id)
         now = time()
         member = f"{now:.6f}:{max(tokens, 0)}:{uuid4().hex}"
@@ -271,6 +289,7 @@ class RedisTokenBudgetTracker:
             pipe.execute()
         except Exception as exc:
             raise BudgetBackendError(f"Redis write failed: {exc}") from exc
+        return self.summary(tenant_id)
 
     def usage(self, tenant_id: str) -> int:
         return self._current_usage(tenant_id)
@@ -289,12 +308,4 @@ class RedisTokenBudgetTracker:
 
     def summary(self, tenant_id: str) -> dict[str, object]:
         ceiling = self.ceiling_for(tenant_id)
-        used = self.usage(tenant_id)
-        return {
-            "tenant_id": tenant_id,
-            "window_seconds": self._window_seconds,
-            "ceiling": ceiling,
-            "used": used,
-            "remaining": max(0, ceiling - used),
-            "utilization_pct": round(used / ceiling * 100, 2) if ceiling > 0 else 0.0,
-        }
+        return _budget_summary(tenant_id, self._window_seconds, ceiling, self.usage(tenant_id))
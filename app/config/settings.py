@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     rag_enabled: bool = True
     rag_default_top_k: int = 3
     rag_allowed_connectors: str = "filesystem"
+    rag_prefetch_enabled: bool = False
     rag_filesystem_index_path: Path = Path("artifacts/rag/filesystem_index.jsonl")
     rag_postgres_dsn: str | None = None
     rag_postgres_table: str = "rag_chunks"
@@ -49,6 +50,9 @@ class Settings(BaseSettings):
     rag_sharepoint_cache_ttl_seconds: float = 60.0
     rag_embedding_dim: int = 16
     rag_embedding_source: str = "hash"
+    # Token digest for source=hash; vectors already stored in pgvector must be
+    # re-ingested when this changes.
+    rag_embedding_hash_algo: str = "sha256"
     rag_embedding_endpoint: str | None = None
     rag_embedding_model: str = "text-embedding-3-small"
     rag_embedding_api_key: str | None = None
@@ -59,13 +63,31 @@ class Settings(BaseSettings):
     opa_mode: str = "enforce"
     opa_url: str | None = None
     opa_simulate_timeout: bool = False
+    policy_cache_ttl_s: float = 0.0
+    policy_cache_max_entries: int = 10_000
     log_level: str = "INFO"
     redaction_enabled: bool = True
+    # Detect matches with Hyperscan when the optional package is installed.
+    redaction_hyperscan_enabled: bool = False
     provider_name: str = "stub"
     provider_config: str = ""
     provider_fallback_enabled: bool = True
+    # Skip pydantic validation of chat responses from in-process provider adapters.
+    trust_provider_payloads: bool = False
+    # Streaming: coalesce provider deltas into one SSE write per window (0 disables).
+    stream_coalesce_ms: float = 0.0
+    stream_coalesce_max_chunks: int = 16
     metrics_enabled: bool = True
     audit_log_path: Path = Path("artifacts/audit/events.jsonl")
+    # Digest for the request/provider payload fingerprints in audit events:
+    # "sha256" (matches existing records), "blake2b", or the optional-package
+    # "blake3" and "xxh3_128" (xxhash; fastest, but not a cryptographic digest).
+    audit_hash_algo: str = "sha256"
+    # Record provider request/response fingerprints (null in audit events when off).
+    audit_provider_hashes_enabled: bool = True
+    # Write completed-request audit events from a background thread.
+    audit_async_enabled: bool = False
+    audit_queue_max: int = 1000
     contracts_dir: Path = Path(__file__).resolve().parents[2] / "docs" / "contracts" / "v1"
 
     # Budget enforcement
@@ -88,6 +110,10 @@ class Settings(BaseSettings):
     webhook_dead_letter_backend: str = "sqlite"
     webhook_dead_letter_path: Path | None = Path("artifacts/audit/webhook_dead_letter.db")
     webhook_dead_letter_retention_days: int = 30
+    webhook_batch_enabled: bool = False
+    webhook_batch_max_events: int = 50
+    webhook_batch_flush_s: float = 5.0
+    webhook_batch_max_pending: int = 1000
 
     # Telemetry / tracing
     tracing_enabled: bool = False
@@ -0,0 +1,44 @@
+"""JSON encoding and decoding for large payloads on the request path.
+
+``orjson`` is used when installed (it parses embedding arrays and Graph
+payloads several times faster than the stdlib); otherwise ``json`` is used.
+"""
+
+import importlib
+import json
+from typing import Any
+
+orjson: Any | None
+try:  # pragma: no cover - optional dependency
+    orjson = importlib.import_module("orjson")
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Reused by the stdlib fallback; json.dumps builds a new encoder per call
+# whenever non-default options are passed.
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_SORTED_COMPACT_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+)
+
+
+def loads_json(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json(value: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``value`` to compact UTF-8 JSON.
+
+    The output is not byte-identical across backends (``orjson`` emits raw
+    UTF-8 and shortest float reprs), so it must not feed persisted digests.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        try:
+            return bytes(orjson.dumps(value, option=option))
+        except TypeError:
+            pass  # non-str keys or values orjson rejects; fall back below
+    encoder = _SORTED_COMPACT_ENCODER if sort_keys else _COMPACT_ENCODER
+    return encoder.encode(value).encode("utf-8")
@@ -1,4 +1,7 @@
+import asyncio
 import json as json_mod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
@@ -35,7 +38,7 @@ from app.rag.embeddings import (
 )
 from app.rag.registry import ConnectorRegistry
 from app.rag.retrieval import RetrievalOrchestrator
-from app.redaction.engine import RedactionEngine
+from app.redaction.engine import DEFAULT_ENGINE, RedactionEngine
 from app.services.chat_service import ChatService
 from app.services.inflight_guard import InflightGuard
 from app.telemetry.tracing import OTLPHTTPTraceExporter, SpanCollector
@@ -45,7 +48,9 @@ from app.webhooks.dispatcher import WebhookDispatcher, WebhookEndpoint, WebhookE
 def _build_rag_embedding_generator(settings: Settings, embedding_dim: int) -> EmbeddingGenerator:
     source = settings.rag_embedding_source.strip().lower()
     if source == "hash":
-        return HashEmbeddingGenerator(embedding_dim=embedding_dim)
+        return HashEmbeddingGenerator(
+            embedding_dim=embedding_dim, hash_algo=settings.rag_embedding_hash_algo
+        )
     if source == "http":
         endpoint = settings.rag_embedding_endpoint
         if not endpoint:
@@ -62,6 +67,12 @@ def _build_rag_embedding_generator(settings: Settings, embedding_dim: int) -> Em
     raise RuntimeError(f"Unsupported SRG_RAG_EMBEDDING_SOURCE value: {source}")
 
 
+def _concurrency_limit(raw: object) -> asyncio.Semaphore | None:
+    if not isinstance(raw, int) or isinstance(raw, bool) or raw <= 0:
+        return None
+    return asyncio.Semaphore(raw)
+
+
 def _build_provider_registry(settings: Settings) -> ProviderRegistry:
     registry = ProviderRegistry()
     stub = StubProvider(embedding_dim=settings.rag_embedding_dim)
@@ -159,6 +170,10 @@ def _build_provider_registry(settings: Settings) -> ProviderRegistry:
                     capabilities=capabilities,
                     priority=entry.get("priority", 50),
                     enabled=entry.get("enabled", True),
+                    chat_semaphore=_concurrency_limit(entry.get("max_concurrent_chat")),
+                    embedding_semaphore=_concurrency_limit(
+                        entry.get("max_concurrent_embeddings")
+                    ),
                 )
             )
 
@@ -249,11 +264,23 @@ def _build_inflight_guard(settings: Settings) -> InflightGuard | None:
     return guard
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    chat_service: ChatService | None = getattr(app.state, "chat_service", None)
+    if chat_service is not None:
+        await chat_service.drain_webhooks()
+        chat_service.close()
+    connector_registry: ConnectorRegistry | None = getattr(app.state, "connector_registry", None)
+    if connector_registry is not None:
+        connector_registry.close()
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
     configure_logging(settings.log_level)
 
-    app = FastAPI(title="Sovereign RAG Gateway", version="1.1.0")
+    app = FastAPI(title="Sovereign RAG Gateway", version="1.1.0", lifespan=_lifespan)
 
     app.add_middleware(RequestIDMiddleware)
     app.add_middleware(AuthMiddleware)
@@ -374,7 +401,11 @@ def create_app() -> FastAPI:
         settings=settings,
         policy_client=OPAClient(settings),
         provider=primary_provider,
-        redaction_engine=RedactionEngine(),
+        redaction_engine=(
+            RedactionEngine(use_hyperscan=True)
+            if settings.redaction_hyperscan_enabled
+            else DEFAULT_ENGINE
+        ),
         audit_writer=AuditWriter(settings),
         retrieval_orchestrator=RetrievalOrchestrator(
             registry=connector_registry,
@@ -387,6 +418,7 @@ def create_app() -> FastAPI:
         inflight_guard=inflight_guard,
     )
     app.state.chat_service = chat_service
+    app.state.connector_registry = connector_registry
 
     @app.exception_handler(AppError)
     async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
@@ -43,12 +43,16 @@ def inc_counter(name: str, labels: dict[str, str], value: float = 1.0) -> None:
 def observe_histogram(name: str, labels: dict[str, str], value: float) -> None:
     key: LabelKey = tuple(sorted(labels.items()))
     with _lock:
-        _histogram_sums[name][key] += value
-        _histogram_counts[name][key] += 1
-        buckets = _histogram_buckets[name][key]
-        for i, bound in enumerate(LATENCY_BUCKETS):
-            if value <= bound:
-                buckets[i] += 1
+        _observe_locked(name, key, value)
+
+
+def _observe_locked(name: str, key: LabelKey, value: float) -> None:
+    _histogram_sums[name][key] += value
+    _histogram_counts[name][key] += 1
+    buckets = _histogram_buckets[name][key]
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if value <= bound:
+            buckets[i] += 1
 
 
 def _format_labels(label_pairs: LabelKey) -> str:
@@ -117,49 +121,38 @@ def record_request(
     redaction_count: int = 0,
     provider_attempts: int = 1,
 ) -> None:
-    """Record all metrics for a completed request."""
-    base_labels = {
-        "endpoint": endpoint,
-        "provider": provider,
-        "model": model,
-    }
-
-    inc_counter(
-        "srg_requests_total",
-        {**base_labels, "status": str(status_code)},
-    )
-    inc_counter(
-        "srg_policy_decisions_total",
-        {"endpoint": endpoint, "decision": policy_decision},
-    )
-    observe_histogram("srg_request_duration_seconds", base_labels, latency_s)
-
-    if tokens_in > 0:
-        inc_counter(
-            "srg_tokens_total",
-            {**base_labels, "direction": "input"},
-            float(tokens_in),
-        )
-    if tokens_out > 0:
-        inc_counter(
-            "srg_tokens_total",
-            {**base_labels, "direction": "output"},
-            float(tokens_out),
-        )
-    if cost_usd > 0:
-        inc_counter("srg_cost_usd_total", base_labels, cost_usd)
-    if redaction_count > 0:
-        inc_counter(
-            "srg_redactions_total",
-            {"endpoint": endpoint},
-            float(redaction_count),
-        )
-    if provider_attempts > 1:
-        inc_counter(
-            "srg_provider_fallbacks_total",
-            {"provider": provider},
-            float(provider_attempts - 1),
-        )
+    """Record all metrics for a completed request.
+
+    Label keys are built already sorted and every series is updated under one
+    lock acquisition, since this runs once per request.
+    """
+    base_key: LabelKey = (("endpoint", endpoint), ("model", model), ("provider", provider))
+    counters = _counters
+    with _lock:
+        counters["srg_requests_total"][(*base_key, ("status", str(status_code)))] += 1.0
+        counters["srg_policy_decisions_total"][
+            (("decision", policy_decision), ("endpoint", endpoint))
+        ] += 1.0
+        _observe_locked("srg_request_duration_seconds", base_key, latency_s)
+
+        if tokens_in > 0:
+            counters["srg_tokens_total"][(("direction", "input"), *base_key)] += float(
+                tokens_in
+            )
+        if tokens_out > 0:
+            counters["srg_tokens_total"][(("direction", "output"), *base_key)] += float(
+                tokens_out
+            )
+        if cost_usd > 0:
+            counters["srg_cost_usd_total"][base_key] += cost_usd
+        if redaction_count > 0:
+            counters["srg_redactions_total"][(("endpoint", endpoint),)] += float(
+                redaction_count
+            )
+        if provider_attempts > 1:
+            counters["srg_provider_fallbacks_total"][(("provider", provider),)] += float(
+                provider_attempts - 1
+            )
 
 
 # -- FastAPI router --
@@ -11,7 +11,7 @@ BYPASS_PATHS = {"/healthz", "/readyz", "/openapi.json", "/docs", "/docs/oauth2-r
 
 class AuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in BYPASS_PATHS:
+        if request.scope["path"] in BYPASS_PATHS:
             return await call_next(request)
 
         request_id = request_id_from_request(request)
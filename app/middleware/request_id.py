@@ -9,6 +9,8 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         request_id = request.headers.get("x-request-id") or str(uuid4())
         request.state.request_id = request_id
+        # Read the raw scope path once; handlers reuse it instead of building URLs.
+        request.state.endpoint = request.scope["path"]
         response = await call_next(request)
         response.headers["x-request-id"] = request_id
         return response
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -58,6 +58,22 @@ class ChatCompletionResponse(BaseModel):
     choices: list[Choice]
     usage: Usage
 
+    @classmethod
+    def construct_from_provider(cls, data: dict[str, Any]) -> "ChatCompletionResponse":
+        """Build the response from a trusted provider payload without validation."""
+        choices = [
+            Choice.model_construct(
+                **{
+                    **choice,
+                    "message": ChoiceMessage.model_construct(**choice["message"]),
+                }
+            )
+            for choice in data["choices"]
+        ]
+        return cls.model_construct(
+            **{**data, "choices": choices, "usage": Usage.model_construct(**data["usage"])}
+        )
+
 
 class EmbeddingsRequest(BaseModel):
     model: str
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 
@@ -13,6 +14,15 @@ class ConnectorConstraints:
     allowed_connectors: list[str] | None = None
 
 
+def _constraint_names(constraints: dict[str, Any] | None, key: str) -> set[str] | None:
+    if not isinstance(constraints, dict):
+        return None
+    raw_allowed = constraints.get(key)
+    if not isinstance(raw_allowed, list):
+        return None
+    return {str(item) for item in raw_allowed if str(item).strip()}
+
+
 @dataclass
 class PolicyDecision:
     decision_id: str
@@ -24,6 +34,8 @@ class PolicyDecision:
     provider_constraints: dict[str, Any] | None = None
     connector_constraints: ConnectorConstraints | None = None
     max_tokens_override: int | None = None
+    # Set on copies served from the gateway's decision cache instead of OPA.
+    cache_hit: bool = False
 
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> "PolicyDecision":
@@ -55,3 +67,20 @@ class PolicyDecision:
             connector_constraints=connector_constraints,
             max_tokens_override=payload.get("max_tokens_override"),
         )
+
+    # Allow-lists parsed once per decision; cached decisions are reused across
+    # requests, so callers must treat the returned sets as read-only.
+    @cached_property
+    def allowed_provider_names(self) -> set[str] | None:
+        return _constraint_names(self.provider_constraints, "allowed_providers")
+
+    @cached_property
+    def allowed_model_names(self) -> set[str] | None:
+        return _constraint_names(self.provider_constraints, "allowed_models")
+
+    @cached_property
+    def allowed_connector_names(self) -> set[str] | None:
+        if self.connector_constraints is None:
+            return None
+        allowed = self.connector_constraints.allowed_connectors
+        return None if allowed is None else set(allowed)
@@ -1,7 +1,9 @@
 """Provider registry with cost-aware selection and fallback routing."""
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -20,7 +22,12 @@ class ProviderCost:
 
 @dataclass
 class ProviderEntry:
-    """A registered provider with its cost metadata and priority."""
+    """A registered provider with its cost metadata and priority.
+
+    ``chat_semaphore`` and ``embedding_semaphore`` optionally bound the number
+    of in-flight calls per operation so that large embedding batches cannot
+    starve chat traffic routed to the same provider.  ``None`` means unbounded.
+    """
 
     name: str
     provider: ChatProvider
@@ -28,6 +35,17 @@ class ProviderEntry:
     capabilities: ProviderCapabilities = field(default_factory=ProviderCapabilities)
     priority: int = 0
     enabled: bool = True
+    chat_semaphore: asyncio.Semaphore | None = None
+    embedding_semaphore: asyncio.Semaphore | None = None
+
+
+@asynccontextmanager
+async def _bounded(semaphore: asyncio.Semaphore | None) -> AsyncIterator[None]:
+    if semaphore is None:
+        yield
+        return
+    async with semaphore:
+        yield
 
 
 class ProviderRegistry:
@@ -176,7 +194,8 @@ async def route_with_fallback(
     for entry in chain:
         attempts.append(entry.name)
         try:
-            result = await entry.provider.chat(model, messages, max_tokens)
+            async with _bounded(entry.chat_semaphore):
+                result = await entry.provider.chat(model, messages, max_tokens)
             logger.info(
                 "provider_routed",
                 extra={
@@ -237,7 +256,8 @@ async def route_embeddings_with_fallback(
     for entry in chain:
         attempts.append(entry.name)
         try:
-            result = await entry.provider.embeddings(model, inputs)
+            async with _bounded(entry.embedding_semaphore):
+                result = await entry.provider.embeddings(model, inputs)
             return ProviderRoutingResult(
                 provider_name=entry.name,
                 result=result,
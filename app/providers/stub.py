@@ -143,10 +143,19 @@ class StubProvider:
 
     async def embeddings(self, model: str, inputs: list[str]) -> dict[str, object]:
         self._maybe_raise_provider_error(model)
+        # Embed each distinct text once and scatter the vectors back by position;
+        # repeated boilerplate inputs are common in ingest batches.
+        positions: dict[str, int] = {}
+        order = [positions.setdefault(text, len(positions)) for text in inputs]
+        if len(positions) == len(inputs):
+            vectors = self._embedding_generator.embed_texts(inputs)
+        else:
+            unique_vectors = self._embedding_generator.embed_texts(list(positions))
+            vectors = [unique_vectors[slot] for slot in order]
+
         data: list[dict[str, object]] = []
         prompt_tokens = 0
-        for index, text in enumerate(inputs):
-            vector = self._embedding_generator.embed_texts([text])[0]
+        for index, (text, vector) in enumerate(zip(inputs, vectors, strict=True)):
             prompt_tokens += max(len(text.split()), 1)
             data.append(
                 {
@@ -1,11 +1,30 @@
-"""Connector implementations for retrieval backends."""
+"""Connector implementations for retrieval backends.
 
-from app.rag.connectors.confluence import ConfluenceConnector
-from app.rag.connectors.filesystem import FilesystemConnector
-from app.rag.connectors.jira import JiraConnector
-from app.rag.connectors.postgres import PostgresPgvectorConnector
-from app.rag.connectors.s3 import S3Connector
-from app.rag.connectors.sharepoint import SharePointConnector
+Connectors are resolved lazily (PEP 562) so importing this package does not pull
+in every backend's client library at process start.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.rag.connectors.confluence import ConfluenceConnector
+    from app.rag.connectors.filesystem import FilesystemConnector
+    from app.rag.connectors.jira import JiraConnector
+    from app.rag.connectors.postgres import PostgresPgvectorConnector
+    from app.rag.connectors.s3 import S3Connector
+    from app.rag.connectors.sharepoint import SharePointConnector
+
+_LAZY_CONNECTORS = {
+    "ConfluenceConnector": "app.rag.connectors.confluence",
+    "FilesystemConnector": "app.rag.connectors.filesystem",
+    "JiraConnector": "app.rag.connectors.jira",
+    "PostgresPgvectorConnector": "app.rag.connectors.postgres",
+    "S3Connector": "app.rag.connectors.s3",
+    "SharePointConnector": "app.rag.connectors.sharepoint",
+}
 
 __all__ = [
     "ConfluenceConnector",
@@ -15,3 +34,16 @@ __all__ = [
     "S3Connector",
     "SharePointConnector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CONNECTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
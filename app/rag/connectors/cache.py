@@ -0,0 +1,137 @@
+"""Size-bounded caches used by the remote connectors."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+
+logger = logging.getLogger("srg.rag")
+
+REFRESH_WORKERS = 4
+MAX_STALE_TTL_MULTIPLIER = 10.0
+
+# Shared by every cache so a burst of expired keys queues behind a few threads
+# instead of starting one thread per key.
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=REFRESH_WORKERS, thread_name_prefix="srg-cache-refresh"
+)
+
+
+class StaleWhileRevalidateCache[V]:
+    """LRU cache whose expired entries are served while a refresh runs.
+
+    Once an entry is older than ``ttl_seconds`` it is still returned, and a
+    single refresh per key is queued on a shared executor. Entries older than
+    ``max_stale_seconds`` (ten TTLs by default) are no longer served; the read
+    blocks and reloads instead. A refresh or reload returning ``None`` drops the
+    entry, and the least recently used entry is evicted once ``max_entries`` is
+    exceeded. A ``ttl_seconds`` of zero disables caching.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        max_stale_seconds: float | None = None,
+    ):
+        self._ttl_seconds = max(ttl_seconds, 0.0)
+        self._max_entries = max(max_entries, 1)
+        if max_stale_seconds is None:
+            max_stale_seconds = self._ttl_seconds * MAX_STALE_TTL_MULTIPLIER
+        self._max_stale_seconds = max(max_stale_seconds, self._ttl_seconds)
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: str, loader: Callable[[], V | None]) -> V | None:
+        if self._ttl_seconds <= 0:
+            return loader()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                loaded_at, cached = entry
+                age = monotonic() - loaded_at
+                if age < self._max_stale_seconds:
+                    self._entries.move_to_end(key)
+                    if age >= self._ttl_seconds and key not in self._refreshing:
+                        self._refreshing.add(key)
+                        _refresh_executor.submit(self._refresh, key, loader)
+                    return cached
+
+        return self._load(key, loader)
+
+    def _refresh(self, key: str, loader: Callable[[], V | None]) -> None:
+        try:
+            self._load(key, loader)
+        except Exception:
+            # Keep serving the stale entry; the next expired read retries.
+            logger.exception("connector_cache_refresh_failed", extra={"cache_key": key})
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _load(self, key: str, loader: Callable[[], V | None]) -> V | None:
+        value = loader()
+        if value is None:
+            with self._lock:
+                self._entries.pop(key, None)
+        else:
+            self._store(key, value)
+        return value
+
+    def _store(self, key: str, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LRUTTLCache[V]:
+    """LRU cache whose entries expire after ``ttl_seconds``.
+
+    Expired entries are dropped when read, and the least recently used entry is
+    evicted once ``max_entries`` is exceeded. A ``ttl_seconds`` of zero disables
+    caching.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 512):
+        self._ttl_seconds = max(ttl_seconds, 0.0)
+        self._max_entries = max(max_entries, 1)
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if (monotonic() - entry[0]) >= self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, value: V) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import base64
+import heapq
 import html
 import re
+from collections.abc import Iterator
+from operator import itemgetter
 from time import monotonic
 from typing import Any
 
@@ -42,12 +45,36 @@ class ConfluenceConnector:
         if k < 1:
             return []
 
-        records = self._search_records(query)
-        query_tokens = self._tokens(query)
-        ranked: list[DocumentChunk] = []
+        scored = self._iter_scored(self._search_records(query), self._tokens(query), filters)
+
+        # Only the top-k survivors are materialized as DocumentChunk objects.
+        return [
+            DocumentChunk(
+                source_id=source_id,
+                connector=self._connector_name,
+                uri=uri,
+                chunk_id=f"{source_id}#0",
+                text=text,
+                score=score,
+                metadata=metadata,
+            )
+            for score, source_id, uri, text, metadata in heapq.nlargest(
+                k, scored, key=itemgetter(0)
+            )
+        ]
 
+    def _iter_scored(
+        self,
+        records: list[dict[str, Any]],
+        query_tokens: set[str],
+        filters: dict[str, str],
+    ) -> Iterator[tuple[float, str, str, str, dict[str, str]]]:
+        # Filtering and scoring run in one lazy pass that feeds heapq.nlargest
+        # directly, so no intermediate candidate list is built.
         for record in records:
-            metadata = self._parse_metadata(record.get("metadata"))
+            # Search records are normalized once in _parse_search_result, so the
+            # metadata values are already strings and can be used as-is.
+            metadata: dict[str, str] = record["metadata"]
             if not self._space_allowed(metadata):
                 continue
             if not self._matches_filters(metadata, filters):
@@ -57,28 +84,14 @@ class ConfluenceConnector:
             if not text:
                 continue
 
-            overlap = len(query_tokens.intersection(self._tokens(text)))
-            score = overlap / len(query_tokens) if query_tokens else 0.0
-
             source_id = str(record.get("source_id", "")).strip()
             uri = str(record.get("uri", "")).strip()
             if source_id == "" or uri == "":
                 continue
 
-            ranked.append(
-                DocumentChunk(
-                    source_id=source_id,
-                    connector=self._connector_name,
-                    uri=uri,
-                    chunk_id=f"{source_id}#0",
-                    text=text,
-                    score=round(score, 6),
-                    metadata=metadata,
-                )
-            )
-
-        ranked.sort(key=lambda item: item.score, reverse=True)
-        return ranked[:k]
+            overlap = len(query_tokens.intersection(self._tokens(text)))
+            score = overlap / len(query_tokens) if query_tokens else 0.0
+            yield (round(score, 6), source_id, uri, text, metadata)
 
     def fetch(self, doc_id: str) -> Document | None:
         cached = self._document_cache.get(doc_id)
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import base64
+import heapq
 import html
 import re
-from time import monotonic
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from typing import Any
 
 import httpx
 
+from app.rag.connectors.cache import StaleWhileRevalidateCache
+from app.rag.connectors.scoring import overlap_count, token_hashes
 from app.rag.types import Document, DocumentChunk
 
-TOKEN_SPLIT_RE = re.compile(r"\W+")
+# findall over word runs yields the same tokens as splitting on \W+ without the
+# empty strings that split produces at the edges.
+TOKEN_FINDALL = re.compile(r"\w+").findall
 TAG_RE = re.compile(r"<[^>]+>")
+SEARCH_PAGE_SIZE = 50
+MAX_PAGE_WORKERS = 8
 
 
 class JiraConnector:
@@ -25,19 +35,39 @@ class JiraConnector:
         cache_ttl_seconds: float = 60.0,
         timeout_s: float = 10.0,
         http_client: Any | None = None,
+        cache_max_entries: int = 256,
     ):
         self._base_url = base_url.rstrip("/")
+        self._issue_uri_prefix = f"{self._base_url}/browse/"
         self._connector_name = connector_name
         self._project_keys = {
             key.strip().upper() for key in (project_keys or set()) if key.strip()
         }
         self._cache_ttl_seconds = max(cache_ttl_seconds, 0.0)
+        # Restricting the JQL to the allowed projects keeps Jira from returning
+        # (and paginating through) issues that would be dropped client-side.
+        self._project_jql = ""
+        if self._project_keys:
+            quoted = ",".join(
+                '"' + key.replace('"', '\\"') + '"' for key in sorted(self._project_keys)
+            )
+            self._project_jql = f" AND project in ({quoted})"
 
         self._headers = self._build_headers(email=email, api_token=api_token)
-        self._http = http_client or httpx.Client(timeout=timeout_s)
-
-        self._search_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
-        self._document_cache: dict[str, tuple[float, Document]] = {}
+        # An owned client carries the auth headers itself so they are not merged
+        # into every request; injected clients still get them per request.
+        self._request_headers: dict[str, str] | None = self._headers
+        if http_client is None:
+            http_client = httpx.Client(timeout=timeout_s, headers=self._headers)
+            self._request_headers = None
+        self._http = http_client
+
+        self._search_cache: StaleWhileRevalidateCache[list[dict[str, Any]]] = (
+            StaleWhileRevalidateCache(self._cache_ttl_seconds, cache_max_entries)
+        )
+        self._document_cache: StaleWhileRevalidateCache[Document] = StaleWhileRevalidateCache(
+            self._cache_ttl_seconds, cache_max_entries
+        )
 
     def search(self, query: str, filters: dict[str, str], k: int) -> list[DocumentChunk]:
         if k < 1:
@@ -45,13 +75,17 @@ class JiraConnector:
 
         records = self._search_records(query)
         query_tokens = self._tokens(query)
-        ranked: list[DocumentChunk] = []
+        query_hashes = token_hashes(query_tokens)
+        # Filters are snapshotted once; with no filters (the common case) the
+        # per-record check is skipped entirely.
+        filter_items = tuple(filters.items())
+        scored: list[tuple[float, str, str, str, dict[str, str]]] = []
 
         for record in records:
             metadata = self._parse_metadata(record.get("metadata"))
             if not self._project_allowed(metadata):
                 continue
-            if not self._matches_filters(metadata, filters):
+            if filter_items and not self._matches_filters(metadata, filter_items):
                 continue
 
             text = str(record.get("text", "")).strip()
@@ -63,30 +97,33 @@ class JiraConnector:
             if source_id == "" or uri == "":
                 continue
 
-            overlap = len(query_tokens.intersection(self._tokens(text)))
+            record_hashes = record.get("_token_hashes")
+            if record_hashes is None:
+                record_hashes = token_hashes(self._tokens(text))
+            overlap = overlap_count(query_hashes, record_hashes)
             score = overlap / len(query_tokens) if query_tokens else 0.0
-
-            ranked.append(
-                DocumentChunk(
-                    source_id=source_id,
-                    connector=self._connector_name,
-                    uri=uri,
-                    chunk_id=f"{source_id}#0",
-                    text=text,
-                    score=round(score, 6),
-                    metadata=metadata,
-                )
+            scored.append((round(score, 6), source_id, uri, text, metadata))
+
+        # Only the top-k survivors are materialized as DocumentChunk objects.
+        return [
+            DocumentChunk(
+                source_id=source_id,
+                connector=self._connector_name,
+                uri=uri,
+                chunk_id=f"{source_id}#0",
+                text=text,
+                score=score,
+                metadata=metadata,
             )
-
-        ranked.sort(key=lambda item: item.score, reverse=True)
-        return ranked[:k]
+            for score, source_id, uri, text, metadata in heapq.nlargest(
+                k, scored, key=itemgetter(0)
+            )
+        ]
 
     def fetch(self, doc_id: str) -> Document | None:
-        cached = self._document_cache.get(doc_id)
-        now = monotonic()
-        if cached is not None and (now - cached[0]) < self._cache_ttl_seconds:
-            return cached[1]
+        return self._document_cache.get_or_load(doc_id, partial(self._load_document, doc_id))
 
+    def _load_document(self, doc_id: str) -> Document | None:
         issue = self._fetch_issue(doc_id)
         if issue is None:
             return None
@@ -100,37 +137,46 @@ class JiraConnector:
         if uri == "" or text == "":
             return None
 
-        document = Document(source_id=doc_id, uri=uri, text=text, metadata=metadata)
-        self._document_cache[doc_id] = (now, document)
-        return document
+        return Document(source_id=doc_id, uri=uri, text=text, metadata=metadata)
 
     def _search_records(self, query: str) -> list[dict[str, Any]]:
-        cache_key = query.strip().lower()
-        cached = self._search_cache.get(cache_key)
-        now = monotonic()
-        if cached is not None and (now - cached[0]) < self._cache_ttl_seconds:
-            return cached[1]
+        records = self._search_cache.get_or_load(
+            query.strip().lower(), partial(self._load_search_records, query)
+        )
+        return records if records is not None else []
 
+    def _load_search_records(self, query: str) -> list[dict[str, Any]]:
         records = self._fetch_search_records(query)
-        self._search_cache[cache_key] = (now, records)
+        for record in records:
+            # Token hashes are computed once per cached record and reused by
+            # every search that hits the cache entry.
+            record["_token_hashes"] = token_hashes(self._tokens(str(record.get("text", ""))))
         return records
 
     def _fetch_search_records(self, query: str) -> list[dict[str, Any]]:
-        issues: list[dict[str, Any]] = []
-        start_at = 0
-        max_results = 50
         escaped = query.replace('"', "\\\"")
+        jql = f'text ~ "\\"{escaped}\\""{self._project_jql}'
+
+        first_page = self._search_page(jql, 0)
+        pages: Iterable[dict[str, Any]] = [first_page]
+        total = first_page.get("total")
+        first_rows = first_page.get("issues")
+        if (
+            isinstance(total, int)
+            and isinstance(first_rows, list)
+            and len(first_rows) == SEARCH_PAGE_SIZE
+            and total > SEARCH_PAGE_SIZE
+        ):
+            # Jira reports the total hit count up front, so the remaining pages
+            # are requested concurrently; map() keeps them in startAt order.
+            offsets = range(SEARCH_PAGE_SIZE, total, SEARCH_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(offsets))) as pool:
+                pages = [first_page, *pool.map(partial(self._search_page, jql), offsets)]
+        else:
+            pages = self._iter_search_pages(jql, first_page)
 
-        while True:
-            payload = self._get_json(
-                "/rest/api/3/search",
-                {
-                    "jql": f'text ~ "\\"{escaped}\\""',
-                    "startAt": start_at,
-                    "maxResults": max_results,
-                    "fields": "summary,description,project,issuetype,updated",
-                },
-            )
+        issues: list[dict[str, Any]] = []
+        for payload in pages:
             rows = payload.get("issues")
             if not isinstance(rows, list) or len(rows) == 0:
                 break
@@ -141,50 +187,34 @@ class JiraConnector:
                     if parsed is not None:
                         issues.append(parsed)
 
-            if len(rows) < max_results:
+            if len(rows) < SEARCH_PAGE_SIZE:
                 break
-            start_at += max_results
 
         return issues
 
-    def _parse_issue_record(self, row: dict[str, Any]) -> dict[str, Any] | None:
-        issue_id = str(row.get("id", "")).strip()
-        issue_key = str(row.get("key", "")).strip()
-        if issue_id == "":
-            return None
-
-        fields = row.get("fields")
-        if not isinstance(fields, dict):
-            fields = {}
-
-        summary = str(fields.get("summary", "")).strip()
-        description = self._extract_description(fields.get("description"))
-        text = " ".join(part for part in [summary, description] if part).strip()
-
-        project_key = ""
-        project = fields.get("project")
-        if isinstance(project, dict):
-            project_key = str(project.get("key", "")).strip().upper()
-
-        issue_type = ""
-        issue_type_payload = fields.get("issuetype")
-        if isinstance(issue_type_payload, dict):
-            issue_type = str(issue_type_payload.get("name", "")).strip()
-
-        updated = str(fields.get("updated", "")).strip()
+    def _iter_search_pages(
+        self, jql: str, first_page: dict[str, Any]
+    ) -> Iterator[dict[str, Any]]:
+        payload = first_page
+        start_at = 0
+        while True:
+            yield payload
+            start_at += SEARCH_PAGE_SIZE
+            payload = self._search_page(jql, start_at)
 
-        return {
-            "source_id": issue_id,
-            "uri": self._issue_uri(issue_key),
-            "text": text,
-            "metadata": {
-                "key": issue_key,
-                "project": project_key,
-                "type": issue_type,
-                "summary": summary,
-                "updated": updated,
+    def _search_page(self, jql: str, start_at: int) -> dict[str, Any]:
+        return self._get_json(
+            "/rest/api/3/search",
+            {
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": SEARCH_PAGE_SIZE,
+                "fields": "summary,description,project,issuetype,updated",
             },
-        }
+        )
+
+    def _parse_issue_record(self, row: dict[str, Any]) -> dict[str, Any] | None:
+        return self._build_issue_record(row, text_separator=" ")
 
     def _fetch_issue(self, doc_id: str) -> dict[str, Any] | None:
         payload = self._get_json(
@@ -193,33 +223,36 @@ class JiraConnector:
                 "fields": "summary,description,project,issuetype,updated,key",
             },
         )
+        record = self._build_issue_record(payload, text_separator="\n")
+        if record is None or record["text"] == "":
+            return None
+        return record
 
-        issue_id = str(payload.get("id", "")).strip()
-        issue_key = str(payload.get("key", "")).strip()
+    def _build_issue_record(
+        self, row: dict[str, Any], text_separator: str
+    ) -> dict[str, Any] | None:
+        issue_id = self._str_field(row, "id")
         if issue_id == "":
             return None
+        issue_key = self._str_field(row, "key")
 
-        fields = payload.get("fields")
+        fields = row.get("fields")
         if not isinstance(fields, dict):
             fields = {}
 
-        summary = str(fields.get("summary", "")).strip()
+        summary = self._str_field(fields, "summary")
         description = self._extract_description(fields.get("description"))
-        text = "\n".join(part for part in [summary, description] if part).strip()
-        if text == "":
-            return None
+        text = text_separator.join(part for part in (summary, description) if part).strip()
 
-        project_key = ""
         project = fields.get("project")
-        if isinstance(project, dict):
-            project_key = str(project.get("key", "")).strip().upper()
+        project_key = self._str_field(project, "key").upper() if isinstance(project, dict) else ""
 
-        issue_type = ""
         issue_type_payload = fields.get("issuetype")
-        if isinstance(issue_type_payload, dict):
-            issue_type = str(issue_type_payload.get("name", "")).strip()
-
-        updated = str(fields.get("updated", "")).strip()
+        issue_type = (
+            self._str_field(issue_type_payload, "name")
+            if isinstance(issue_type_payload, dict)
+            else ""
+        )
 
         return {
             "source_id": issue_id,
@@ -230,7 +263,7 @@ class JiraConnector:
                 "project": project_key,
                 "type": issue_type,
                 "summary": summary,
-                "updated": updated,
+                "updated": self._str_field(fields, "updated"),
             },
         }
 
@@ -243,7 +276,7 @@ class JiraConnector:
         response = self._http.get(
             f"{self._base_url}{path}",
             params=query_params,
-            headers=self._headers,
+            headers=self._request_headers,
         )
         if int(response.status_code) >= 400:
             raise RuntimeError(f"Jira API returned {response.status_code}: {response.text[:200]}")
@@ -263,7 +296,7 @@ class JiraConnector:
         key = issue_key.strip()
         if key == "":
             return self._base_url
-        return f"{self._base_url}/browse/{key}"
+        return self._issue_uri_prefix + key
 
     @staticmethod
     def _build_headers(email: str, api_token: str) -> dict[str, str]:
@@ -274,9 +307,12 @@ class JiraConnector:
         }
 
     @staticmethod
-    def _matches_filters(metadata: dict[str, str], filters: dict[str, str]) -> bool:
-        for key, expected in filters.items():
-            if metadata.get(key) != expected:
+    def _matches_filters(
+        metadata: dict[str, str], filter_items: tuple[tuple[str, str], ...]
+    ) -> bool:
+        get = metadata.get
+        for key, expected in filter_items:
+            if get(key) != expected:
                 return False
         return True
 
@@ -286,9 +322,18 @@ class JiraConnector:
             return {}
         return {str(key): str(value) for key, value in raw.items()}
 
+    @staticmethod
+    def _str_field(mapping: dict[str, Any], key: str) -> str:
+        value = mapping.get(key)
+        if isinstance(value, str):
+            return value.strip()
+        if value is None:
+            return ""
+        return str(value).strip()
+
     @staticmethod
     def _tokens(text: str) -> set[str]:
-        return {token for token in TOKEN_SPLIT_RE.split(text.lower()) if token}
+        return set(TOKEN_FINDALL(text.lower()))
 
     @staticmethod
     def _extract_description(value: object) -> str:
@@ -296,18 +341,19 @@ class JiraConnector:
             plain = html.unescape(TAG_RE.sub(" ", value))
             return " ".join(plain.split()).strip()
 
+        # Iterative pre-order walk over the ADF tree; children are pushed in
+        # reverse so text comes out in document order without recursion.
         texts: list[str] = []
-
-        def walk(node: object) -> None:
+        append = texts.append
+        stack: list[object] = [value]
+        while stack:
+            node = stack.pop()
             if isinstance(node, dict):
                 maybe_text = node.get("text")
                 if isinstance(maybe_text, str):
-                    texts.append(maybe_text)
-                for child in node.values():
-                    walk(child)
+                    append(maybe_text)
+                stack.extend(reversed(node.values()))
             elif isinstance(node, list):
-                for child in node:
-                    walk(child)
+                stack.extend(reversed(node))
 
-        walk(value)
         return " ".join(part.strip() for part in texts if part.strip())
@@ -0,0 +1,52 @@
+"""psycopg adapters for sending query vectors to pgvector."""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+from psycopg import Connection
+from psycopg.adapt import Dumper
+from psycopg.pq import Format
+from psycopg.types import TypeInfo
+
+from app.rag.embeddings import vector_literal
+
+
+@dataclass(frozen=True, slots=True)
+class PgVector:
+    values: list[float]
+
+
+class PgVectorTextDumper(Dumper):
+    format = Format.TEXT
+
+    def dump(self, obj: Any) -> bytes:
+        return vector_literal(obj.values).encode("ascii")
+
+
+class PgVectorBinaryDumper(Dumper):
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> bytes:
+        # pgvector's binary input: uint16 dimensions, uint16 unused, float4[] (big endian).
+        values = obj.values
+        return struct.pack(f">HH{len(values)}f", len(values), 0, *values)
+
+
+def register_vector_dumpers(conn: Connection[Any]) -> bool:
+    """Register PgVector dumpers on ``conn``; return True when binary is enabled.
+
+    The text dumper is always available so queries still work before the
+    ``vector`` extension exists; the binary dumper needs the type's OID.
+    """
+    conn.adapters.register_dumper(PgVector, PgVectorTextDumper)
+    info = TypeInfo.fetch(conn, "vector")
+    if info is None:
+        return False
+    binary_dumper = type(
+        "PgVectorBinaryDumper", (PgVectorBinaryDumper,), {"oid": info.oid}
+    )
+    conn.adapters.register_dumper(PgVector, binary_dumper)
+    return True
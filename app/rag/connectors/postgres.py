@@ -1,17 +1,32 @@
+import importlib
 import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, cast
 
-from app.rag.embeddings import EmbeddingGenerator, HashEmbeddingGenerator, vector_literal
+from app.rag.embeddings import EmbeddingGenerator, HashEmbeddingGenerator
 from app.rag.types import Document, DocumentChunk
 
 try:
     import psycopg
     from psycopg.rows import dict_row
+
+    from app.rag.connectors import pgvector_types
 except ImportError:  # pragma: no cover - import guard
     psycopg = cast(Any, None)
     dict_row = cast(Any, None)
+    pgvector_types = cast(Any, None)
+
+psycopg_pool: Any | None
+try:  # pragma: no cover - optional dependency
+    psycopg_pool = importlib.import_module("psycopg_pool")
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    psycopg_pool = None
 
 TABLE_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+SERVER_CURSOR_MIN_ROWS = 500
+SERVER_CURSOR_ITERSIZE = 256
 
 
 class PostgresPgvectorConnector:
@@ -22,6 +37,7 @@ class PostgresPgvectorConnector:
         embedding_dim: int = 16,
         connector_name: str = "postgres",
         embedding_generator: EmbeddingGenerator | None = None,
+        pool_max_size: int = 4,
     ):
         if psycopg is None or dict_row is None:
             raise RuntimeError("psycopg is required for Postgres connector")
@@ -34,6 +50,23 @@ class PostgresPgvectorConnector:
         self._connector_name = connector_name
         self._embedding_generator = embedding_generator or HashEmbeddingGenerator(embedding_dim)
 
+        # Query connections are reused across calls instead of paying a full
+        # connect/TLS/auth handshake per search. psycopg_pool is used when it is
+        # installed; otherwise a single lazily opened connection is shared.
+        self._pool: Any | None = None
+        if psycopg_pool is not None:
+            self._pool = psycopg_pool.ConnectionPool(
+                dsn,
+                min_size=1,
+                max_size=max(pool_max_size, 1),
+                kwargs={"row_factory": dict_row, "autocommit": True},
+                configure=pgvector_types.register_vector_dumpers,
+                open=False,
+            )
+        self._pool_opened = False
+        self._conn: Any | None = None
+        self._conn_lock = threading.Lock()
+
     def search(self, query: str, filters: dict[str, str], k: int) -> list[DocumentChunk]:
         if k < 1:
             return []
@@ -44,13 +77,18 @@ class PostgresPgvectorConnector:
                 f"embedding dimension mismatch for query vector: expected "
                 f"{self._embedding_dim}, got {len(query_vector_values)}"
             )
-        query_vector = vector_literal(query_vector_values)
+        # Sent in pgvector's binary format once the connection knows the type's
+        # OID, avoiding a text literal the server has to parse on every query.
+        query_vector = pgvector_types.PgVector(query_vector_values)
         where_clauses: list[str] = []
-        params: list[Any] = []
+        # Named placeholders let the query vector appear in both the score and
+        # the ORDER BY while being bound (and sent) as a single $1 parameter.
+        params: dict[str, Any] = {"query_vector": query_vector, "limit": k}
 
-        for key, value in sorted(filters.items()):
-            where_clauses.append("metadata ->> %s = %s")
-            params.extend([key, value])
+        for index, (key, value) in enumerate(sorted(filters.items())):
+            where_clauses.append(f"metadata ->> %(filter_key_{index})s = %(filter_value_{index})s")
+            params[f"filter_key_{index}"] = key
+            params[f"filter_value_{index}"] = value
 
         where_sql = ""
         if where_clauses:
@@ -58,35 +96,36 @@ class PostgresPgvectorConnector:
 
         sql = (
             f"SELECT source_id, uri, chunk_id, text, metadata, "
-            f"1 - (embedding <=> %s::vector) AS score "
+            f"1 - (embedding <=> %(query_vector)s::vector) AS score "
             f"FROM {self._table} "
             f"{where_sql} "
-            f"ORDER BY embedding <=> %s::vector "
-            f"LIMIT %s"
+            f"ORDER BY embedding <=> %(query_vector)s::vector "
+            f"LIMIT %(limit)s"
         )
 
-        rows: list[dict[str, Any]]
-        with psycopg.connect(self._dsn, row_factory=dict_row) as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(sql, [query_vector, *params, query_vector, k])
-                rows = list(cursor.fetchall())
+        with self._connection() as conn:
+            if k >= SERVER_CURSOR_MIN_ROWS:
+                # Large result sets stream through a server-side cursor so rows
+                # are turned into chunks as they arrive, not after fetchall().
+                with conn.transaction(), conn.cursor(name="rag_search") as cursor:
+                    cursor.itersize = SERVER_CURSOR_ITERSIZE
+                    cursor.execute(sql, params)
+                    return [self._row_to_chunk(row) for row in cursor]
 
-        chunks: list[DocumentChunk] = []
-        for row in rows:
-            metadata = self._parse_metadata(row.get("metadata"))
-            score = float(row.get("score", 0.0))
-            chunks.append(
-                DocumentChunk(
-                    source_id=str(row.get("source_id", "")),
-                    connector=self._connector_name,
-                    uri=str(row.get("uri", "")),
-                    chunk_id=str(row.get("chunk_id", "")),
-                    text=str(row.get("text", "")),
-                    score=round(score, 6),
-                    metadata=metadata,
-                )
-            )
-        return chunks
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params, prepare=True)
+                return [self._row_to_chunk(row) for row in cursor.fetchall()]
+
+    def _row_to_chunk(self, row: dict[str, Any]) -> DocumentChunk:
+        return DocumentChunk(
+            source_id=str(row.get("source_id", "")),
+            connector=self._connector_name,
+            uri=str(row.get("uri", "")),
+            chunk_id=str(row.get("chunk_id", "")),
+            text=str(row.get("text", "")),
+            score=round(float(row.get("score", 0.0)), 6),
+            metadata=self._parse_metadata(row.get("metadata")),
+        )
 
     def fetch(self, doc_id: str) -> Document | None:
         sql = (
@@ -97,9 +136,9 @@ class PostgresPgvectorConnector:
         )
 
         rows: list[dict[str, Any]]
-        with psycopg.connect(self._dsn, row_factory=dict_row) as conn:
+        with self._connection() as conn:
             with conn.cursor() as cursor:
-                cursor.execute(sql, [doc_id])
+                cursor.execute(sql, [doc_id], prepare=True)
                 rows = list(cursor.fetchall())
 
         if not rows:
@@ -133,6 +172,39 @@ class PostgresPgvectorConnector:
                 cursor.execute(ddl)
             conn.commit()
 
+    def close(self) -> None:
+        """Release pooled connections and the embedding generator's client."""
+        with self._conn_lock:
+            if self._pool is not None and self._pool_opened:
+                self._pool.close()
+                self._pool_opened = False
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        close_generator = getattr(self._embedding_generator, "close", None)
+        if callable(close_generator):
+            close_generator()
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        if self._pool is not None:
+            if not self._pool_opened:
+                with self._conn_lock:
+                    if not self._pool_opened:
+                        self._pool.open()
+                        self._pool_opened = True
+            with self._pool.connection() as conn:
+                yield conn
+            return
+
+        with self._conn_lock:
+            conn = self._conn
+            if conn is None or conn.closed or conn.broken:
+                conn = psycopg.connect(self._dsn, row_factory=dict_row, autocommit=True)
+                pgvector_types.register_vector_dumpers(conn)
+                self._conn = conn
+            yield conn
+
     @staticmethod
     def _parse_metadata(raw: Any) -> dict[str, str]:
         if not isinstance(raw, dict):
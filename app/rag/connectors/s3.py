@@ -1,12 +1,25 @@
+import heapq
 import importlib
 import json
+import logging
 import re
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from time import monotonic
 from typing import Any
 
+from app.rag.connectors.scoring import overlap_count, token_hashes
 from app.rag.types import Document, DocumentChunk
 
-TOKEN_SPLIT_RE = re.compile(r"\W+")
+# findall over word runs yields the same tokens as splitting on \W+ without the
+# empty strings that split produces at the edges.
+TOKEN_FINDALL = re.compile(r"\w+").findall
+STREAM_CHUNK_SIZE = 65536
+MAX_FETCH_WORKERS = 16
+
+logger = logging.getLogger("srg.rag")
 
 boto3: Any | None
 try:  # pragma: no cover - optional dependency
@@ -44,50 +57,61 @@ class S3Connector:
         self._s3 = s3_client
         self._cache_ttl_seconds = max(cache_ttl_seconds, 0.0)
         self._cache_records: list[dict[str, Any]] | None = None
+        self._cache_by_source: dict[str, list[dict[str, Any]]] = {}
         self._cache_loaded_at = 0.0
+        self._refreshing = False
+        self._refresh_lock = threading.Lock()
 
     def search(self, query: str, filters: dict[str, str], k: int) -> list[DocumentChunk]:
         if k < 1:
             return []
 
         query_tokens = self._tokens(query)
+        query_hashes = token_hashes(query_tokens)
         records = self._load_records()
 
-        ranked: list[DocumentChunk] = []
+        # Filters are snapshotted once; with no filters (the common case) the
+        # per-record check is skipped entirely.
+        filter_items = tuple(filters.items())
+        scored: list[tuple[int, dict[str, Any], str, dict[str, str]]] = []
         for record in records:
-            metadata = self._parse_metadata(record.get("metadata"))
-            if not self._matches_filters(metadata, filters):
+            metadata = record.get("_metadata")
+            if metadata is None:
+                metadata = self._parse_metadata(record.get("metadata"))
+            if filter_items and not self._matches_filters(metadata, filter_items):
                 continue
 
             chunk_text = str(record.get("text", "")).strip()
             if not chunk_text:
                 continue
 
-            chunk_tokens = self._tokens(chunk_text)
-            overlap = len(query_tokens.intersection(chunk_tokens))
-            score = overlap / len(query_tokens) if query_tokens else 0.0
-
-            ranked.append(
-                DocumentChunk(
-                    source_id=str(record.get("source_id", "")),
-                    connector=self._connector_name,
-                    uri=str(record.get("uri", "")),
-                    chunk_id=str(record.get("chunk_id", "")),
-                    text=chunk_text,
-                    score=round(score, 6),
-                    metadata=metadata,
-                )
+            chunk_hashes = record.get("_token_hashes")
+            if chunk_hashes is None:
+                chunk_hashes = token_hashes(self._tokens(chunk_text))
+            scored.append((overlap_count(query_hashes, chunk_hashes), record, chunk_text, metadata))
+
+        # Every score shares the query-token denominator, so ranking by the raw
+        # overlap count is equivalent; the float score is only computed (and
+        # rounded) for the top-k survivors materialized as DocumentChunk objects.
+        query_size = len(query_tokens)
+        return [
+            DocumentChunk(
+                source_id=str(record.get("source_id", "")),
+                connector=self._connector_name,
+                uri=str(record.get("uri", "")),
+                chunk_id=str(record.get("chunk_id", "")),
+                text=chunk_text,
+                score=round(overlap / query_size, 6) if query_size else 0.0,
+                metadata=metadata,
             )
-
-        ranked.sort(key=lambda item: item.score, reverse=True)
-        return ranked[:k]
+            for overlap, record, chunk_text, metadata in heapq.nlargest(
+                k, scored, key=itemgetter(0)
+            )
+        ]
 
     def fetch(self, doc_id: str) -> Document | None:
-        rows = [
-            entry
-            for entry in self._load_records()
-            if str(entry.get("source_id", "")) == doc_id
-        ]
+        self._load_records()
+        rows = self._cache_by_source.get(doc_id)
         if not rows:
             return None
 
@@ -101,33 +125,74 @@ class S3Connector:
         )
 
     def _load_records(self) -> list[dict[str, Any]]:
-        now = monotonic()
-        if (
-            self._cache_records is not None
-            and self._cache_ttl_seconds > 0
-            and (now - self._cache_loaded_at) < self._cache_ttl_seconds
-        ):
-            return self._cache_records
+        cached = self._cache_records
+        if cached is not None and self._cache_ttl_seconds > 0:
+            # An expired index keeps being served while one background thread
+            # reloads it, so searches never block on a full S3 refetch.
+            if (monotonic() - self._cache_loaded_at) >= self._cache_ttl_seconds:
+                self._schedule_refresh()
+            return cached
+
+        self._reload_cache()
+        return self._cache_records if self._cache_records is not None else []
+
+    def _schedule_refresh(self) -> None:
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self._reload_cache()
+        except Exception:
+            # Keep the last-known-good index; the next expired read retries.
+            logger.exception(
+                "s3_index_refresh_failed",
+                extra={"bucket": self._bucket, "index_key": self._index_key},
+            )
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
 
+    def _reload_cache(self) -> None:
+        now = monotonic()
         records = self._refresh_records()
         if records or self._cache_records is None:
+            by_source: dict[str, list[dict[str, Any]]] = {}
+            for record in records:
+                # Token hashes, normalized metadata and the source_id index are
+                # built once when a record enters the cache and reused by every
+                # search until the next refresh.
+                record["_token_hashes"] = token_hashes(
+                    self._tokens(str(record.get("text", "")))
+                )
+                record["_metadata"] = self._parse_metadata(record.get("metadata"))
+                by_source.setdefault(str(record.get("source_id", "")), []).append(record)
+            self._cache_by_source = by_source
             self._cache_records = records
             self._cache_loaded_at = now
-        return self._cache_records
 
     def _refresh_records(self) -> list[dict[str, Any]]:
         object_keys = self._list_index_keys()
         if not object_keys:
             return []
 
+        if len(object_keys) == 1:
+            return self._load_object_records(object_keys[0])
+
+        # Shard GETs are latency bound, so they are issued concurrently; map()
+        # keeps the results in sorted key order for a deterministic index.
         records: list[dict[str, Any]] = []
-        for object_key in object_keys:
-            text = self._read_object_text(object_key)
-            if text == "":
-                continue
-            records.extend(self._parse_jsonl_records(text))
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(object_keys))) as pool:
+            for shard_records in pool.map(self._load_object_records, object_keys):
+                records.extend(shard_records)
         return records
 
+    def _load_object_records(self, object_key: str) -> list[dict[str, Any]]:
+        return self._parse_jsonl_records(self._iter_object_lines(object_key))
+
     def _list_index_keys(self) -> list[str]:
         if not self._index_key.endswith("/"):
             return [self._index_key]
@@ -165,35 +230,52 @@ class S3Connector:
 
         return sorted(keys)
 
-    def _read_object_text(self, object_key: str) -> str:
+    def _iter_object_lines(self, object_key: str) -> Iterator[bytes]:
         try:
             response = self._s3.get_object(Bucket=self._bucket, Key=object_key)
         except Exception:
-            return ""
+            return
 
         body = response.get("Body")
         if body is None:
-            return ""
+            return
 
-        payload = body.read()
-        if isinstance(payload, (bytes, bytearray)):
-            return payload.decode("utf-8", errors="ignore")
-        return str(payload)
+        # botocore's StreamingBody yields lines as they arrive, so large index
+        # shards are parsed without first materializing the whole object.
+        iter_lines = getattr(body, "iter_lines", None)
+        if callable(iter_lines):
+            yield from iter_lines(chunk_size=STREAM_CHUNK_SIZE)
+            return
 
-    @staticmethod
-    def _parse_jsonl_records(text: str) -> list[dict[str, Any]]:
+        payload = body.read()
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        yield from bytes(payload).splitlines()
+
+    @classmethod
+    def _parse_jsonl_records(cls, lines: Iterable[bytes]) -> list[dict[str, Any]]:
+        # Each line is decoded on its own: joining lines into one JSON array is
+        # faster but can stitch two malformed lines into a single valid record.
         records: list[dict[str, Any]] = []
-        for raw_line in text.splitlines():
-            line = raw_line.strip()
-            if not line:
+        for line in lines:
+            if not line or line.isspace():
                 continue
+            item = cls._parse_jsonl_line(line)
+            if isinstance(item, dict):
+                records.append(item)
+        return records
+
+    @staticmethod
+    def _parse_jsonl_line(line: bytes) -> object:
+        try:
+            return json.loads(line)
+        except UnicodeDecodeError:
             try:
-                parsed = json.loads(line)
+                return json.loads(line.decode("utf-8", errors="ignore"))
             except json.JSONDecodeError:
-                continue
-            if isinstance(parsed, dict):
-                records.append(parsed)
-        return records
+                return None
+        except json.JSONDecodeError:
+            return None
 
     @staticmethod
     def _parse_metadata(raw: Any) -> dict[str, str]:
@@ -202,12 +284,15 @@ class S3Connector:
         return {str(key): str(value) for key, value in raw.items()}
 
     @staticmethod
-    def _matches_filters(metadata: dict[str, str], filters: dict[str, str]) -> bool:
-        for key, expected in filters.items():
-            if metadata.get(key) != expected:
+    def _matches_filters(
+        metadata: dict[str, str], filter_items: tuple[tuple[str, str], ...]
+    ) -> bool:
+        get = metadata.get
+        for key, expected in filter_items:
+            if get(key) != expected:
                 return False
         return True
 
     @staticmethod
     def _tokens(text: str) -> set[str]:
-        return {token for token in TOKEN_SPLIT_RE.split(text.lower()) if token}
+        return set(TOKEN_FINDALL(text.lower()))
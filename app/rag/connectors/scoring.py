@@ -0,0 +1,34 @@
+"""Lexical overlap helpers shared by the keyword-scored connectors."""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+
+
+def token_hashes(tokens: Iterable[str]) -> tuple[int, ...]:
+    """Return the sorted, de-duplicated hashes of ``tokens``.
+
+    Hashes are only compared within a single process, so the builtin ``hash`` is
+    sufficient and avoids keeping the token strings around per record.
+    """
+    return tuple(sorted({hash(token) for token in tokens}))
+
+
+def overlap_count(left: tuple[int, ...], right: tuple[int, ...]) -> int:
+    """Count values present in both sorted, de-duplicated hash tuples.
+
+    Walks the shorter tuple and gallops through the longer one with
+    ``bisect_left``, so the per-element work runs in C and the cost is
+    O(m log n) rather than a Python-level O(m + n) merge.
+    """
+    if len(left) > len(right):
+        left, right = right, left
+    right_len = len(right)
+    count = lo = 0
+    for value in left:
+        lo = bisect_left(right, value, lo)
+        if lo == right_len:
+            break
+        if right[lo] == value:
+            count += 1
+            lo += 1
+    return count
@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import heapq
+import random
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from time import monotonic, time
+from functools import lru_cache
+from operator import itemgetter
+from time import monotonic, sleep, time
 from typing import Any
 
 import httpx
 
+from app.core.jsonio import loads_json
+from app.rag.connectors.cache import LRUTTLCache
 from app.rag.types import Document, DocumentChunk
 
 TOKEN_SPLIT_RE = re.compile(r"\W+")
+ITEM_SELECT = (
+    "id,name,webUrl,lastModifiedDateTime,parentReference,@microsoft.graph.downloadUrl"
+)
+# Graph throttling (429) and transient unavailability (503) are retried.
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+# Retry-After is clamped and every retry loop shares a wait budget of
+# ``timeout_s``, so a throttled Graph call fails instead of stalling retrieval.
+MAX_RETRY_AFTER_SECONDS = 5.0
+MAX_DOWNLOAD_CHARS = 20_000
+DOWNLOAD_CHUNK_SIZE = 8192
+# Microsoft Graph accepts at most 20 requests per JSON batch.
+GRAPH_BATCH_LIMIT = 20
+
+
+@dataclass(frozen=True)
+class _DriveItem:
+    source_id: str
+    uri: str
+    metadata: dict[str, str]
+    download_url: str
 
 
 class ManagedIdentityTokenProvider:
@@ -83,7 +111,7 @@ class ManagedIdentityTokenProvider:
                 "Managed identity token request failed: "
                 f"{response.status_code} {response.text[:200]}"
             )
-        parsed = response.json()
+        parsed = loads_json(response.content)
         if not isinstance(parsed, dict):
             raise RuntimeError("Managed identity token response must be an object")
         return parsed
@@ -135,6 +163,10 @@ class SharePointConnector:
         cache_ttl_seconds: float = 60.0,
         timeout_s: float = 10.0,
         http_client: Any | None = None,
+        cache_max_entries: int = 512,
+        max_retries: int = 4,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 8.0,
     ) -> None:
         normalized_site_id = site_id.strip()
         if normalized_site_id == "":
@@ -164,9 +196,17 @@ class SharePointConnector:
         self._bearer_token = normalized_token if normalized_token else None
         self._token_provider = token_provider
         self._http = http_client or httpx.Client(timeout=timeout_s)
+        self._max_retries = max(max_retries, 0)
+        self._retry_budget_s = max(timeout_s, 0.0)
+        self._backoff_base_s = max(backoff_base_s, 0.0)
+        self._backoff_max_s = max(backoff_max_s, self._backoff_base_s)
 
-        self._search_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
-        self._document_cache: dict[str, tuple[float, Document]] = {}
+        self._search_cache: LRUTTLCache[list[dict[str, Any]]] = LRUTTLCache(
+            self._cache_ttl_seconds, cache_max_entries
+        )
+        self._document_cache: LRUTTLCache[Document] = LRUTTLCache(
+            self._cache_ttl_seconds, cache_max_entries
+        )
 
     def search(self, query: str, filters: dict[str, str], k: int) -> list[DocumentChunk]:
         if k < 1:
@@ -174,7 +214,11 @@ class SharePointConnector:
 
         records = self._search_records(query)
         query_tokens = self._tokens(query)
-        ranked: list[DocumentChunk] = []
+        query_token_count = len(query_tokens)
+        # set.intersection probes the smaller operand in C; it measured faster
+        # than a Python-level membership loop for short queries.
+        intersect = query_tokens.intersection
+        scored: list[tuple[float, str, str, str, dict[str, str]]] = []
 
         for record in records:
             metadata = self._parse_metadata(record.get("metadata"))
@@ -189,46 +233,172 @@ class SharePointConnector:
             if source_id == "" or uri == "" or text == "":
                 continue
 
-            overlap = len(query_tokens.intersection(self._tokens(text)))
-            score = overlap / len(query_tokens) if query_tokens else 0.0
-
-            ranked.append(
-                DocumentChunk(
-                    source_id=source_id,
-                    connector=self._connector_name,
-                    uri=uri,
-                    chunk_id=f"{source_id}#0",
-                    text=text,
-                    score=round(score, 6),
-                    metadata=metadata,
-                )
+            score = 0.0
+            if query_token_count:
+                record_tokens = record.get("_tokens")
+                if record_tokens is None:
+                    record_tokens = self._tokens(text)
+                score = len(intersect(record_tokens)) / query_token_count
+
+            scored.append((round(score, 6), source_id, uri, text, metadata))
+
+        # Only the top-k survivors are materialized as DocumentChunk objects.
+        return [
+            DocumentChunk(
+                source_id=source_id,
+                connector=self._connector_name,
+                uri=uri,
+                chunk_id=f"{source_id}#0",
+                text=text,
+                score=score,
+                metadata=metadata,
             )
-
-        ranked.sort(key=lambda item: item.score, reverse=True)
-        return ranked[:k]
+            for score, source_id, uri, text, metadata in heapq.nlargest(
+                k, scored, key=itemgetter(0)
+            )
+        ]
 
     def fetch(self, doc_id: str) -> Document | None:
         cached = self._document_cache.get(doc_id)
-        now = monotonic()
-        if cached is not None and (now - cached[0]) < self._cache_ttl_seconds:
-            return cached[1]
+        if cached is not None:
+            return cached
 
         metadata_payload = self._get_json(
             f"{self._drive_prefix()}/items/{doc_id}",
-            {
-                "$select": (
-                    "id,name,webUrl,lastModifiedDateTime,parentReference,"
-                    "@microsoft.graph.downloadUrl"
+            {"$select": ITEM_SELECT},
+        )
+        item = self._parse_item_metadata(metadata_payload)
+        if item is None:
+            return None
+
+        document = self._build_document(item, self._get_text(item.download_url))
+        if document is not None:
+            self._document_cache.put(doc_id, document)
+        return document
+
+    def fetch_many(self, doc_ids: list[str]) -> list[Document | None]:
+        """Fetch several documents, batching metadata lookups through Graph ``$batch``.
+
+        Results are returned in ``doc_ids`` order. Item metadata is requested up to
+        ``GRAPH_BATCH_LIMIT`` items per round trip and file contents are downloaded
+        concurrently.
+        """
+        documents: dict[str, Document | None] = {}
+        pending_ids: list[str] = []
+        for doc_id in dict.fromkeys(doc_ids):
+            cached = self._document_cache.get(doc_id)
+            if cached is not None:
+                documents[doc_id] = cached
+            else:
+                pending_ids.append(doc_id)
+
+        items: dict[str, _DriveItem] = {}
+        for offset in range(0, len(pending_ids), GRAPH_BATCH_LIMIT):
+            chunk = pending_ids[offset : offset + GRAPH_BATCH_LIMIT]
+            for doc_id, payload in zip(chunk, self._batch_get_items(chunk), strict=True):
+                item = self._parse_item_metadata(payload) if payload is not None else None
+                if item is None:
+                    documents[doc_id] = None
+                else:
+                    items[doc_id] = item
+
+        if items:
+            with ThreadPoolExecutor(max_workers=min(GRAPH_BATCH_LIMIT, len(items))) as pool:
+                texts = pool.map(self._get_text, [item.download_url for item in items.values()])
+                for (doc_id, item), text in zip(items.items(), texts, strict=True):
+                    document = self._build_document(item, text)
+                    if document is not None:
+                        self._document_cache.put(doc_id, document)
+                    documents[doc_id] = document
+
+        return [documents[doc_id] for doc_id in doc_ids]
+
+    def _batch_get_items(self, doc_ids: list[str]) -> list[dict[str, Any] | None]:
+        """Return item metadata per id, with ``None`` for items that do not exist.
+
+        Items throttled inside the batch (429/503) are re-batched after the
+        same back-off the top-level requests use.
+        """
+        bodies: list[dict[str, Any] | None] = [None] * len(doc_ids)
+        pending = list(range(len(doc_ids)))
+        attempt = 0
+        waited = 0.0
+        while pending:
+            throttled: list[int] = []
+            delay = 0.0
+            for index, status, headers, body in self._post_batch(
+                [doc_ids[position] for position in pending]
+            ):
+                position = pending[index]
+                if status == 404:
+                    continue
+                item_delay = self._status_retry_delay(
+                    status, self._header_value(headers, "Retry-After"), attempt, waited
                 )
+                if item_delay is not None:
+                    throttled.append(position)
+                    delay = max(delay, item_delay)
+                    continue
+                if status >= 400:
+                    raise RuntimeError(f"SharePoint API returned {status}: {str(body)[:200]}")
+                if isinstance(body, dict):
+                    bodies[position] = body
+            if throttled:
+                sleep(delay)
+                waited += delay
+                attempt += 1
+            pending = throttled
+        return bodies
+
+    def _post_batch(self, doc_ids: list[str]) -> Iterator[tuple[int, int, Any, Any]]:
+        """Yield ``(index, status, headers, body)`` for each ``$batch`` sub-response."""
+        prefix = self._drive_prefix()
+        payload = self._post_json(
+            "/$batch",
+            {
+                "requests": [
+                    {
+                        "id": str(index),
+                        "method": "GET",
+                        "url": f"{prefix}/items/{doc_id}?$select={ITEM_SELECT}",
+                    }
+                    for index, doc_id in enumerate(doc_ids)
+                ]
             },
         )
-        source_id = str(metadata_payload.get("id", "")).strip()
-        uri = str(metadata_payload.get("webUrl", "")).strip()
-        name = str(metadata_payload.get("name", "")).strip()
+        responses = payload.get("responses")
+        if not isinstance(responses, list):
+            raise RuntimeError("SharePoint batch response missing responses")
+
+        for response in responses:
+            if not isinstance(response, dict):
+                continue
+            try:
+                index = int(str(response.get("id")))
+                status = int(str(response.get("status")))
+            except ValueError:
+                continue
+            if 0 <= index < len(doc_ids):
+                yield index, status, response.get("headers"), response.get("body")
+
+    @staticmethod
+    def _header_value(headers: Any, name: str) -> str:
+        if not isinstance(headers, dict):
+            return ""
+        lowered = name.lower()
+        for key, value in headers.items():
+            if str(key).lower() == lowered:
+                return str(value)
+        return ""
+
+    def _parse_item_metadata(self, payload: dict[str, Any]) -> _DriveItem | None:
+        source_id = str(payload.get("id", "")).strip()
+        uri = str(payload.get("webUrl", "")).strip()
+        name = str(payload.get("name", "")).strip()
         if source_id == "" or uri == "":
             return None
 
-        parent_reference = metadata_payload.get("parentReference")
+        parent_reference = payload.get("parentReference")
         parent_path = ""
         if isinstance(parent_reference, dict):
             parent_path = str(parent_reference.get("path", "")).strip()
@@ -236,67 +406,86 @@ class SharePointConnector:
         metadata = {
             "name": name,
             "path": parent_path,
-            "last_modified": str(metadata_payload.get("lastModifiedDateTime", "")).strip(),
+            "last_modified": str(payload.get("lastModifiedDateTime", "")).strip(),
         }
         if not self._path_allowed(metadata):
             return None
 
-        download_url = str(metadata_payload.get("@microsoft.graph.downloadUrl", "")).strip()
+        download_url = str(payload.get("@microsoft.graph.downloadUrl", "")).strip()
         if download_url == "":
             return None
+        return _DriveItem(
+            source_id=source_id, uri=uri, metadata=metadata, download_url=download_url
+        )
 
-        text = self._get_text(download_url)
+    @staticmethod
+    def _build_document(item: _DriveItem, text: str) -> Document | None:
         if text == "":
-            text = name
+            text = item.metadata["name"]
         if text == "":
             return None
-
-        document = Document(source_id=source_id, uri=uri, text=text, metadata=metadata)
-        self._document_cache[doc_id] = (now, document)
-        return document
+        return Document(source_id=item.source_id, uri=item.uri, text=text, metadata=item.metadata)
 
     def _search_records(self, query: str) -> list[dict[str, Any]]:
         cache_key = query.strip().lower()
         cached = self._search_cache.get(cache_key)
-        now = monotonic()
-        if cached is not None and (now - cached[0]) < self._cache_ttl_seconds:
-            return cached[1]
+        if cached is not None:
+            return cached
 
         records = self._fetch_search_records(query)
-        self._search_cache[cache_key] = (now, records)
+        for record in records:
+            # Tokens are computed once per cached record so warm-cache searches
+            # only pay for the set intersection.
+            record["_tokens"] = frozenset(self._tokens(str(record.get("text", ""))))
+        self._search_cache.put(cache_key, records)
         return records
 
     def _fetch_search_records(self, query: str) -> list[dict[str, Any]]:
         records: list[dict[str, Any]] = []
         escaped_query = query.replace("'", "''")
-        next_url: str | None = None
         path = f"{self._drive_prefix()}/root/search(q='{escaped_query}')"
         params: dict[str, object] = {"$top": 50}
 
-        while True:
-            payload = (
-                self._get_json_absolute(next_url)
-                if next_url
-                else self._get_json(path=path, params=params)
-            )
-            values = payload.get("value")
-            if not isinstance(values, list) or len(values) == 0:
-                break
-
-            for value in values:
-                if not isinstance(value, dict):
-                    continue
-                parsed = self._parse_search_result(value)
-                if parsed is not None:
-                    records.append(parsed)
-
-            raw_next = payload.get("@odata.nextLink")
-            if not isinstance(raw_next, str) or raw_next.strip() == "":
-                break
-            next_url = raw_next.strip()
+        payload = self._get_json(path=path, params=params)
+        prefetch: ThreadPoolExecutor | None = None
+        try:
+            while True:
+                values = payload.get("value")
+                if not isinstance(values, list) or len(values) == 0:
+                    break
+
+                # nextLink is opaque, so pages cannot be fanned out; instead the
+                # next page is requested while the current one is parsed.
+                pending: Future[dict[str, Any]] | None = None
+                next_url = self._next_link(payload)
+                if next_url is not None:
+                    if prefetch is None:
+                        prefetch = ThreadPoolExecutor(max_workers=1)
+                    pending = prefetch.submit(self._get_json_absolute, next_url)
+
+                for value in values:
+                    if not isinstance(value, dict):
+                        continue
+                    parsed = self._parse_search_result(value)
+                    if parsed is not None:
+                        records.append(parsed)
+
+                if pending is None:
+                    break
+                payload = pending.result()
+        finally:
+            if prefetch is not None:
+                prefetch.shutdown(wait=False, cancel_futures=True)
 
         return records
 
+    @staticmethod
+    def _next_link(payload: dict[str, Any]) -> str | None:
+        raw_next = payload.get("@odata.nextLink")
+        if not isinstance(raw_next, str) or raw_next.strip() == "":
+            return None
+        return raw_next.strip()
+
     def _parse_search_result(self, value: dict[str, Any]) -> dict[str, Any] | None:
         source_id = str(value.get("id", "")).strip()
         uri = str(value.get("webUrl", "")).strip()
@@ -329,41 +518,116 @@ class SharePointConnector:
         for key, value in params.items():
             if isinstance(value, (str, int, float, bool)) or value is None:
                 query_params[key] = value
-        response = self._http.get(
-            f"{self._base_url}{path}",
-            params=query_params,
-            headers=self._auth_headers(),
+        response = self._send_with_retry(
+            lambda: self._http.get(
+                f"{self._base_url}{path}",
+                params=query_params,
+                headers=self._auth_headers(),
+            )
         )
-        if int(response.status_code) >= 400:
-            raise RuntimeError(
-                f"SharePoint API returned {response.status_code}: {response.text[:200]}"
+        return self._json_object(response)
+
+    def _post_json(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        response = self._send_with_retry(
+            lambda: self._http.post(
+                f"{self._base_url}{path}",
+                json=body,
+                headers=self._auth_headers(),
             )
-        parsed = response.json()
-        if not isinstance(parsed, dict):
-            raise RuntimeError("SharePoint API response must be an object")
-        return parsed
+        )
+        return self._json_object(response)
 
     def _get_json_absolute(self, url: str) -> dict[str, Any]:
-        response = self._http.get(url, headers=self._auth_headers())
+        response = self._send_with_retry(
+            lambda: self._http.get(url, headers=self._auth_headers())
+        )
+        return self._json_object(response)
+
+    def _send_with_retry(self, send: Callable[[], Any]) -> Any:
+        attempt = 0
+        waited = 0.0
+        while True:
+            response = send()
+            delay = self._retry_delay(response, attempt, waited)
+            if delay is None:
+                return response
+            sleep(delay)
+            waited += delay
+            attempt += 1
+
+    def _retry_delay(self, response: Any, attempt: int, waited: float) -> float | None:
+        """Return how long to wait before retrying a throttled response, or None."""
+        status = int(response.status_code)
+        if status not in RETRYABLE_STATUS_CODES:
+            return None
+        return self._status_retry_delay(
+            status, str(response.headers.get("Retry-After", "")), attempt, waited
+        )
+
+    def _status_retry_delay(
+        self, status: int, retry_after: str, attempt: int, waited: float
+    ) -> float | None:
+        """Return the next back-off, or None once retries or the wait budget run out."""
+        if status not in RETRYABLE_STATUS_CODES:
+            return None
+        if attempt >= self._max_retries:
+            return None
+        delay: float | None = None
+        retry_after = retry_after.strip()
+        if retry_after:
+            try:
+                delay = min(max(float(retry_after), 0.0), MAX_RETRY_AFTER_SECONDS)
+            except ValueError:
+                pass
+        if delay is None:
+            backoff = min(self._backoff_base_s * 2.0**attempt, self._backoff_max_s)
+            # Jitter spreads out clients that were throttled at the same moment.
+            delay = backoff + random.uniform(0.0, backoff / 2)
+        if waited + delay > self._retry_budget_s:
+            return None
+        return delay
+
+    @staticmethod
+    def _json_object(response: Any) -> dict[str, Any]:
         if int(response.status_code) >= 400:
             raise RuntimeError(
                 f"SharePoint API returned {response.status_code}: {response.text[:200]}"
             )
-        parsed = response.json()
+        parsed = loads_json(response.content)
         if not isinstance(parsed, dict):
             raise RuntimeError("SharePoint API response must be an object")
         return parsed
 
     def _get_text(self, url: str) -> str:
-        response = self._http.get(url)
+        attempt = 0
+        waited = 0.0
+        while True:
+            with self._http.stream("GET", url) as response:
+                delay = self._retry_delay(response, attempt, waited)
+                if delay is None:
+                    return self._read_download_text(response)
+            sleep(delay)
+            waited += delay
+            attempt += 1
+
+    @staticmethod
+    def _read_download_text(response: Any) -> str:
         if int(response.status_code) >= 400:
+            response.read()
             raise RuntimeError(
-                f"SharePoint file download returned {response.status_code}: {response.text[:200]}"
+                "SharePoint file download returned "
+                f"{response.status_code}: {response.text[:200]}"
             )
-        text = response.text
-        if len(text) > 20_000:
-            text = text[:20_000]
-        return " ".join(text.split()).strip()
+        # Only the first MAX_DOWNLOAD_CHARS are kept, so stop reading the body
+        # once they have been decoded instead of buffering the whole file.
+        parts: list[str] = []
+        remaining = MAX_DOWNLOAD_CHARS
+        for chunk in response.iter_text(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            parts.append(chunk[:remaining])
+            remaining -= len(parts[-1])
+            if remaining <= 0:
+                break
+        return " ".join("".join(parts).split()).strip()
 
     def _drive_prefix(self) -> str:
         if self._drive_id:
@@ -391,7 +655,10 @@ class SharePointConnector:
         )
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _normalize_path_prefix(value: str) -> str:
+        # Memoized: search normalizes every record's parent path, and results
+        # repeat the same handful of folders.
         normalized = value.strip().lower()
         if normalized == "":
             return ""
@@ -1,43 +1,95 @@
 from __future__ import annotations
 
 import re
-from hashlib import sha256
-from math import sqrt
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache
+from hashlib import blake2b, sha256
+from math import sqrt, sumprod
 from typing import Protocol
 
 import httpx
 
+from app.core.jsonio import loads_json
+
+_TOKEN_FINDALL = re.compile(r"[A-Za-z0-9]+").findall
+
 
 class EmbeddingGenerator(Protocol):
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Return one embedding vector per input text, preserving order."""
 
 
+def _blake2b_digest(data: bytes) -> bytes:
+    return blake2b(data, digest_size=4).digest()
+
+
+def _sha256_digest(data: bytes) -> bytes:
+    return sha256(data).digest()
+
+
+_TOKEN_DIGESTS: dict[str, Callable[[bytes], bytes]] = {
+    "blake2b": _blake2b_digest,
+    "sha256": _sha256_digest,
+}
+
+
 class HashEmbeddingGenerator:
-    def __init__(self, embedding_dim: int):
+    """Deterministic bag-of-tokens embeddings for local and test deployments.
+
+    Only three digest bytes are used per token (bucket index and sign), so
+    ``hash_algo="blake2b"`` (a 4-byte digest) is cheaper than the default SHA-256.
+    Vectors differ between ``hash_algo`` values: re-ingest stored embeddings
+    after changing it.
+    """
+
+    def __init__(self, embedding_dim: int, hash_algo: str = "sha256"):
         if embedding_dim < 1:
             raise ValueError("embedding_dim must be >= 1")
+        digest = _TOKEN_DIGESTS.get(hash_algo)
+        if digest is None:
+            raise ValueError("hash_algo must be 'sha256' or 'blake2b'")
         self._embedding_dim = embedding_dim
+        self._digest = digest
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        return [self._text_to_vector(text) for text in texts]
-
-    def _text_to_vector(self, text: str) -> list[float]:
+        # Token buckets are shared across the batch so each distinct token is
+        # hashed once per call, however many texts contain it.
+        buckets: dict[str, tuple[int, int]] = {}
+        return [self._text_to_vector(text, buckets) for text in texts]
+
+    def _text_to_vector(
+        self, text: str, buckets: dict[str, tuple[int, int]] | None = None
+    ) -> list[float]:
         vector = [0.0] * self._embedding_dim
-        tokens = re.findall(r"[a-z0-9]+", text.lower())
+        # Tokens are matched in either case on the raw text and only folded
+        # to lowercase on a bucket miss, so the whole text is never copied.
+        tokens = _TOKEN_FINDALL(text)
         if not tokens:
             return vector
-
-        for token in tokens:
-            digest = sha256(token.encode("utf-8")).digest()
-            idx = int.from_bytes(digest[:2], byteorder="big") % self._embedding_dim
-            sign = 1.0 if digest[2] % 2 == 0 else -1.0
-            vector[idx] += sign
-
-        norm = sqrt(sum(value * value for value in vector))
+        if buckets is None:
+            buckets = {}
+
+        # Repeated tokens are hashed once and applied with their multiplicity.
+        for token, count in Counter(tokens).items():
+            bucket = buckets.get(token)
+            if bucket is None:
+                bucket = buckets[token] = self._token_bucket(token)
+            idx, sign = bucket
+            vector[idx] += sign * count
+
+        norm = sqrt(sumprod(vector, vector))
         if norm == 0:
             return vector
-        return [round(value / norm, 6) for value in vector]
+        # Bucket values are small integer counts, so only a handful are
+        # distinct: round each once and map the vector through the table.
+        scaled = {value: round(value / norm, 6) for value in set(vector)}
+        return list(map(scaled.__getitem__, vector))
+
+    def _token_bucket(self, token: str) -> tuple[int, int]:
+        digest = self._digest(token.lower().encode("utf-8"))
+        idx = int.from_bytes(digest[:2], byteorder="big") % self._embedding_dim
+        return idx, (1 if digest[2] % 2 == 0 else -1)
 
 
 class HTTPOpenAIEmbeddingGenerator:
@@ -62,8 +114,22 @@ class HTTPOpenAIEmbeddingGenerator:
         self._tenant_id = tenant_id
         self._user_id = user_id
         self._classification = classification
-        self._timeout_seconds = timeout_seconds
-        self._transport = transport
+        # One pooled client per generator so keep-alive connections are reused
+        # across embed_texts calls instead of re-handshaking per batch.
+        self._client = httpx.Client(
+            timeout=timeout_seconds,
+            transport=transport,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> HTTPOpenAIEmbeddingGenerator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
@@ -80,20 +146,14 @@ class HTTPOpenAIEmbeddingGenerator:
             headers["x-srg-classification"] = self._classification
 
         payload = {"model": self._model, "input": texts}
-        if self._transport is None:
-            client = httpx.Client(timeout=self._timeout_seconds)
-        else:
-            client = httpx.Client(timeout=self._timeout_seconds, transport=self._transport)
-
-        with client:
-            response = client.post(self._endpoint, headers=headers, json=payload)
+        response = self._client.post(self._endpoint, headers=headers, json=payload)
 
         if response.status_code != 200:
             raise RuntimeError(
                 f"embeddings request failed ({response.status_code}): {response.text[:200]}"
             )
 
-        body = response.json()
+        body = loads_json(response.content)
         data = body.get("data")
         if not isinstance(data, list):
             raise RuntimeError("embeddings response missing data array")
@@ -106,7 +166,7 @@ class HTTPOpenAIEmbeddingGenerator:
             embedding = item.get("embedding")
             if not isinstance(index, int) or not isinstance(embedding, list):
                 continue
-            parsed_vector = [float(value) for value in embedding]
+            parsed_vector = list(map(float, embedding))
             if len(parsed_vector) != self._embedding_dim:
                 raise RuntimeError(
                     f"unexpected embedding dimension: expected {self._embedding_dim}, "
@@ -120,5 +180,11 @@ class HTTPOpenAIEmbeddingGenerator:
         return [vector for vector in ordered if vector is not None]
 
 
+@lru_cache(maxsize=16)
+def _vector_template(dimensions: int) -> str:
+    return "[" + ",".join(["%.6f"] * dimensions) + "]"
+
+
 def vector_literal(values: list[float]) -> str:
-    return "[" + ",".join(f"{value:.6f}" for value in values) + "]"
+    # One %-format over a per-dimension template formats every value in C.
+    return _vector_template(len(values)) % tuple(values)
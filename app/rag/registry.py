@@ -1,5 +1,9 @@
+import logging
+
 from app.rag.connectors.base import Connector
 
+logger = logging.getLogger("srg.rag")
+
 
 class ConnectorRegistry:
     def __init__(self) -> None:
@@ -15,3 +19,14 @@ class ConnectorRegistry:
 
     def list_names(self) -> list[str]:
         return sorted(self._connectors.keys())
+
+    def close(self) -> None:
+        """Close every connector that holds pooled clients or connections."""
+        for name, connector in self._connectors.items():
+            close = getattr(connector, "close", None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception:
+                logger.exception("connector_close_failed", extra={"connector": name})
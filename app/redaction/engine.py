@@ -6,9 +6,18 @@ formats for national identifiers, medical record numbers, dates of birth,
 phone numbers, email addresses, and credit card numbers.
 """
 
+import importlib
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
+
+hyperscan: Any | None
+try:  # pragma: no cover - optional dependency
+    hyperscan = importlib.import_module("hyperscan")
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    hyperscan = None
 
 # ---------------------------------------------------------------------------
 # Pattern registry
@@ -27,6 +36,14 @@ class RedactionPattern:
     regex: re.Pattern[str]
     replacement: str
     category: PatternCategory
+    # Fewest digits any match can contain; lets redact_text skip the regex on
+    # texts with fewer digits. 0 means the pattern is always run.
+    min_digits: int = 0
+    category_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Resolved once so the redaction loop avoids the enum ``.value`` lookup.
+        object.__setattr__(self, "category_value", self.category.value)
 
 
 # Core patterns — always active when redaction is enabled
@@ -36,6 +53,7 @@ _CORE_PATTERNS: tuple[RedactionPattern, ...] = (
         regex=re.compile(r"\bMRN[:\s-]*\d{6,10}\b", re.IGNORECASE),
         replacement="[MRN_REDACTED]",
         category=PatternCategory.PHI,
+        min_digits=6,
     ),
     RedactionPattern(
         name="dob",
@@ -44,12 +62,14 @@ _CORE_PATTERNS: tuple[RedactionPattern, ...] = (
         ),
         replacement="[DOB_REDACTED]",
         category=PatternCategory.PHI,
+        min_digits=8,
     ),
     RedactionPattern(
         name="nhs_number",
         regex=re.compile(r"\b\d{3}[\s-]?\d{3}[\s-]?\d{4}\b"),
         replacement="[NHS_NUMBER_REDACTED]",
         category=PatternCategory.PHI,
+        min_digits=10,
     ),
     RedactionPattern(
         name="nino",
@@ -59,12 +79,14 @@ _CORE_PATTERNS: tuple[RedactionPattern, ...] = (
         ),
         replacement="[NINO_REDACTED]",
         category=PatternCategory.PII,
+        min_digits=6,
     ),
     RedactionPattern(
         name="ssn",
         regex=re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
         replacement="[SSN_REDACTED]",
         category=PatternCategory.PII,
+        min_digits=9,
     ),
     RedactionPattern(
         name="email",
@@ -81,6 +103,7 @@ _CORE_PATTERNS: tuple[RedactionPattern, ...] = (
         ),
         replacement="[PHONE_REDACTED]",
         category=PatternCategory.PII,
+        min_digits=10,
     ),
     RedactionPattern(
         name="phone_uk",
@@ -89,29 +112,122 @@ _CORE_PATTERNS: tuple[RedactionPattern, ...] = (
         ),
         replacement="[PHONE_UK_REDACTED]",
         category=PatternCategory.PII,
+        min_digits=10,
     ),
     RedactionPattern(
         name="credit_card",
         regex=re.compile(r"\b(?:\d[-.\s]?){13,19}\b"),
         replacement="[CREDIT_CARD_REDACTED]",
         category=PatternCategory.FINANCIAL,
+        min_digits=13,
     ),
 )
 
 
+# Every core pattern needs a digit, except email which needs "@". ``\d`` matches
+# Unicode digits in the patterns too, so the precheck uses the same class.
+_CORE_REQUIRED_CHAR = re.compile(r"[\d@]")
+_NON_DIGITS = re.compile(r"\D+")
+
+
+_INLINE_FLAGS: tuple[tuple[re.RegexFlag, str], ...] = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+def _build_detector(patterns: tuple[RedactionPattern, ...]) -> Callable[[str], bool] | None:
+    """Compile all patterns into one alternation used to detect any match.
+
+    Each pattern keeps its own flags through a scoped inline group. Returns
+    ``None`` when a pattern cannot be embedded safely (capturing groups that
+    could be back-referenced by number, or flags with no inline form).
+    """
+    if not patterns:
+        return None
+    supported = re.UNICODE
+    for flag, _letter in _INLINE_FLAGS:
+        supported |= flag
+    parts: list[str] = []
+    for pattern in patterns:
+        flags = pattern.regex.flags
+        if pattern.regex.groups or flags & ~supported:
+            return None
+        enabled = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        disabled = "".join(letter for flag, letter in _INLINE_FLAGS if not flags & flag)
+        scoped = f"{enabled}-{disabled}" if disabled else enabled
+        parts.append(f"(?{scoped}:{pattern.regex.pattern})")
+    try:
+        combined = re.compile("|".join(parts))
+    except re.error:
+        return None
+    return lambda text: combined.search(text) is not None
+
+
+def _build_hyperscan_detector(
+    patterns: tuple[RedactionPattern, ...],
+) -> Callable[[str], bool] | None:
+    """Compile all patterns into one Hyperscan block-mode database.
+
+    Only used as a match detector: replacements still run through ``re`` so
+    results are identical to the regex path. Returns ``None`` when Hyperscan is
+    not installed or a pattern uses syntax or flags it cannot compile.
+    """
+    if hyperscan is None or not patterns:
+        return None
+    flags: list[int] = []
+    for pattern in patterns:
+        if pattern.regex.flags & re.VERBOSE:
+            return None
+        pattern_flags = (
+            hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        )
+        if pattern.regex.flags & re.IGNORECASE:
+            pattern_flags |= hyperscan.HS_FLAG_CASELESS
+        if pattern.regex.flags & re.MULTILINE:
+            pattern_flags |= hyperscan.HS_FLAG_MULTILINE
+        if pattern.regex.flags & re.DOTALL:
+            pattern_flags |= hyperscan.HS_FLAG_DOTALL
+        flags.append(pattern_flags)
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[pattern.regex.pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags,
+        )
+    except hyperscan.error:
+        return None
+
+    def detect(text: str) -> bool:
+        found: list[int] = []
+
+        def on_match(match_id: int, start: int, end: int, match_flags: int, context: Any) -> None:
+            found.append(match_id)
+
+        database.scan(text.encode("utf-8", errors="surrogatepass"), match_event_handler=on_match)
+        return bool(found)
+
+    return detect
+
+
 # ---------------------------------------------------------------------------
 # Result types
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class RedactionResult:
     messages: list[dict[str, str]]
     redaction_count: int
     matched_categories: set[str] = field(default_factory=set)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextRedactionResult:
     text: str
     redaction_count: int
@@ -132,12 +248,16 @@ class RedactionEngine:
         Additional patterns appended after core set.
     enabled_categories : set of ``PatternCategory``, optional
         Limit scanning to specific categories.  ``None`` means all.
+    use_hyperscan : bool, optional
+        Detect matches with a Hyperscan database when the ``hyperscan``
+        package is installed.  Falls back to the combined ``re`` detector.
     """
 
     def __init__(
         self,
         extra_patterns: tuple[RedactionPattern, ...] = (),
         enabled_categories: set[PatternCategory] | None = None,
+        use_hyperscan: bool = False,
     ) -> None:
         all_patterns = _CORE_PATTERNS + extra_patterns
         if enabled_categories is not None:
@@ -145,6 +265,15 @@ class RedactionEngine:
                 p for p in all_patterns if p.category in enabled_categories
             )
         self._patterns = all_patterns
+        # The character precheck only holds while no custom pattern is active.
+        self._required_char = (
+            _CORE_REQUIRED_CHAR.search
+            if all(p in _CORE_PATTERNS for p in all_patterns)
+            else None
+        )
+        self._counts_digits = any(p.min_digits > 0 for p in all_patterns)
+        detector = _build_hyperscan_detector(all_patterns) if use_hyperscan else None
+        self._detector = detector or _build_detector(all_patterns)
 
     @property
     def pattern_count(self) -> int:
@@ -174,18 +303,38 @@ class RedactionEngine:
 
     def redact_text(self, text: str) -> TextRedactionResult:
         """Redact a single text string."""
+        # One scan with the combined detector settles the common no-PII case.
+        # Texts that do match still go through the ordered per-pattern pass,
+        # since later patterns must see earlier replacements (e.g. a DOB is
+        # redacted before the credit-card pattern can swallow its digits).
+        # A C-level scan for a digit or "@" rejects most prose before that.
+        if self._required_char is not None and self._required_char(text) is None:
+            return TextRedactionResult(text=text, redaction_count=0)
+        if self._detector is not None and not self._detector(text):
+            return TextRedactionResult(text=text, redaction_count=0)
+
+        # Replacements never add digits, so the original count bounds what any
+        # later pattern can see; patterns needing more digits are skipped.
+        digit_count = len(_NON_DIGITS.sub("", text)) if self._counts_digits else 0
         redacted = text
         hit_count = 0
         categories: set[str] = set()
         for pattern in self._patterns:
+            if pattern.min_digits > digit_count:
+                continue
             redacted, substitutions = pattern.regex.subn(
                 pattern.replacement, redacted
             )
             if substitutions > 0:
                 hit_count += substitutions
-                categories.add(pattern.category.value)
+                categories.add(pattern.category_value)
         return TextRedactionResult(
             text=redacted,
             redaction_count=hit_count,
             matched_categories=categories,
         )
+
+
+# Shared engine with the default pattern set. Patterns and the combined
+# detector are compiled once at import; the engine holds no per-call state.
+DEFAULT_ENGINE = RedactionEngine()
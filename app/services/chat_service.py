@@ -1,19 +1,23 @@
 import asyncio
+import importlib
 import json as json_mod
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
+from dataclasses import replace
 from datetime import UTC, datetime
-from hashlib import sha256
-from time import perf_counter
+from functools import partial
+from hashlib import blake2b, sha256
+from secrets import token_hex
+from time import perf_counter_ns, time, time_ns
 from typing import Any
-from uuid import uuid4
 
 from fastapi import Request
 
-from app.audit.writer import AuditValidationError, AuditWriter
+from app.audit.writer import AuditValidationError, AuditWriter, BackgroundAuditWriter
 from app.budget.tracker import BudgetBackendError, BudgetExceededError, BudgetTracker
 from app.config.settings import Settings
 from app.core.errors import AppError
+from app.core.jsonio import dumps_json
 from app.metrics import inc_counter, record_request
 from app.models.openai import (
     ChatCompletionRequest,
@@ -32,6 +36,7 @@ from app.providers.registry import (
     route_stream_with_fallback,
     route_with_fallback,
 )
+from app.rag.connectors.cache import LRUTTLCache
 from app.rag.retrieval import (
     ConnectorNotFoundError,
     RetrievalDeniedError,
@@ -39,15 +44,191 @@ from app.rag.retrieval import (
     RetrievalRequest,
 )
 from app.rag.types import DocumentChunk
-from app.redaction.engine import RedactionEngine
+from app.redaction.engine import RedactionEngine, RedactionResult, TextRedactionResult
 from app.services.inflight_guard import InflightGuard
 from app.telemetry.tracing import SpanCollector
+from app.webhooks.batcher import WebhookBatcher
 from app.webhooks.dispatcher import WebhookDispatcher, WebhookEventType
 
 logger = logging.getLogger("srg.chat")
 
+# Below this many characters a regex pass is cheaper than a thread hand-off.
+_REDACTION_OFFLOAD_MIN_CHARS = 4096
+
+blake3: Any | None
+try:  # pragma: no cover - optional dependency
+    blake3 = importlib.import_module("blake3").blake3
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+xxh3_128: Any | None
+try:  # pragma: no cover - optional dependency
+    xxh3_128 = importlib.import_module("xxhash").xxh3_128
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    xxh3_128 = None
+
+# SSE frames are yielded as bytes so StreamingResponse does not re-encode them.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+async def _sse_frames(frames: AsyncGenerator[tuple[bytes, bool], None]) -> AsyncIterator[bytes]:
+    try:
+        async for frame, _ in frames:
+            yield frame
+    finally:
+        await frames.aclose()
+
+
+async def _coalesce_sse_frames(
+    frames: AsyncGenerator[tuple[bytes, bool], None], max_frames: int, window_s: float
+) -> AsyncIterator[bytes]:
+    """Join consecutive SSE frames into one write.
+
+    A batch is flushed once it holds ``max_frames`` frames or its oldest frame
+    has waited ``window_s``. Frames flagged as barriers (first chunk,
+    ``finish_reason``, ``usage``, trailers) flush the batch and go out alone.
+    """
+    loop = asyncio.get_running_loop()
+    pending: list[bytes] = []
+    flush_at = 0.0
+    next_frame: asyncio.Future[tuple[bytes, bool] | None] | None = None
+    try:
+        while True:
+            if pending:
+                # Pull in a task so the window can expire without cancelling
+                # the provider stream mid-read.
+                if next_frame is None:
+                    next_frame = asyncio.ensure_future(anext(frames, None))
+                done, _ = await asyncio.wait(
+                    {next_frame}, timeout=max(flush_at - loop.time(), 0.0)
+                )
+                if not done:
+                    yield b"".join(pending)
+                    pending.clear()
+                    continue
+                item = next_frame.result()
+                next_frame = None
+            elif next_frame is not None:
+                item = await next_frame
+                next_frame = None
+            else:
+                item = await anext(frames, None)
+            if item is None:
+                break
+            frame, barrier = item
+            if barrier:
+                if pending:
+                    yield b"".join(pending)
+                    pending.clear()
+                yield frame
+                continue
+            if not pending:
+                flush_at = loop.time() + window_s
+            pending.append(frame)
+            if len(pending) >= max_frames:
+                yield b"".join(pending)
+                pending.clear()
+        if pending:
+            yield b"".join(pending)
+    finally:
+        if next_frame is not None:
+            next_frame.cancel()
+            await asyncio.gather(next_frame, return_exceptions=True)
+        await frames.aclose()
+
+
+# Shared encoder for payload hashing; json.dumps would build one per call for
+# these non-default options.
+_CANONICAL_ENCODER = json_mod.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+# The fixed parts of a synthesized finish chunk, pre-encoded so the frame is
+# joined from bytes; output matches ``_sse_event`` for the equivalent dict.
+_FINISH_EVENT_ID = _SSE_PREFIX + b'{"id":'
+_FINISH_EVENT_CREATED = b',"object":"chat.completion.chunk","created":'
+_FINISH_EVENT_MODEL = b',"model":'
+_FINISH_EVENT_REASON = b',"choices":[{"index":0,"delta":{},"finish_reason":'
+_FINISH_EVENT_END = b"}]}" + _SSE_SUFFIX
+
+
+def _finish_sse_event(chunk_id: str, created: int, model: str, finish_reason: str) -> bytes:
+    return b"".join(
+        (
+            _FINISH_EVENT_ID,
+            dumps_json(chunk_id),
+            _FINISH_EVENT_CREATED,
+            str(created).encode("ascii"),
+            _FINISH_EVENT_MODEL,
+            dumps_json(model),
+            _FINISH_EVENT_REASON,
+            dumps_json(finish_reason),
+            _FINISH_EVENT_END,
+        )
+    )
+
+
+def _new_blake3() -> Any:
+    if blake3 is None:
+        raise RuntimeError("blake3 is not installed")
+    return blake3()
+
+
+def _new_xxh3_128() -> Any:
+    if xxh3_128 is None:
+        raise RuntimeError("xxhash is not installed")
+    return xxh3_128()
+
+
+# Incremental hasher factories, so large members can be fed piecewise.
+_PAYLOAD_HASHERS: dict[str, Callable[[], Any]] = {
+    "sha256": sha256,
+    "blake2b": partial(blake2b, digest_size=32),
+    "blake3": _new_blake3,
+    "xxh3_128": _new_xxh3_128,
+}
+
+
+def _continued_word_count(text: str, follows_word: bool) -> int:
+    """Words ``text`` adds to a running ``len(joined.split())``.
+
+    ``follows_word`` says whether the text so far ends mid-word, in which case a
+    leading word in ``text`` continues it rather than starting a new one.
+    """
+    count = len(text.split())
+    if follows_word and text and not text[0].isspace():
+        count -= 1
+    return count
+
+
+_iso_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_now_ms() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision.
+
+    The string is reused until the millisecond advances, so bursts of
+    synthetic policy decisions skip ``datetime.isoformat`` entirely.
+    """
+    global _iso_cache
+    now_ms = time_ns() // 1_000_000
+    cached_ms, cached = _iso_cache
+    if now_ms == cached_ms:
+        return cached
+    formatted = datetime.fromtimestamp(now_ms / 1000, UTC).isoformat(timespec="milliseconds")
+    _iso_cache = (now_ms, formatted)
+    return formatted
+
+
+def _consume_task_exception(task: asyncio.Task[Any]) -> None:
+    # Discarded prefetch tasks must not log "exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
+
 
 class _NoopSpan:
+    __slots__ = ()
+
     def __enter__(self) -> "_NoopSpan":
         return self
 
@@ -66,6 +247,10 @@ class _NoopSpan:
         _ = name, attributes
 
 
+# Stateless, so one instance serves every span while tracing is disabled.
+_NOOP_SPAN = _NoopSpan()
+
+
 class ChatService:
     def __init__(
         self,
@@ -92,20 +277,82 @@ class ChatService:
         self._webhook_dispatcher = webhook_dispatcher
         self._span_collector = span_collector
         self._inflight_guard = inflight_guard
+        # Decisions from OPA are reused for identical inputs within the TTL;
+        # observe-mode fallbacks are never cached.
+        self._policy_cache: LRUTTLCache[PolicyDecision] | None = (
+            LRUTTLCache(settings.policy_cache_ttl_s, settings.policy_cache_max_entries)
+            if settings.policy_cache_ttl_s > 0
+            else None
+        )
+        self._policy_cache_hash: str | None = None
+        # Settings fallback for decisions without connector constraints.
+        self._default_allowed_connectors: set[str] | None = (
+            settings.rag_allowed_connector_set or None
+        )
+        hasher = _PAYLOAD_HASHERS.get(settings.audit_hash_algo)
+        if hasher is None:
+            raise ValueError(
+                f"audit_hash_algo must be one of {sorted(_PAYLOAD_HASHERS)}, "
+                f"got {settings.audit_hash_algo!r}"
+            )
+        if settings.audit_hash_algo == "blake3" and blake3 is None:
+            raise ValueError("audit_hash_algo 'blake3' requires the blake3 package")
+        if settings.audit_hash_algo == "xxh3_128" and xxh3_128 is None:
+            raise ValueError("audit_hash_algo 'xxh3_128' requires the xxhash package")
+        self._payload_hasher = hasher
+        # Completed-request audit events are handed to a writer thread when
+        # enabled; the queue falls back to a synchronous write when full.
+        self._audit_queue: BackgroundAuditWriter | None = (
+            BackgroundAuditWriter(audit_writer, settings.audit_queue_max)
+            if settings.audit_async_enabled
+            else None
+        )
+
+        # Detached webhook deliveries; referenced here so they cannot be
+        # garbage-collected mid-flight and can be awaited at shutdown.
+        self._webhook_tasks: set[asyncio.Task[None]] = set()
+        # Opt-in: events are coalesced into one POST per endpoint per batch.
+        self._webhook_batcher: WebhookBatcher | None = (
+            WebhookBatcher(
+                webhook_dispatcher,
+                max_batch_size=settings.webhook_batch_max_events,
+                flush_interval_s=settings.webhook_batch_flush_s,
+                max_pending=settings.webhook_batch_max_pending,
+            )
+            if webhook_dispatcher is not None and settings.webhook_batch_enabled
+            else None
+        )
+
+    def close(self) -> None:
+        """Flush queued audit events; called on application shutdown."""
+        if self._audit_queue is not None:
+            self._audit_queue.close()
+
+    async def drain_webhooks(self) -> None:
+        """Wait for in-flight webhook deliveries; called on application shutdown."""
+        if self._webhook_batcher is not None:
+            await self._webhook_batcher.flush()
+        if self._webhook_tasks:
+            await asyncio.gather(*self._webhook_tasks, return_exceptions=True)
 
     async def handle_chat(
         self, request: Request, payload: ChatCompletionRequest
     ) -> ChatCompletionResponse:
-        started = perf_counter()
+        started_ns = perf_counter_ns()
         request_id = request.state.request_id
         tenant_id = request.state.tenant_id
         user_id = request.state.user_id
         classification = request.state.classification
-        endpoint = str(request.url.path)
+        endpoint: str = request.state.endpoint
         webhook_events: list[dict[str, object]] = []
         budget_summary: dict[str, object] | None = None
-        request_payload_hash = self._hash_value(payload.model_dump(exclude_none=True))
+        # One model_dump feeds both the request hash and apply_transforms.
+        request_dump = payload.model_dump()
+        request_payload_hash, request_messages, request_messages_json = (
+            self._request_hash_parts(request_dump)
+        )
         inflight_acquired = False
+        retrieval_task: asyncio.Task[list[DocumentChunk]] | None = None
 
         try:
             with self._span(
@@ -134,6 +381,11 @@ class ChatService:
                     self._settings.rag_enabled and payload.rag and payload.rag.enabled
                 )
                 requested_connector = payload.rag.connector if rag_requested and payload.rag else ""
+                # Optionally overlap retrieval with policy evaluation; the result
+                # is only used once the decision allows the connector.
+                retrieval_task = (
+                    self._start_retrieval_prefetch(payload) if rag_requested else None
+                )
 
                 policy_input = {
                     "tenant_id": tenant_id,
@@ -141,7 +393,9 @@ class ChatService:
                     "endpoint": endpoint,
                     "requested_model": payload.model,
                     "classification": classification,
-                    "estimated_tokens": sum(len(msg.content.split()) for msg in payload.messages),
+                    "estimated_tokens": self._cheap_token_estimate(
+                        msg.content for msg in payload.messages
+                    ),
                     "connector_targets": [requested_connector] if rag_requested else [],
                     "request_metadata": {
                         "request_id": request_id,
@@ -187,7 +441,7 @@ class ChatService:
                 )
                 raise AppError(403, "policy_denied", "policy", reason)
 
-            transformed_request = apply_transforms(payload.model_dump(), decision.transforms)
+            transformed_request = apply_transforms(request_dump, decision.transforms)
             messages: list[dict[str, str]] = transformed_request["messages"]
 
             citations: list[Citation] | None = None
@@ -200,13 +454,13 @@ class ChatService:
                         "top_k": payload.rag.top_k,
                     },
                 ):
-                    retrieval_request = RetrievalRequest(
-                        query=self._last_user_message(payload),
-                        connector=payload.rag.connector,
-                        k=payload.rag.top_k,
-                        filters=payload.rag.filters or {},
-                    )
-                    chunks = self._retrieve_chunks(retrieval_request, decision)
+                    retrieval_request = self._retrieval_request(payload)
+                    if retrieval_task is not None:
+                        chunks = await self._prefetched_chunks(
+                            retrieval_task, retrieval_request, decision
+                        )
+                    else:
+                        chunks = await self._retrieve_chunks(retrieval_request, decision)
                     if chunks:
                         messages.append(
                             {
@@ -223,15 +477,23 @@ class ChatService:
                     operation="redaction.scan",
                     attributes={"direction": "request"},
                 ):
-                    redaction_result = self._redaction_engine.redact_messages(messages)
+                    redaction_result = await self._redact_messages(messages)
                     messages = redaction_result.messages
                     input_redaction_count = redaction_result.redaction_count
-            redacted_payload_hash = self._hash_value(messages)
+            # Serialized once: feeds both the redacted and provider request hashes.
+            # Messages no transform, retrieval or redaction changed reuse the
+            # request's serialization.
+            messages_json = (
+                request_messages_json
+                if messages == request_messages
+                else self._canonical_json(messages)
+            )
+            redacted_payload_hash = self._hash_canonical(messages_json)
 
             selected_model = str(transformed_request.get("model", payload.model))
             self._validate_model_constraints(decision, selected_model)
             max_tokens = transformed_request.get("max_tokens")
-            allowed_provider_names = self._allowed_providers(decision)
+            allowed_provider_names = decision.allowed_provider_names
 
             requested_budget_tokens = self._estimate_requested_tokens(messages, max_tokens)
             budget_summary = self._enforce_budget_or_deny(
@@ -248,11 +510,11 @@ class ChatService:
                 webhook_events=webhook_events,
             )
 
-            provider_request_hash = self._hash_value(
+            provider_request_hash = self._provider_hash_from_canonical(
                 {
-                    "model": selected_model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
+                    "model": self._canonical_json(selected_model),
+                    "messages": messages_json,
+                    "max_tokens": self._canonical_json(max_tokens),
                 }
             )
 
@@ -304,8 +566,12 @@ class ChatService:
                     )
                     raise self._app_error_from_provider_error(exc) from exc
 
-            response = ChatCompletionResponse.model_validate(provider_result)
-            provider_response_hash = self._hash_value(provider_result)
+            provider_response_hash = self._provider_hash(provider_result)
+            response = (
+                ChatCompletionResponse.construct_from_provider(provider_result)
+                if self._settings.trust_provider_payloads
+                else ChatCompletionResponse.model_validate(provider_result)
+            )
 
             output_redaction_count = 0
             if self._settings.redaction_enabled and classification in {"phi", "pii"}:
@@ -315,7 +581,7 @@ class ChatService:
                     attributes={"direction": "response"},
                 ):
                     for choice in response.choices:
-                        result = self._redaction_engine.redact_text(choice.message.content)
+                        result = await self._redact_text(choice.message.content)
                         if result.redaction_count > 0:
                             choice.message.content = result.text
                             output_redaction_count += result.redaction_count
@@ -394,37 +660,41 @@ class ChatService:
                 attributes={"streaming": False, "provider": routed_provider},
             ):
                 try:
-                    self._audit_writer.write_event(audit_event)
+                    await self._persist_audit_event_off_loop(audit_event)
                 except AuditValidationError as exc:
                     raise AppError(
                         502, "audit_write_failed", "provider", "Failed to persist audit event"
                     ) from exc
 
-            latency_ms = int((perf_counter() - started) * 1000)
-            logger.info(
-                "chat_completed",
-                extra={
-                    "request_id": request_id,
-                    "tenant_id": tenant_id,
-                    "user_id": user_id,
-                    "model": selected_model,
-                    "policy_decision": policy_decision_label,
-                    "redaction_count": redaction_count,
-                    "input_redaction_count": input_redaction_count,
-                    "output_redaction_count": output_redaction_count,
-                    "provider": routed_provider,
-                    "latency_ms": latency_ms,
-                    "token_in": tokens_in,
-                    "token_out": tokens_out,
-                    "cost_usd": cost_usd,
-                    "provider_attempts": provider_attempts,
-                    "fallback_chain": fallback_chain,
-                    "budget_used": budget_summary.get("used") if budget_summary else None,
-                    "budget_remaining": budget_summary.get("remaining")
+            latency_ms = (perf_counter_ns() - started_ns) // 1_000_000
+            if logger.isEnabledFor(logging.INFO):
+                budget_used, budget_remaining = (
+                    (budget_summary.get("used"), budget_summary.get("remaining"))
                     if budget_summary
-                    else None,
-                },
-            )
+                    else (None, None)
+                )
+                logger.info(
+                    "chat_completed",
+                    extra={
+                        "request_id": request_id,
+                        "tenant_id": tenant_id,
+                        "user_id": user_id,
+                        "model": selected_model,
+                        "policy_decision": policy_decision_label,
+                        "redaction_count": redaction_count,
+                        "input_redaction_count": input_redaction_count,
+                        "output_redaction_count": output_redaction_count,
+                        "provider": routed_provider,
+                        "latency_ms": latency_ms,
+                        "token_in": tokens_in,
+                        "token_out": tokens_out,
+                        "cost_usd": cost_usd,
+                        "provider_attempts": provider_attempts,
+                        "fallback_chain": fallback_chain,
+                        "budget_used": budget_used,
+                        "budget_remaining": budget_remaining,
+                    },
+                )
             if self._settings.metrics_enabled:
                 record_request(
                     endpoint=endpoint,
@@ -441,22 +711,28 @@ class ChatService:
                 )
             return response
         finally:
+            self._abandon_retrieval_prefetch(retrieval_task)
             if inflight_acquired:
                 self._release_inflight(tenant_id)
 
     async def handle_chat_stream(
         self, request: Request, payload: ChatCompletionRequest
-    ) -> AsyncIterator[str]:
-        started = perf_counter()
+    ) -> AsyncIterator[bytes]:
+        started_ns = perf_counter_ns()
         request_id = request.state.request_id
         tenant_id = request.state.tenant_id
         user_id = request.state.user_id
         classification = request.state.classification
-        endpoint = str(request.url.path)
+        endpoint: str = request.state.endpoint
         webhook_events: list[dict[str, object]] = []
         budget_summary: dict[str, object] | None = None
-        request_payload_hash = self._hash_value(payload.model_dump(exclude_none=True))
+        # One model_dump feeds both the request hash and apply_transforms.
+        request_dump = payload.model_dump()
+        request_payload_hash, request_messages, request_messages_json = (
+            self._request_hash_parts(request_dump)
+        )
         inflight_acquired = False
+        retrieval_task: asyncio.Task[list[DocumentChunk]] | None = None
 
         try:
             with self._span(
@@ -486,6 +762,11 @@ class ChatService:
                     self._settings.rag_enabled and payload.rag and payload.rag.enabled
                 )
                 requested_connector = payload.rag.connector if rag_requested and payload.rag else ""
+                # Optionally overlap retrieval with policy evaluation; the result
+                # is only used once the decision allows the connector.
+                retrieval_task = (
+                    self._start_retrieval_prefetch(payload) if rag_requested else None
+                )
 
                 policy_input = {
                     "tenant_id": tenant_id,
@@ -493,7 +774,9 @@ class ChatService:
                     "endpoint": endpoint,
                     "requested_model": payload.model,
                     "classification": classification,
-                    "estimated_tokens": sum(len(msg.content.split()) for msg in payload.messages),
+                    "estimated_tokens": self._cheap_token_estimate(
+                        msg.content for msg in payload.messages
+                    ),
                     "connector_targets": [requested_connector] if rag_requested else [],
                     "request_metadata": {
                         "request_id": request_id,
@@ -536,7 +819,7 @@ class ChatService:
                 )
                 raise AppError(403, "policy_denied", "policy", reason)
 
-            transformed_request = apply_transforms(payload.model_dump(), decision.transforms)
+            transformed_request = apply_transforms(request_dump, decision.transforms)
             messages: list[dict[str, str]] = transformed_request["messages"]
 
             citations: list[Citation] | None = None
@@ -549,13 +832,13 @@ class ChatService:
                         "top_k": payload.rag.top_k,
                     },
                 ):
-                    retrieval_request = RetrievalRequest(
-                        query=self._last_user_message(payload),
-                        connector=payload.rag.connector,
-                        k=payload.rag.top_k,
-                        filters=payload.rag.filters or {},
-                    )
-                    chunks = self._retrieve_chunks(retrieval_request, decision)
+                    retrieval_request = self._retrieval_request(payload)
+                    if retrieval_task is not None:
+                        chunks = await self._prefetched_chunks(
+                            retrieval_task, retrieval_request, decision
+                        )
+                    else:
+                        chunks = await self._retrieve_chunks(retrieval_request, decision)
                     if chunks:
                         messages.append(
                             {
@@ -572,15 +855,23 @@ class ChatService:
                     operation="redaction.scan",
                     attributes={"direction": "request", "streaming": True},
                 ):
-                    redaction_result = self._redaction_engine.redact_messages(messages)
+                    redaction_result = await self._redact_messages(messages)
                     messages = redaction_result.messages
                     input_redaction_count = redaction_result.redaction_count
-            redacted_payload_hash = self._hash_value(messages)
+            # Serialized once: feeds both the redacted and provider request hashes.
+            # Messages no transform, retrieval or redaction changed reuse the
+            # request's serialization.
+            messages_json = (
+                request_messages_json
+                if messages == request_messages
+                else self._canonical_json(messages)
+            )
+            redacted_payload_hash = self._hash_canonical(messages_json)
 
             selected_model = str(transformed_request.get("model", payload.model))
             self._validate_model_constraints(decision, selected_model)
             max_tokens = transformed_request.get("max_tokens")
-            allowed_provider_names = self._allowed_providers(decision)
+            allowed_provider_names = decision.allowed_provider_names
             requested_budget_tokens = self._estimate_requested_tokens(messages, max_tokens)
             budget_summary = self._enforce_budget_or_deny(
                 tenant_id=tenant_id,
@@ -596,11 +887,11 @@ class ChatService:
                 webhook_events=webhook_events,
             )
 
-            provider_request_hash = self._hash_value(
+            provider_request_hash = self._provider_hash_from_canonical(
                 {
-                    "model": selected_model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
+                    "model": self._canonical_json(selected_model),
+                    "messages": messages_json,
+                    "max_tokens": self._canonical_json(max_tokens),
                 }
             )
 
@@ -658,185 +949,149 @@ class ChatService:
                     )
                     raise self._app_error_from_provider_error(exc) from exc
 
-        except Exception:
+        except BaseException:
+            self._abandon_retrieval_prefetch(retrieval_task)
             if inflight_acquired:
                 self._release_inflight(tenant_id)
             raise
 
-        async def event_stream() -> AsyncIterator[str]:
+        async def event_stream() -> AsyncGenerator[tuple[bytes, bool], None]:
             nonlocal budget_summary
             completion_parts: list[str] = []
-            usage_prompt_tokens = max(sum(len(item["content"].split()) for item in messages), 1)
+            # Running len("".join(completion_parts).split()); a word split
+            # across two deltas is counted once.
+            completion_word_count = 0
+            completion_ends_in_word = False
+            usage_prompt_tokens = max(
+                self._cheap_token_estimate(item["content"] for item in messages), 1
+            )
             usage_completion_tokens = 0
             output_redaction_count = 0
             saw_finish = False
             saw_citations = False
             chunk_id = ""
-            chunk_created = int(datetime.now(UTC).timestamp())
+            chunk_created = int(time())
+            # One fallback id per stream, so id-less chunks and trailers agree.
+            default_chunk_id = f"chatcmpl-{token_hex(16)}"
             policy_decision_label = self._policy_decision_label(decision)
             stream_error: BaseException | None = None
             stream_status_code = 200
             chunk_count = 0
             budget_mid_stream_terminated = False
             _BUDGET_CHECK_INTERVAL = 5
+            # Per-chunk hot path: resolve attribute lookups once per stream.
+            redact_output = self._settings.redaction_enabled and classification in {"phi", "pii"}
+            redact_text = self._redaction_engine.redact_text
+            sse_event = self._sse_event
+            coerce_int = self._coerce_int
+            budget_tracker = self._budget_tracker
+            # Dumped once for both the citations trailer and the audit event.
+            citation_dumps = [citation.model_dump() for citation in citations or ()]
+
+            def absorb_chunk(chunk: dict[str, object]) -> bool:
+                """Redact deltas in place and fold the chunk into the stream totals.
+
+                Returns True when the chunk finishes a choice or carries usage.
+                """
+                nonlocal output_redaction_count, saw_citations, saw_finish
+                nonlocal usage_prompt_tokens, usage_completion_tokens
+                nonlocal completion_word_count, completion_ends_in_word
+                is_barrier = False
+                choices = chunk.get("choices")
+                if isinstance(choices, list):
+                    for choice in choices:
+                        if not isinstance(choice, dict):
+                            continue
+                        delta = choice.get("delta")
+                        if isinstance(delta, dict):
+                            content = delta.get("content")
+                            if isinstance(content, str) and content:
+                                if redact_output:
+                                    redaction_result = redact_text(content)
+                                    if redaction_result.redaction_count > 0:
+                                        output_redaction_count += redaction_result.redaction_count
+                                        content = redaction_result.text
+                                        delta["content"] = content
+                                completion_parts.append(content)
+                                completion_word_count += _continued_word_count(
+                                    content, completion_ends_in_word
+                                )
+                                completion_ends_in_word = not content[-1].isspace()
+                            if "citations" in delta:
+                                saw_citations = True
+                        finish_reason = choice.get("finish_reason")
+                        if isinstance(finish_reason, str) and finish_reason:
+                            saw_finish = True
+                            is_barrier = True
+                usage = chunk.get("usage")
+                if not isinstance(usage, dict):
+                    return is_barrier
+                prompt_raw = usage.get("prompt_tokens")
+                completion_raw = usage.get("completion_tokens")
+                if isinstance(prompt_raw, int):
+                    usage_prompt_tokens = prompt_raw
+                if isinstance(completion_raw, int):
+                    usage_completion_tokens = completion_raw
+                return True
 
             try:
                 if first_chunk is not None:
-                    chunk_id = str(first_chunk.get("id", f"chatcmpl-{uuid4().hex}"))
-                    chunk_created = self._coerce_int(first_chunk.get("created"), chunk_created)
-                    choices = first_chunk.get("choices")
-                    if isinstance(choices, list):
-                        for choice in choices:
-                            if not isinstance(choice, dict):
-                                continue
-                            delta = choice.get("delta", {})
-                            if isinstance(delta, dict):
-                                content = delta.get("content")
-                                if isinstance(content, str) and content:
-                                    if (
-                                        self._settings.redaction_enabled
-                                        and classification in {"phi", "pii"}
-                                    ):
-                                        redaction_result = self._redaction_engine.redact_text(
-                                            content
-                                        )
-                                        if redaction_result.redaction_count > 0:
-                                            output_redaction_count += (
-                                                redaction_result.redaction_count
-                                            )
-                                            content = redaction_result.text
-                                            delta["content"] = content
-                                    completion_parts.append(content)
-                                if "citations" in delta:
-                                    saw_citations = True
-                            finish_reason = choice.get("finish_reason")
-                            if isinstance(finish_reason, str) and finish_reason:
-                                saw_finish = True
-                    usage = first_chunk.get("usage")
-                    if isinstance(usage, dict):
-                        prompt_raw = usage.get("prompt_tokens")
-                        completion_raw = usage.get("completion_tokens")
-                        if isinstance(prompt_raw, int):
-                            usage_prompt_tokens = prompt_raw
-                        if isinstance(completion_raw, int):
-                            usage_completion_tokens = completion_raw
-                    yield self._sse_event(first_chunk)
+                    chunk_id = str(first_chunk.get("id", default_chunk_id))
+                    chunk_created = coerce_int(first_chunk.get("created"), chunk_created)
+                    absorb_chunk(first_chunk)
+                    yield sse_event(first_chunk), True
 
                 async for chunk in provider_stream:
                     if chunk_id == "":
-                        chunk_id = str(chunk.get("id", f"chatcmpl-{uuid4().hex}"))
-                    chunk_created = self._coerce_int(chunk.get("created"), chunk_created)
-
-                    choices = chunk.get("choices")
-                    if isinstance(choices, list):
-                        for choice in choices:
-                            if not isinstance(choice, dict):
-                                continue
-                            delta = choice.get("delta", {})
-                            if isinstance(delta, dict):
-                                content = delta.get("content")
-                                if isinstance(content, str) and content:
-                                    if (
-                                        self._settings.redaction_enabled
-                                        and classification in {"phi", "pii"}
-                                    ):
-                                        redaction_result = self._redaction_engine.redact_text(
-                                            content
-                                        )
-                                        if redaction_result.redaction_count > 0:
-                                            output_redaction_count += (
-                                                redaction_result.redaction_count
-                                            )
-                                            content = redaction_result.text
-                                            delta["content"] = content
-                                    completion_parts.append(content)
-                                if "citations" in delta:
-                                    saw_citations = True
-                            finish_reason = choice.get("finish_reason")
-                            if isinstance(finish_reason, str) and finish_reason:
-                                saw_finish = True
-
-                    usage = chunk.get("usage")
-                    if isinstance(usage, dict):
-                        prompt_raw = usage.get("prompt_tokens")
-                        completion_raw = usage.get("completion_tokens")
-                        if isinstance(prompt_raw, int):
-                            usage_prompt_tokens = prompt_raw
-                        if isinstance(completion_raw, int):
-                            usage_completion_tokens = completion_raw
-
-                    yield self._sse_event(chunk)
+                        chunk_id = str(chunk.get("id", default_chunk_id))
+                    created = chunk.get("created")
+                    # Providers send an int "created"; only other types need coercing.
+                    chunk_created = (
+                        created if type(created) is int else coerce_int(created, chunk_created)
+                    )
+                    # Chunks ending a choice or carrying usage are never held back.
+                    chunk_is_barrier = absorb_chunk(chunk)
+                    yield sse_event(chunk), chunk_is_barrier
 
                     chunk_count += 1
-                    if (
-                        self._budget_tracker is not None
-                        and chunk_count % _BUDGET_CHECK_INTERVAL == 0
-                    ):
+                    if budget_tracker is not None and chunk_count % _BUDGET_CHECK_INTERVAL == 0:
                         estimated_running = usage_prompt_tokens + max(
-                            usage_completion_tokens,
-                            len(" ".join(completion_parts).split()),
+                            usage_completion_tokens, completion_word_count
                         )
-                        if not self._budget_tracker.check_running(
-                            tenant_id, estimated_running
-                        ):
+                        if not budget_tracker.check_running(tenant_id, estimated_running):
                             budget_mid_stream_terminated = True
-                            yield self._sse_event(
-                                {
-                                    "id": chunk_id or f"chatcmpl-{uuid4().hex}",
-                                    "object": "chat.completion.chunk",
-                                    "created": chunk_created,
-                                    "model": selected_model,
-                                    "choices": [
-                                        {
-                                            "index": 0,
-                                            "delta": {},
-                                            "finish_reason": "length",
-                                        }
-                                    ],
-                                }
-                            )
-                            yield "data: [DONE]\n\n"
+                            yield _finish_sse_event(
+                                chunk_id or default_chunk_id,
+                                chunk_created,
+                                selected_model,
+                                "length",
+                            ), True
+                            yield _SSE_DONE, True
                             break
 
                 if citations and not saw_citations:
-                    yield self._sse_event(
+                    yield sse_event(
                         {
-                            "id": chunk_id or f"chatcmpl-{uuid4().hex}",
+                            "id": chunk_id or default_chunk_id,
                             "object": "chat.completion.chunk",
                             "created": chunk_created,
                             "model": selected_model,
                             "choices": [
                                 {
                                     "index": 0,
-                                    "delta": {
-                                        "citations": [
-                                            citation.model_dump() for citation in citations
-                                        ]
-                                    },
+                                    "delta": {"citations": citation_dumps},
                                     "finish_reason": None,
                                 }
                             ],
                         }
-                    )
+                    ), True
 
                 if not saw_finish:
-                    yield self._sse_event(
-                        {
-                            "id": chunk_id or f"chatcmpl-{uuid4().hex}",
-                            "object": "chat.completion.chunk",
-                            "created": chunk_created,
-                            "model": selected_model,
-                            "choices": [
-                                {
-                                    "index": 0,
-                                    "delta": {},
-                                    "finish_reason": "stop",
-                                }
-                            ],
-                        }
-                    )
+                    yield _finish_sse_event(
+                        chunk_id or default_chunk_id, chunk_created, selected_model, "stop"
+                    ), True
 
-                yield "data: [DONE]\n\n"
+                yield _SSE_DONE, True
 
             except BaseException as exc:
                 stream_error = exc
@@ -844,16 +1099,14 @@ class ChatService:
                 raise
             finally:
                 if usage_completion_tokens == 0:
-                    usage_completion_tokens = len("".join(completion_parts).split())
+                    usage_completion_tokens = completion_word_count
                 redaction_count = input_redaction_count + output_redaction_count
-                provider_response_hash = self._hash_value(
-                    {
-                        "completion_text": "".join(completion_parts),
-                        "prompt_tokens": usage_prompt_tokens,
-                        "completion_tokens": usage_completion_tokens,
-                        "chunk_id": chunk_id,
-                        "model": selected_model,
-                    }
+                provider_response_hash = self._stream_response_hash(
+                    completion_parts,
+                    prompt_tokens=usage_prompt_tokens,
+                    completion_tokens=usage_completion_tokens,
+                    chunk_id=chunk_id,
+                    model=selected_model,
                 )
 
                 cost_usd = round(
@@ -917,7 +1170,7 @@ class ChatService:
                     redacted_payload_hash=redacted_payload_hash,
                     provider_request_hash=provider_request_hash,
                     provider_response_hash=provider_response_hash,
-                    retrieval_citations=citations,
+                    retrieval_citations=citation_dumps,
                     streaming=True,
                     tokens_in=usage_prompt_tokens,
                     tokens_out=usage_completion_tokens,
@@ -940,7 +1193,7 @@ class ChatService:
                     attributes={"streaming": True, "provider": routed_provider},
                 ):
                     try:
-                        self._audit_writer.write_event(audit_event)
+                        self._persist_audit_event(audit_event)
                     except AuditValidationError as exc:
                         logger.warning(
                             "audit_write_failed_stream",
@@ -951,35 +1204,39 @@ class ChatService:
                             },
                         )
 
-                latency_ms = int((perf_counter() - started) * 1000)
-                logger.info(
-                    "chat_stream_completed",
-                    extra={
-                        "request_id": request_id,
-                        "tenant_id": tenant_id,
-                        "user_id": user_id,
-                        "model": selected_model,
-                        "policy_decision": policy_decision_label,
-                        "redaction_count": redaction_count,
-                        "input_redaction_count": input_redaction_count,
-                        "output_redaction_count": output_redaction_count,
-                        "provider": routed_provider,
-                        "latency_ms": latency_ms,
-                        "token_in": usage_prompt_tokens,
-                        "token_out": usage_completion_tokens,
-                        "cost_usd": cost_usd,
-                        "provider_attempts": provider_attempts,
-                        "fallback_chain": fallback_chain,
-                        "budget_used": budget_summary.get("used") if budget_summary else None,
-                        "budget_remaining": budget_summary.get("remaining")
+                latency_ms = (perf_counter_ns() - started_ns) // 1_000_000
+                if logger.isEnabledFor(logging.INFO):
+                    budget_used, budget_remaining = (
+                        (budget_summary.get("used"), budget_summary.get("remaining"))
                         if budget_summary
-                        else None,
-                        "stream_error": type(stream_error).__name__
-                        if stream_error
-                        else None,
-                        "budget_mid_stream_terminated": budget_mid_stream_terminated,
-                    },
-                )
+                        else (None, None)
+                    )
+                    logger.info(
+                        "chat_stream_completed",
+                        extra={
+                            "request_id": request_id,
+                            "tenant_id": tenant_id,
+                            "user_id": user_id,
+                            "model": selected_model,
+                            "policy_decision": policy_decision_label,
+                            "redaction_count": redaction_count,
+                            "input_redaction_count": input_redaction_count,
+                            "output_redaction_count": output_redaction_count,
+                            "provider": routed_provider,
+                            "latency_ms": latency_ms,
+                            "token_in": usage_prompt_tokens,
+                            "token_out": usage_completion_tokens,
+                            "cost_usd": cost_usd,
+                            "provider_attempts": provider_attempts,
+                            "fallback_chain": fallback_chain,
+                            "budget_used": budget_used,
+                            "budget_remaining": budget_remaining,
+                            "stream_error": type(stream_error).__name__
+                            if stream_error
+                            else None,
+                            "budget_mid_stream_terminated": budget_mid_stream_terminated,
+                        },
+                    )
                 if self._settings.metrics_enabled:
                     record_request(
                         endpoint=endpoint,
@@ -997,17 +1254,22 @@ class ChatService:
                 if inflight_acquired:
                     self._release_inflight(tenant_id)
 
-        return event_stream()
+        frames = event_stream()
+        coalesce_s = self._settings.stream_coalesce_ms / 1000.0
+        max_frames = self._settings.stream_coalesce_max_chunks
+        if coalesce_s > 0 and max_frames > 1:
+            return _coalesce_sse_frames(frames, max_frames, coalesce_s)
+        return _sse_frames(frames)
 
     async def handle_embeddings(
         self, request: Request, payload: EmbeddingsRequest
     ) -> EmbeddingsResponse:
-        started = perf_counter()
+        started_ns = perf_counter_ns()
         request_id = request.state.request_id
         tenant_id = request.state.tenant_id
         user_id = request.state.user_id
         classification = request.state.classification
-        endpoint = str(request.url.path)
+        endpoint: str = request.state.endpoint
         webhook_events: list[dict[str, object]] = []
         budget_summary: dict[str, object] | None = None
         request_payload_hash = self._hash_value(payload.model_dump(exclude_none=True))
@@ -1040,13 +1302,15 @@ class ChatService:
                 )
                 inflight_acquired = True
 
+            # One estimate feeds both the policy input and the budget pre-check.
+            estimated_tokens = self._cheap_token_estimate(raw_inputs)
             policy_input = {
                 "tenant_id": tenant_id,
                 "user_id": user_id,
                 "endpoint": endpoint,
                 "requested_model": payload.model,
                 "classification": classification,
-                "estimated_tokens": sum(len(item.split()) for item in raw_inputs),
+                "estimated_tokens": estimated_tokens,
                 "connector_targets": [],
                 "request_metadata": {"request_id": request_id},
             }
@@ -1092,7 +1356,7 @@ class ChatService:
                 if transform.type == "override_model":
                     selected_model = str(transform.args.get("model", selected_model))
             self._validate_model_constraints(decision, selected_model)
-            allowed_provider_names = self._allowed_providers(decision)
+            allowed_provider_names = decision.allowed_provider_names
 
             inputs = list(raw_inputs)
             input_redaction_count = 0
@@ -1102,18 +1366,14 @@ class ChatService:
                     operation="redaction.scan",
                     attributes={"direction": "request", "operation_type": "embeddings"},
                 ):
-                    redaction_result = self._redaction_engine.redact_messages(
-                        [{"role": "user", "content": text} for text in inputs]
-                    )
-                    inputs = [item["content"] for item in redaction_result.messages]
-                    input_redaction_count = redaction_result.redaction_count
+                    inputs, input_redaction_count = await self._redact_inputs(inputs)
             redaction_count = input_redaction_count
-            redacted_payload_hash = self._hash_value(inputs)
+            inputs_json = self._canonical_json(inputs)
+            redacted_payload_hash = self._hash_canonical(inputs_json)
 
-            requested_budget_tokens = max(sum(len(item.split()) for item in inputs), 1)
             budget_summary = self._enforce_budget_or_deny(
                 tenant_id=tenant_id,
-                requested_tokens=requested_budget_tokens,
+                requested_tokens=max(estimated_tokens, 1),
                 request_id=request_id,
                 user_id=user_id,
                 endpoint=endpoint,
@@ -1128,11 +1388,8 @@ class ChatService:
             routed_provider = self._settings.provider_name
             provider_attempts = 1
             fallback_chain: list[str] = [routed_provider]
-            provider_request_hash = self._hash_value(
-                {
-                    "model": selected_model,
-                    "inputs": inputs,
-                }
+            provider_request_hash = self._provider_hash_from_canonical(
+                {"model": self._canonical_json(selected_model), "inputs": inputs_json}
             )
 
             with self._span(
@@ -1178,7 +1435,7 @@ class ChatService:
                     raise self._app_error_from_provider_error(exc) from exc
 
             response = EmbeddingsResponse.model_validate(provider_result)
-            provider_response_hash = self._hash_value(provider_result)
+            provider_response_hash = self._provider_hash(provider_result)
 
             tokens_in = response.usage.prompt_tokens
             tokens_out = 0
@@ -1252,33 +1509,37 @@ class ChatService:
                 attributes={"streaming": False, "provider": routed_provider},
             ):
                 try:
-                    self._audit_writer.write_event(audit_event)
+                    await self._persist_audit_event_off_loop(audit_event)
                 except AuditValidationError as exc:
                     raise AppError(
                         502, "audit_write_failed", "provider", "Failed to persist audit event"
                     ) from exc
 
-            latency_ms = int((perf_counter() - started) * 1000)
-            logger.info(
-                "embeddings_completed",
-                extra={
-                    "request_id": request_id,
-                    "tenant_id": tenant_id,
-                    "user_id": user_id,
-                    "model": selected_model,
-                    "policy_decision": policy_decision_label,
-                    "redaction_count": redaction_count,
-                    "provider": routed_provider,
-                    "latency_ms": latency_ms,
-                    "token_in": tokens_in,
-                    "token_out": tokens_out,
-                    "cost_usd": cost_usd,
-                    "budget_used": budget_summary.get("used") if budget_summary else None,
-                    "budget_remaining": budget_summary.get("remaining")
+            latency_ms = (perf_counter_ns() - started_ns) // 1_000_000
+            if logger.isEnabledFor(logging.INFO):
+                budget_used, budget_remaining = (
+                    (budget_summary.get("used"), budget_summary.get("remaining"))
                     if budget_summary
-                    else None,
-                },
-            )
+                    else (None, None)
+                )
+                logger.info(
+                    "embeddings_completed",
+                    extra={
+                        "request_id": request_id,
+                        "tenant_id": tenant_id,
+                        "user_id": user_id,
+                        "model": selected_model,
+                        "policy_decision": policy_decision_label,
+                        "redaction_count": redaction_count,
+                        "provider": routed_provider,
+                        "latency_ms": latency_ms,
+                        "token_in": tokens_in,
+                        "token_out": tokens_out,
+                        "cost_usd": cost_usd,
+                        "budget_used": budget_used,
+                        "budget_remaining": budget_remaining,
+                    },
+                )
             if self._settings.metrics_enabled:
                 record_request(
                     endpoint=endpoint,
@@ -1355,13 +1616,76 @@ class ChatService:
         attributes: dict[str, object] | None = None,
     ) -> Any:
         if self._span_collector is None:
-            return _NoopSpan()
+            return _NOOP_SPAN
         return self._span_collector.span(
             trace_id=trace_id,
             operation=operation,
             attributes=attributes,
         )
 
+    def _enqueue_audit_event(self, event: dict[str, object]) -> bool:
+        if self._audit_queue is None:
+            return False
+        if self._audit_queue.submit(event):
+            return True
+        if self._settings.metrics_enabled:
+            inc_counter("srg_audit_queue_full_total", {})
+        return False
+
+    def _persist_audit_event(self, event: dict[str, object]) -> None:
+        if not self._enqueue_audit_event(event):
+            self._audit_writer.write_event(event)
+
+    async def _persist_audit_event_off_loop(self, event: dict[str, object]) -> None:
+        """Like ``_persist_audit_event``, with the synchronous write in a worker thread.
+
+        Schema validation, hashing and the append then run off the event loop.
+        The write is shielded so a cancelled request still records its event.
+        Not for the streaming ``finally``, where an await could be cancelled
+        before the rest of the cleanup runs.
+        """
+        if not self._enqueue_audit_event(event):
+            await asyncio.shield(asyncio.to_thread(self._audit_writer.write_event, event))
+
+    async def _redact_messages(self, messages: list[dict[str, str]]) -> RedactionResult:
+        # Large payloads are scanned in a worker thread so the regex pass does
+        # not stall the event loop; streamed chunks stay inline.
+        if sum(len(message["content"]) for message in messages) < _REDACTION_OFFLOAD_MIN_CHARS:
+            return self._redaction_engine.redact_messages(messages)
+        return await asyncio.to_thread(self._redaction_engine.redact_messages, messages)
+
+    async def _redact_inputs(self, inputs: list[str]) -> tuple[list[str], int]:
+        """Redact embeddings inputs; returns the redacted texts and the hit count.
+
+        Scans the strings directly instead of wrapping each one as a message,
+        and moves the whole batch to one worker thread when it is large.
+        """
+        redact_text = self._redaction_engine.redact_text
+
+        def _scan() -> tuple[list[str], int]:
+            results = [redact_text(text) for text in inputs]
+            return [result.text for result in results], sum(
+                result.redaction_count for result in results
+            )
+
+        if sum(len(text) for text in inputs) < _REDACTION_OFFLOAD_MIN_CHARS:
+            return _scan()
+        return await asyncio.to_thread(_scan)
+
+    async def _redact_text(self, text: str) -> TextRedactionResult:
+        if len(text) < _REDACTION_OFFLOAD_MIN_CHARS:
+            return self._redaction_engine.redact_text(text)
+        return await asyncio.to_thread(self._redaction_engine.redact_text, text)
+
+    @staticmethod
+    def _cheap_token_estimate(texts: Iterable[str]) -> int:
+        """Approximate token count at ~4 characters per token.
+
+        Only an estimate for policy input and stream usage fallbacks; provider
+        ``usage`` stays authoritative when it is reported.
+        """
+        return sum((len(text) + 3) // 4 for text in texts)
+
     @staticmethod
     def _estimate_requested_tokens(
         messages: list[dict[str, str]],
@@ -1442,7 +1766,7 @@ class ChatService:
             return None
 
         try:
-            self._budget_tracker.check(tenant_id, requested_tokens)
+            checked_summary = self._budget_tracker.check(tenant_id, requested_tokens)
         except BudgetBackendError as exc:
             raise AppError(
                 503,
@@ -1504,6 +1828,8 @@ class ChatService:
                 ),
             ) from exc
 
+        if checked_summary is not None:
+            return checked_summary
         try:
             return self._budget_tracker.summary(tenant_id)
         except BudgetBackendError as exc:
@@ -1523,7 +1849,9 @@ class ChatService:
         if self._budget_tracker is None:
             return current_summary
         try:
-            self._budget_tracker.record(tenant_id, used_tokens)
+            recorded_summary = self._budget_tracker.record(tenant_id, used_tokens)
+            if recorded_summary is not None:
+                return recorded_summary
             return self._budget_tracker.summary(tenant_id)
         except BudgetBackendError as exc:
             logger.warning(
@@ -1549,11 +1877,11 @@ class ChatService:
         webhook_events: list[dict[str, object]] | None = None,
     ) -> None:
         decision = PolicyDecision(
-            decision_id=f"overload-{uuid4()}",
+            decision_id=f"overload-{token_hex(16)}",
             allow=False,
             deny_reason="overload_shed",
             policy_hash="runtime-overload",
-            evaluated_at=datetime.now(UTC).isoformat(),
+            evaluated_at=_iso_now_ms(),
             transforms=[],
         )
         event = self._build_audit_event(
@@ -1581,8 +1909,8 @@ class ChatService:
             trace_id=request_id,
             webhook_events=webhook_events,
             overload_shed_reason=reason,
+            deny_reason="overload_shed",
         )
-        event["deny_reason"] = "overload_shed"
         try:
             self._audit_writer.write_event(event)
         except AuditValidationError as exc:
@@ -1614,6 +1942,18 @@ class ChatService:
         if webhook_events is not None:
             webhook_events.append(summary)
 
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(
+                "webhook_dispatch_skipped",
+                extra={"event_type": event_type.value, "reason": "no_running_loop"},
+            )
+            return
+        if self._webhook_batcher is not None:
+            self._webhook_batcher.enqueue(event_type, payload, summary)
+            return
+
         async def _dispatch() -> None:
             try:
                 results = await dispatcher.dispatch(event_type, payload)
@@ -1628,21 +1968,31 @@ class ChatService:
                 return
             summary["delivery_success_count"] = sum(1 for result in results if result.success)
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            logger.warning(
-                "webhook_dispatch_skipped",
-                extra={"event_type": event_type.value, "reason": "no_running_loop"},
-            )
-            return
-        loop.create_task(_dispatch())
+        task = loop.create_task(_dispatch())
+        self._webhook_tasks.add(task)
+        task.add_done_callback(self._webhook_tasks.discard)
 
     def _resolve_policy_decision(
         self, policy_input: dict[str, object], request_id: str
     ) -> PolicyDecision:
+        policy_cache = self._policy_cache
+        cache_key = ""
+        if policy_cache is not None:
+            cache_key = self._policy_cache_key(policy_input)
+            cached = policy_cache.get(cache_key)
+            if cached is not None:
+                # A marked copy keeps OPA's decision id and evaluation time while
+                # letting the audit trail tell cached decisions apart.
+                return replace(cached, cache_hit=True)
         try:
-            return self._policy_client.evaluate(policy_input)
+            decision = self._policy_client.evaluate(policy_input)
+            if policy_cache is not None:
+                # A new policy bundle invalidates every decision made under the old one.
+                if decision.policy_hash != self._policy_cache_hash:
+                    policy_cache.clear()
+                    self._policy_cache_hash = decision.policy_hash
+                policy_cache.put(cache_key, decision)
+            return decision
         except PolicyTimeoutError as exc:
             if self._settings.opa_mode == "observe":
                 return self._observe_mode_decision(request_id, f"policy_timeout:{exc}")
@@ -1664,11 +2014,11 @@ class ChatService:
             extra={"request_id": request_id, "policy_decision": "observe"},
         )
         return PolicyDecision(
-            decision_id=f"observe-{uuid4()}",
+            decision_id=f"observe-{token_hex(16)}",
             allow=True,
             deny_reason=reason,
             policy_hash="observe-mode",
-            evaluated_at=datetime.now(UTC).isoformat(),
+            evaluated_at=_iso_now_ms(),
             transforms=[],
         )
 
@@ -1681,28 +2031,6 @@ class ChatService:
             return "transform"
         return "allow"
 
-    @staticmethod
-    def _allowed_providers(decision: PolicyDecision) -> set[str] | None:
-        constraints = decision.provider_constraints
-        if not isinstance(constraints, dict):
-            return None
-
-        raw_allowed = constraints.get("allowed_providers")
-        if not isinstance(raw_allowed, list):
-            return None
-        return {str(item) for item in raw_allowed if str(item).strip()}
-
-    @staticmethod
-    def _allowed_models(decision: PolicyDecision) -> set[str] | None:
-        constraints = decision.provider_constraints
-        if not isinstance(constraints, dict):
-            return None
-
-        raw_allowed = constraints.get("allowed_models")
-        if not isinstance(raw_allowed, list):
-            return None
-        return {str(item) for item in raw_allowed if str(item).strip()}
-
     def _validate_direct_provider_constraints(
         self, allowed_provider_names: set[str] | None
     ) -> None:
@@ -1718,7 +2046,7 @@ class ChatService:
         )
 
     def _validate_model_constraints(self, decision: PolicyDecision, model: str) -> None:
-        allowed_models = self._allowed_models(decision)
+        allowed_models = decision.allowed_model_names
         if allowed_models is None:
             return
         if model in allowed_models:
@@ -1746,7 +2074,7 @@ class ChatService:
         redacted_payload_hash: str,
         provider_request_hash: str | None,
         provider_response_hash: str | None,
-        retrieval_citations: list[Citation] | None,
+        retrieval_citations: list[Citation] | list[dict[str, Any]] | None,
         streaming: bool,
         tokens_in: int,
         tokens_out: int,
@@ -1759,7 +2087,9 @@ class ChatService:
         input_redaction_count: int | None = None,
         output_redaction_count: int | None = None,
         overload_shed_reason: str | None = None,
+        deny_reason: str | None = None,
     ) -> dict[str, object]:
+        """Assemble the audit event; ``deny_reason`` overrides the decision's."""
         event: dict[str, object] = {
             "request_id": request_id,
             "tenant_id": tenant_id,
@@ -1803,10 +2133,14 @@ class ChatService:
             event["output_redaction_count"] = output_redaction_count
         if overload_shed_reason is not None:
             event["overload_shed_reason"] = overload_shed_reason
-        if decision.deny_reason is not None:
-            event["deny_reason"] = decision.deny_reason
+        if deny_reason is None:
+            deny_reason = decision.deny_reason
+        if deny_reason is not None:
+            event["deny_reason"] = deny_reason
         if decision.provider_constraints is not None:
             event["provider_constraints"] = decision.provider_constraints
+        if decision.cache_hit:
+            event["policy_cache_hit"] = True
         if decision.connector_constraints is not None:
             event["connector_constraints"] = {
                 "allowed_connectors": decision.connector_constraints.allowed_connectors
@@ -1853,8 +2187,8 @@ class ChatService:
             trace_id=trace_id,
             budget=budget,
             webhook_events=webhook_events,
+            deny_reason=reason,
         )
-        event["deny_reason"] = reason
         try:
             self._audit_writer.write_event(event)
         except AuditValidationError as exc:
@@ -1907,8 +2241,8 @@ class ChatService:
             trace_id=trace_id,
             budget=budget,
             webhook_events=webhook_events,
+            deny_reason="budget_exceeded",
         )
-        event["deny_reason"] = "budget_exceeded"
         try:
             self._audit_writer.write_event(event)
         except AuditValidationError as exc:
@@ -1921,16 +2255,10 @@ class ChatService:
             )
 
     def _allowed_connectors(self, decision: PolicyDecision) -> set[str] | None:
-        if (
-            decision.connector_constraints is not None
-            and decision.connector_constraints.allowed_connectors is not None
-        ):
-            return set(decision.connector_constraints.allowed_connectors)
-        if self._settings.rag_allowed_connector_set:
-            return set(self._settings.rag_allowed_connector_set)
-        return None
-
-    def _retrieve_chunks(
+        allowed = decision.allowed_connector_names
+        return self._default_allowed_connectors if allowed is None else allowed
+
+    async def _retrieve_chunks(
         self,
         retrieval_request: RetrievalRequest,
         decision: PolicyDecision,
@@ -1943,25 +2271,86 @@ class ChatService:
                 "Retrieval orchestrator is not configured",
             )
 
+        # Connectors do blocking I/O (and throttle back-off), so retrieval runs
+        # off the event loop.
         try:
-            return self._retrieval_orchestrator.retrieve(
+            return await asyncio.to_thread(
+                self._retrieval_orchestrator.retrieve,
                 request=retrieval_request,
                 allowed_connectors=self._allowed_connectors(decision),
             )
-        except RetrievalDeniedError as exc:
-            raise AppError(
-                403,
-                "retrieval_forbidden",
-                "policy",
-                str(exc),
-            ) from exc
-        except ConnectorNotFoundError as exc:
-            raise AppError(
-                422,
-                "connector_not_found",
-                "validation",
-                f"Connector not configured: {exc}",
-            ) from exc
+        except (RetrievalDeniedError, ConnectorNotFoundError) as exc:
+            raise self._retrieval_app_error(exc) from exc
+
+    def _start_retrieval_prefetch(
+        self, payload: ChatCompletionRequest
+    ) -> asyncio.Task[list[DocumentChunk]] | None:
+        if not self._settings.rag_prefetch_enabled or self._retrieval_orchestrator is None:
+            return None
+        # Connectors outside the static allow-list are never queried ahead of
+        # the policy decision; they go through the regular retrieval path.
+        retrieval_request = self._retrieval_request(payload)
+        allowed_connectors = self._default_allowed_connectors
+        if allowed_connectors is not None and retrieval_request.connector not in allowed_connectors:
+            return None
+        # The decision's own allow-list is checked by _prefetched_chunks before
+        # any prefetched chunk is used.
+        task = asyncio.create_task(
+            asyncio.to_thread(
+                self._retrieval_orchestrator.retrieve,
+                request=retrieval_request,
+                allowed_connectors=allowed_connectors,
+            )
+        )
+        task.add_done_callback(_consume_task_exception)
+        return task
+
+    @staticmethod
+    def _abandon_retrieval_prefetch(task: asyncio.Task[list[DocumentChunk]] | None) -> None:
+        # Requests that never reach _prefetched_chunks (policy deny, errors)
+        # drop the prefetch so its result is discarded.
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def _prefetched_chunks(
+        self,
+        task: asyncio.Task[list[DocumentChunk]],
+        retrieval_request: RetrievalRequest,
+        decision: PolicyDecision,
+    ) -> list[DocumentChunk]:
+        allowed_connectors = self._allowed_connectors(decision)
+        try:
+            if (
+                allowed_connectors is not None
+                and retrieval_request.connector not in allowed_connectors
+            ):
+                task.cancel()
+                raise RetrievalDeniedError(
+                    f"connector '{retrieval_request.connector}' is not allowed"
+                )
+            return await task
+        except (RetrievalDeniedError, ConnectorNotFoundError) as exc:
+            raise self._retrieval_app_error(exc) from exc
+
+    @staticmethod
+    def _retrieval_app_error(exc: RetrievalDeniedError | ConnectorNotFoundError) -> AppError:
+        if isinstance(exc, RetrievalDeniedError):
+            return AppError(403, "retrieval_forbidden", "policy", str(exc))
+        return AppError(
+            422,
+            "connector_not_found",
+            "validation",
+            f"Connector not configured: {exc}",
+        )
+
+    def _retrieval_request(self, payload: ChatCompletionRequest) -> RetrievalRequest:
+        rag = payload.rag
+        return RetrievalRequest(
+            query=self._last_user_message(payload),
+            connector=rag.connector if rag else "",
+            k=rag.top_k if rag else 0,
+            filters=(rag.filters if rag else None) or {},
+        )
 
     @staticmethod
     def _last_user_message(payload: ChatCompletionRequest) -> str:
@@ -1972,18 +2361,21 @@ class ChatService:
 
     @staticmethod
     def _build_retrieval_context(chunks: list[DocumentChunk]) -> str:
-        lines = [f"[{chunk.chunk_id}] {chunk.text}" for chunk in chunks]
-        return "Retrieved context chunks:\n" + "\n".join(lines)
+        # One join over header and fragments; no intermediate body string.
+        return "\n".join(
+            ["Retrieved context chunks:", *(f"[{chunk.chunk_id}] {chunk.text}" for chunk in chunks)]
+        )
 
     @staticmethod
     def _citations_from_chunks(chunks: list[DocumentChunk]) -> list[Citation]:
+        # DocumentChunk fields are already typed, so validation is skipped.
         return [
-            Citation(
+            Citation.model_construct(
                 source_id=chunk.source_id,
                 connector=chunk.connector,
                 uri=chunk.uri,
                 chunk_id=chunk.chunk_id,
-                score=chunk.score,
+                score=float(chunk.score),
             )
             for chunk in chunks
         ]
@@ -2001,16 +2393,106 @@ class ChatService:
                 return default
         return default
 
+    @classmethod
+    def _without_none(cls, value: Any) -> Any:
+        """Drop ``None`` entries recursively, matching ``model_dump(exclude_none=True)``."""
+        if isinstance(value, dict):
+            return {
+                key: cls._without_none(item) for key, item in value.items() if item is not None
+            }
+        if isinstance(value, list):
+            return [cls._without_none(item) for item in value]
+        return value
+
+    @staticmethod
+    def _policy_cache_key(policy_input: dict[str, object]) -> str:
+        # request_metadata carries the per-request id and must not split the key.
+        keyed = {key: value for key, value in policy_input.items() if key != "request_metadata"}
+        return blake2b(dumps_json(keyed, sort_keys=True), digest_size=16).hexdigest()
+
+    def _hash_value(self, value: object) -> str:
+        return self._hash_canonical(self._canonical_json(value))
+
+    def _hash_canonical(self, canonical: str) -> str:
+        hasher = self._payload_hasher()
+        hasher.update(canonical.encode("utf-8"))
+        return str(hasher.hexdigest())
+
     @staticmethod
-    def _hash_value(value: object) -> str:
-        canonical = json_mod.dumps(
-            value,
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=True,
+    def _canonical_json(value: object) -> str:
+        # Stays on stdlib json: the canonical bytes must match existing audit
+        # records regardless of whether orjson is installed.
+        return _CANONICAL_ENCODER.encode(value)
+
+    def _provider_hash(self, value: object) -> str | None:
+        # Provider request/response fingerprints are optional in the audit schema.
+        if not self._settings.audit_provider_hashes_enabled:
+            return None
+        return self._hash_value(value)
+
+    def _provider_hash_from_canonical(self, fields: dict[str, str]) -> str | None:
+        """Like ``_provider_hash`` for an object whose values are canonical JSON.
+
+        Produces the same digest as hashing the decoded object, so callers can
+        splice in a member (e.g. messages) that was already serialized.
+        """
+        if not self._settings.audit_provider_hashes_enabled:
+            return None
+        return self._hash_canonical(self._splice_canonical(fields))
+
+    @staticmethod
+    def _splice_canonical(fields: dict[str, str]) -> str:
+        members = ",".join(
+            f"{json_mod.dumps(key)}:{value}" for key, value in sorted(fields.items())
+        )
+        return f"{{{members}}}"
+
+    def _request_hash_parts(self, request_dump: dict[str, Any]) -> tuple[str, Any, str]:
+        """Hash the request and keep its canonical messages for reuse.
+
+        Returns the request payload hash (as ``_hash_value`` of the
+        exclude-none dump), the exclude-none messages and their canonical JSON.
+        """
+        request_fields = self._without_none(request_dump)
+        request_messages = request_fields["messages"]
+        messages_json = self._canonical_json(request_messages)
+        canonical = self._splice_canonical(
+            {
+                key: messages_json if key == "messages" else self._canonical_json(value)
+                for key, value in request_fields.items()
+            }
+        )
+        return self._hash_canonical(canonical), request_messages, messages_json
+
+    def _stream_response_hash(
+        self,
+        completion_parts: list[str],
+        prompt_tokens: int,
+        completion_tokens: int,
+        chunk_id: str,
+        model: str,
+    ) -> str | None:
+        """``_provider_hash`` of the streamed completion without joining it.
+
+        ASCII-escaped JSON strings concatenate, so each delta is escaped and fed
+        to the hasher on its own; the digest matches hashing the full object.
+        """
+        if not self._settings.audit_provider_hashes_enabled:
+            return None
+        hasher = self._payload_hasher()
+        hasher.update(
+            f'{{"chunk_id":{json_mod.dumps(chunk_id)},"completion_text":"'.encode("ascii")
+        )
+        for part in completion_parts:
+            hasher.update(json_mod.dumps(part)[1:-1].encode("ascii"))
+        hasher.update(
+            (
+                f'","completion_tokens":{completion_tokens},'
+                f'"model":{json_mod.dumps(model)},"prompt_tokens":{prompt_tokens}}}'
+            ).encode("ascii")
         )
-        return sha256(canonical.encode("utf-8")).hexdigest()
+        return str(hasher.hexdigest())
 
     @staticmethod
-    def _sse_event(payload: dict[str, object]) -> str:
-        return f"data: {json_mod.dumps(payload, separators=(',', ':'))}\n\n"
+    def _sse_event(payload: dict[str, object]) -> bytes:
+        return b"".join((_SSE_PREFIX, dumps_json(payload), _SSE_SUFFIX))
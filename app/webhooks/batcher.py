@@ -0,0 +1,114 @@
+"""Coalesces webhook events into batched deliveries.
+
+Buffered events are flushed with ``WebhookDispatcher.dispatch_batch`` once
+``max_batch_size`` events are pending or ``flush_interval_s`` has passed since
+the first one arrived, so a burst of events costs one POST per endpoint
+rather than one per event.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from app.metrics import inc_counter
+from app.webhooks.dispatcher import WebhookDispatcher, WebhookEventType
+
+logger = logging.getLogger("srg.webhooks")
+
+
+@dataclass(slots=True)
+class _PendingEvent:
+    event_type: WebhookEventType
+    payload: dict[str, Any]
+    summary: dict[str, object] | None
+
+
+class WebhookBatcher:
+    """Size- and time-bounded buffer in front of a ``WebhookDispatcher``.
+
+    ``enqueue`` must be called from a running event loop; flushes run as
+    background tasks on that loop. At most ``max_pending`` events are held,
+    and events arriving beyond that are dropped and counted. When a summary
+    dict is given, its ``delivery_success_count`` is filled in once the
+    batch carrying the event has been delivered.
+    """
+
+    def __init__(
+        self,
+        dispatcher: WebhookDispatcher,
+        max_batch_size: int = 50,
+        flush_interval_s: float = 5.0,
+        max_pending: int = 1000,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._max_batch_size = max(max_batch_size, 1)
+        self._flush_interval_s = max(flush_interval_s, 0.0)
+        self._max_pending = max(max_pending, 1)
+        self._pending: list[_PendingEvent] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def enqueue(
+        self,
+        event_type: WebhookEventType,
+        payload: dict[str, Any],
+        summary: dict[str, object] | None = None,
+    ) -> bool:
+        """Buffer an event; return False when it was dropped."""
+        if len(self._pending) >= self._max_pending:
+            inc_counter(
+                "srg_webhook_batch_dropped_total",
+                {"event_type": event_type.value},
+                1.0,
+            )
+            return False
+        self._pending.append(_PendingEvent(event_type, payload, summary))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._flush_interval_s, self._flush_pending
+            )
+        return True
+
+    async def flush(self) -> None:
+        """Send everything buffered and wait for in-flight batches."""
+        self._flush_pending()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[_PendingEvent]) -> None:
+        try:
+            results = await self._dispatcher.dispatch_batch(
+                [(item.event_type, item.payload) for item in batch]
+            )
+        except Exception as exc:  # pragma: no cover - defensive runtime guard
+            logger.warning(
+                "webhook_batch_dispatch_failed",
+                extra={"event_count": len(batch), "error": str(exc)},
+            )
+            return
+        success_counts = [0] * len(batch)
+        for result in results:
+            if result.success:
+                for index in result.event_indexes:
+                    success_counts[index] += 1
+        for item, count in zip(batch, success_counts, strict=True):
+            if item.summary is not None:
+                item.summary["delivery_success_count"] = count
@@ -18,6 +18,9 @@ Webhook payload is a JSON envelope:
         "payload": { ... audit event fields ... }
     }
 
+When batching is enabled the events are grouped under an ``events``
+list instead (see ``WebhookDispatcher.dispatch_batch``).
+
 Signature verification: each POST includes an ``X-SRG-Signature``
 header containing an HMAC-SHA256 of the JSON body, keyed by the
 webhook secret.
@@ -44,6 +47,7 @@ from app.webhooks.dead_letter_store import DeadLetterStore, create_dead_letter_s
 logger = logging.getLogger("srg.webhooks")
 
 GATEWAY_VERSION = "0.5.0"
+BATCH_EVENT_TYPE = "batch"
 
 
 class WebhookEventType(Enum):
@@ -55,6 +59,16 @@ class WebhookEventType(Enum):
     PROVIDER_ERROR = "provider_error"
 
 
+def _envelope(event_type: WebhookEventType, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "event_id": f"evt-{uuid4().hex}",
+        "event_type": event_type.value,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "gateway_version": GATEWAY_VERSION,
+        "payload": payload,
+    }
+
+
 @dataclass(frozen=True)
 class WebhookEndpoint:
     """A registered webhook receiver."""
@@ -77,6 +91,8 @@ class WebhookDeliveryResult:
     duration_ms: float = 0.0
     attempt_count: int = 1
     idempotency_key: str = ""
+    # Positions in the ``dispatch_batch`` input carried by this delivery.
+    event_indexes: tuple[int, ...] = ()
 
 
 class WebhookDispatcher:
@@ -145,13 +161,7 @@ class WebhookDispatcher:
         Returns a list of delivery results (one per endpoint).
         """
         results: list[WebhookDeliveryResult] = []
-        envelope = {
-            "event_id": f"evt-{uuid4().hex}",
-            "event_type": event_type.value,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "gateway_version": GATEWAY_VERSION,
-            "payload": payload,
-        }
+        envelope = _envelope(event_type, payload)
         body = json.dumps(envelope, separators=(",", ":"), ensure_ascii=True)
 
         for endpoint in self._endpoints:
@@ -177,6 +187,64 @@ class WebhookDispatcher:
 
         return results
 
+    async def dispatch_batch(
+        self,
+        events: list[tuple[WebhookEventType, dict[str, Any]]],
+    ) -> list[WebhookDeliveryResult]:
+        """Dispatch several events with one POST per subscribed endpoint.
+
+        Each endpoint receives only the events it subscribes to, wrapped as
+
+            {"batch_id": ..., "event_type": "batch", "timestamp": ...,
+             "gateway_version": ..., "events": [<envelope>, ...]}
+
+        where every item is the envelope ``dispatch`` would have sent. The
+        body is signed and dead-lettered like a single event. Each result's
+        ``event_indexes`` lists the positions of ``events`` it carried.
+        """
+        results: list[WebhookDeliveryResult] = []
+        if not events:
+            return results
+        envelopes = [_envelope(event_type, payload) for event_type, payload in events]
+        timestamp = datetime.now(UTC).isoformat()
+
+        for endpoint in self._endpoints:
+            if not endpoint.enabled:
+                continue
+            indexes = tuple(
+                index
+                for index, (event_type, _) in enumerate(events)
+                if event_type in endpoint.event_types
+            )
+            if not indexes:
+                continue
+
+            batch = {
+                "batch_id": f"batch-{uuid4().hex}",
+                "event_type": BATCH_EVENT_TYPE,
+                "timestamp": timestamp,
+                "gateway_version": GATEWAY_VERSION,
+                "events": [envelopes[index] for index in indexes],
+            }
+            body = json.dumps(batch, separators=(",", ":"), ensure_ascii=True)
+            result = await self._deliver(
+                endpoint=endpoint,
+                body=body,
+                event_type=BATCH_EVENT_TYPE,
+            )
+            result.event_indexes = indexes
+            if not result.success:
+                self._write_dead_letter(
+                    endpoint=endpoint,
+                    event_type=BATCH_EVENT_TYPE,
+                    body=body,
+                    result=result,
+                )
+            results.append(result)
+            self._record_delivery(result)
+
+        return results
+
     async def _deliver(
         self,
         endpoint: WebhookEndpoint,
@@ -206,6 +206,12 @@ def main() -> None:
         default="hash",
         help="Embedding source for pgvector indexing",
     )
+    parser.add_argument(
+        "--hash-algo",
+        choices=["sha256", "blake2b"],
+        default="sha256",
+        help="Token digest for source=hash (must match SRG_RAG_EMBEDDING_HASH_ALGO)",
+    )
     parser.add_argument(
         "--embedding-endpoint",
         default="http://127.0.0.1:8000/v1/embeddings",
@@ -257,7 +263,9 @@ def main() -> None:
             classification=args.embedding_classification or None,
         )
     else:
-        embedding_generator = HashEmbeddingGenerator(embedding_dim=args.embedding_dim)
+        embedding_generator = HashEmbeddingGenerator(
+            embedding_dim=args.embedding_dim, hash_algo=args.hash_algo
+        )
 
     count = ingest_to_postgres(
         input_dir=input_dir,
@@ -1,4 +1,10 @@
 import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.config.settings import clear_settings_cache
+from app.main import create_app
 
 
 def test_chat_endpoint_success(client, auth_headers) -> None:
@@ -49,3 +55,48 @@ def test_chat_endpoint_audit_contains_policy_explainability(client, auth_headers
     assert payload["policy_decision_id"]
     assert payload["policy_evaluated_at"]
     assert payload["policy_mode"] in {"enforce", "observe"}
+
+
+def test_chat_endpoint_background_audit_flushes_on_shutdown(
+    monkeypatch, tmp_path: Path, auth_headers
+) -> None:
+    log_path = tmp_path / "events.jsonl"
+    monkeypatch.setenv("SRG_API_KEYS", "test-key")
+    monkeypatch.setenv("SRG_AUDIT_LOG_PATH", str(log_path))
+    monkeypatch.setenv("SRG_OPA_SIMULATE_TIMEOUT", "false")
+    monkeypatch.setenv("SRG_AUDIT_ASYNC_ENABLED", "true")
+    clear_settings_cache()
+    request_ids: list[str] = []
+    with TestClient(create_app()) as client:
+        for _ in range(3):
+            response = client.post(
+                "/v1/chat/completions",
+                headers=auth_headers,
+                json={"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]},
+            )
+            assert response.status_code == 200
+            request_ids.append(response.headers["x-request-id"])
+
+    rows = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["request_id"] for row in rows] == request_ids
+
+
+def test_chat_endpoint_hyperscan_redaction_option(
+    monkeypatch, tmp_path: Path, auth_headers
+) -> None:
+    monkeypatch.setenv("SRG_API_KEYS", "test-key")
+    monkeypatch.setenv("SRG_AUDIT_LOG_PATH", str(tmp_path / "events.jsonl"))
+    monkeypatch.setenv("SRG_OPA_SIMULATE_TIMEOUT", "false")
+    monkeypatch.setenv("SRG_REDACTION_HYPERSCAN_ENABLED", "true")
+    clear_settings_cache()
+    client = TestClient(create_app())
+    response = client.post(
+        "/v1/chat/completions",
+        headers=auth_headers,
+        json={
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": "patient MRN 12345678"}],
+        },
+    )
+    assert response.status_code == 200
+    assert "12345678" not in response.json()["choices"][0]["message"]["content"]
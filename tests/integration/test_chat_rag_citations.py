@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.config.settings import clear_settings_cache
@@ -19,10 +20,14 @@ def write_index(path: Path) -> None:
     path.write_text(json.dumps(row) + "\n", encoding="utf-8")
 
 
-def test_chat_rag_includes_citations(monkeypatch, tmp_path: Path, auth_headers) -> None:
+@pytest.mark.parametrize("prefetch", ["false", "true"])
+def test_chat_rag_includes_citations(
+    monkeypatch, tmp_path: Path, auth_headers, prefetch: str
+) -> None:
     index_path = tmp_path / "index.jsonl"
     write_index(index_path)
 
+    monkeypatch.setenv("SRG_RAG_PREFETCH_ENABLED", prefetch)
     monkeypatch.setenv("SRG_API_KEYS", "test-key")
     monkeypatch.setenv("SRG_AUDIT_LOG_PATH", str(tmp_path / "events.jsonl"))
     monkeypatch.setenv("SRG_RAG_FILESYSTEM_INDEX_PATH", str(index_path))
@@ -106,3 +106,12 @@ def test_streaming_mid_stream_budget_termination(monkeypatch, tmp_path: Path) ->
     stream_events = [e for e in events if e.get("streaming") is True]
     assert stream_events
     assert stream_events[-1].get("budget_mid_stream_terminated") is True
+
+    # Without a usage chunk, tokens_out falls back to the streamed word count,
+    # counting words split across deltas once.
+    streamed_text = "".join(
+        choice["delta"].get("content") or ""
+        for chunk in data_lines
+        for choice in chunk.get("choices", [])
+    )
+    assert stream_events[-1]["tokens_out"] == len(streamed_text.split())
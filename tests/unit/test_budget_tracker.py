@@ -21,6 +21,15 @@ def test_budget_tracker_records_and_reports_usage() -> None:
     assert summary["remaining"] == 70
 
 
+def test_budget_tracker_check_and_record_return_summaries() -> None:
+    tracker = TokenBudgetTracker(default_ceiling=100, window_seconds=3600)
+    assert tracker.check("tenant-a", 20) == tracker.summary("tenant-a")
+    recorded = tracker.record("tenant-a", 20)
+    assert recorded == tracker.summary("tenant-a")
+    assert recorded["used"] == 20
+    assert recorded["utilization_pct"] == 20.0
+
+
 def test_budget_tracker_enforces_ceiling() -> None:
     tracker = TokenBudgetTracker(default_ceiling=50, window_seconds=3600)
     tracker.record("tenant-a", 45)
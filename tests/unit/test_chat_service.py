@@ -0,0 +1,557 @@
+import asyncio
+import hashlib
+import json
+import threading
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.settings import Settings
+from app.core.errors import AppError
+from app.models.openai import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    ChoiceMessage,
+    Citation,
+)
+from app.policy.models import ConnectorConstraints, PolicyDecision
+from app.providers.stub import StubProvider
+from app.rag.registry import ConnectorRegistry
+from app.rag.retrieval import RetrievalOrchestrator, RetrievalRequest
+from app.rag.types import Document, DocumentChunk
+from app.redaction.engine import RedactionEngine, TextRedactionResult
+from app.services.chat_service import (
+    ChatService,
+    _coalesce_sse_frames,
+    _continued_word_count,
+    _finish_sse_event,
+    _iso_now_ms,
+)
+from app.webhooks.dispatcher import WebhookEventType
+
+
+def _service(policy_client: object = None, **settings_overrides: object) -> ChatService:
+    return ChatService(
+        settings=Settings(**settings_overrides),
+        policy_client=policy_client,  # type: ignore[arg-type]
+        provider=None,  # type: ignore[arg-type]
+        redaction_engine=None,  # type: ignore[arg-type]
+        audit_writer=None,  # type: ignore[arg-type]
+    )
+
+
+def _decision(allowed_connectors: list[str] | None) -> PolicyDecision:
+    return PolicyDecision(
+        decision_id="d-1",
+        allow=True,
+        deny_reason=None,
+        policy_hash="hash",
+        evaluated_at="2026-01-01T00:00:00Z",
+        transforms=[],
+        connector_constraints=ConnectorConstraints(allowed_connectors=allowed_connectors),
+    )
+
+
+def test_request_hash_input_matches_exclude_none_dump() -> None:
+    payloads = [
+        ChatCompletionRequest(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "hello"}],
+            temperature=None,
+        ),
+        ChatCompletionRequest(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "hello"}],
+            rag={"enabled": True, "connector": "filesystem"},
+        ),
+        ChatCompletionRequest(
+            model="gpt-4o-mini",
+            messages=[{"role": "system", "content": "s"}, {"role": "user", "content": "u"}],
+            max_tokens=None,
+            rag={"enabled": True, "filters": {"team": "ops"}},
+        ),
+    ]
+    for payload in payloads:
+        assert ChatService._without_none(payload.model_dump()) == payload.model_dump(
+            exclude_none=True
+        )
+        request_hash, messages, messages_json = _service()._request_hash_parts(
+            payload.model_dump()
+        )
+        assert request_hash == _service()._hash_value(payload.model_dump(exclude_none=True))
+        assert messages == [message.model_dump(exclude_none=True) for message in payload.messages]
+        assert messages_json == ChatService._canonical_json(messages)
+
+
+def test_prefetched_chunks_are_gated_by_policy_connectors() -> None:
+    service = _service()
+    chunk = DocumentChunk(
+        source_id="doc-1",
+        connector="filesystem",
+        uri="file:///doc-1",
+        chunk_id="doc-1#0",
+        text="guidance",
+        score=1.0,
+        metadata={},
+    )
+    request = RetrievalRequest(query="q", connector="filesystem", k=1, filters={})
+
+    async def _run(allowed: list[str]) -> list[DocumentChunk]:
+        async def _retrieve() -> list[DocumentChunk]:
+            return [chunk]
+
+        task = asyncio.create_task(_retrieve())
+        return await service._prefetched_chunks(task, request, _decision(allowed))
+
+    assert asyncio.run(_run(["filesystem"])) == [chunk]
+    with pytest.raises(AppError) as excinfo:
+        asyncio.run(_run(["sharepoint"]))
+    assert excinfo.value.code == "retrieval_forbidden"
+
+
+class _CountingPolicyClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def evaluate(self, payload: dict[str, object]) -> PolicyDecision:
+        self.calls += 1
+        return _decision(None)
+
+
+def test_policy_decisions_are_cached_ignoring_request_metadata() -> None:
+    client = _CountingPolicyClient()
+    service = _service(client, policy_cache_ttl_s=60)
+
+    def _input(request_id: str, model: str = "gpt-4o-mini") -> dict[str, object]:
+        return {
+            "tenant_id": "t1",
+            "requested_model": model,
+            "request_metadata": {"request_id": request_id},
+        }
+
+    first = service._resolve_policy_decision(_input("r1"), request_id="r1")
+    cached = service._resolve_policy_decision(_input("r2"), request_id="r2")
+    assert client.calls == 1
+    assert not first.cache_hit
+    assert cached.cache_hit
+    assert (cached.decision_id, cached.evaluated_at) == (first.decision_id, first.evaluated_at)
+    service._resolve_policy_decision(_input("r3", model="other"), request_id="r3")
+    assert client.calls == 2
+
+    uncached = _service(_CountingPolicyClient())
+    uncached._resolve_policy_decision(_input("r1"), request_id="r1")
+    uncached._resolve_policy_decision(_input("r2"), request_id="r2")
+    assert uncached._policy_client.calls == 2  # type: ignore[attr-defined]
+
+
+def test_policy_cache_is_cleared_when_policy_hash_changes() -> None:
+    class _BundleClient:
+        def __init__(self) -> None:
+            self.policy_hash = "bundle-1"
+
+        def evaluate(self, payload: dict[str, object]) -> PolicyDecision:
+            decision = _decision(None)
+            decision.policy_hash = self.policy_hash
+            return decision
+
+    client = _BundleClient()
+    service = _service(client, policy_cache_ttl_s=60)
+    first = service._resolve_policy_decision({"requested_model": "a"}, request_id="r1")
+    service._resolve_policy_decision({"requested_model": "b"}, request_id="r2")
+
+    client.policy_hash = "bundle-2"
+    service._resolve_policy_decision({"requested_model": "c"}, request_id="r3")
+    refreshed = service._resolve_policy_decision({"requested_model": "a"}, request_id="r4")
+    assert refreshed is not first
+    assert refreshed.policy_hash == "bundle-2"
+
+
+def test_payload_hash_algorithm_is_configurable() -> None:
+    payload = {"b": [1, 2], "a": "x"}
+    canonical = b'{"a":"x","b":[1,2]}'
+    assert _service()._hash_value(payload) == hashlib.sha256(canonical).hexdigest()
+    assert (
+        _service(audit_hash_algo="blake2b")._hash_value(payload)
+        == hashlib.blake2b(canonical, digest_size=32).hexdigest()
+    )
+    with pytest.raises(ValueError, match="audit_hash_algo"):
+        _service(audit_hash_algo="md5")
+
+
+def test_xxh3_hash_algorithm_requires_xxhash() -> None:
+    try:
+        import xxhash
+    except ModuleNotFoundError:
+        with pytest.raises(ValueError, match="xxhash"):
+            _service(audit_hash_algo="xxh3_128")
+        return
+    assert (
+        _service(audit_hash_algo="xxh3_128")._hash_value({"a": 1})
+        == xxhash.xxh3_128(b'{"a":1}').hexdigest()
+    )
+
+
+def test_sse_event_is_compact_utf8_json() -> None:
+    event = ChatService._sse_event({"delta": {"content": "café"}, "index": 0})
+    assert event.startswith(b"data: ") and event.endswith(b"\n\n")
+    assert json.loads(event[len(b"data: ") :]) == {"delta": {"content": "café"}, "index": 0}
+    assert b": " not in event[len(b"data: ") :]
+
+
+def test_cheap_token_estimate_rounds_up_per_text() -> None:
+    assert ChatService._cheap_token_estimate([]) == 0
+    assert ChatService._cheap_token_estimate(["", "abc", "abcd", "abcde"]) == 0 + 1 + 1 + 2
+
+
+async def _frames(
+    items: list[tuple[bytes, bool]], delay_after: int | None = None
+) -> AsyncGenerator[tuple[bytes, bool], None]:
+    for index, item in enumerate(items):
+        if index == delay_after:
+            await asyncio.sleep(0.05)
+        yield item
+
+
+def test_coalesce_sse_frames_batches_and_respects_barriers() -> None:
+    items = [(b"a", True), (b"b", False), (b"c", False), (b"d", False), (b"e", True)]
+
+    async def _collect(
+        source: AsyncGenerator[tuple[bytes, bool], None], window_s: float
+    ) -> list[bytes]:
+        return [frame async for frame in _coalesce_sse_frames(source, 2, window_s)]
+
+    assert asyncio.run(_collect(_frames(items), 10.0)) == [b"a", b"bc", b"d", b"e"]
+    # The window expires while the next frame is still pending.
+    assert asyncio.run(_collect(_frames(items, delay_after=2), 0.01)) == [
+        b"a",
+        b"b",
+        b"cd",
+        b"e",
+    ]
+
+
+def test_large_redaction_runs_off_the_event_loop() -> None:
+    class _RecordingEngine(RedactionEngine):
+        def __init__(self) -> None:
+            super().__init__()
+            self.threads: list[int] = []
+
+        def redact_text(self, text: str) -> TextRedactionResult:
+            self.threads.append(threading.get_ident())
+            return super().redact_text(text)
+
+    engine = _RecordingEngine()
+    service = _service()
+    service._redaction_engine = engine
+    loop_thread = threading.get_ident()
+
+    async def _run() -> None:
+        small = await service._redact_messages([{"role": "user", "content": "ssn 123-45-6789"}])
+        assert small.redaction_count == 1
+        large = await service._redact_text("ssn 123-45-6789 " + "x" * 5000)
+        assert large.redaction_count == 1
+
+    asyncio.run(_run())
+    assert engine.threads[0] == loop_thread
+    assert engine.threads[1] != loop_thread
+
+
+def test_construct_from_provider_matches_validated_response() -> None:
+    payload = asyncio.run(
+        StubProvider().chat("gpt-4o-mini", [{"role": "user", "content": "hello"}], 16)
+    )
+    constructed = ChatCompletionResponse.construct_from_provider(payload)
+    validated = ChatCompletionResponse.model_validate(payload)
+    assert constructed.model_dump(exclude_none=True) == validated.model_dump(exclude_none=True)
+    assert isinstance(constructed.choices[0].message, ChoiceMessage)
+
+
+def test_retrieval_context_and_citations_from_chunks() -> None:
+    chunks = [
+        DocumentChunk(
+            source_id=f"doc-{index}",
+            connector="filesystem",
+            uri=f"file:///doc-{index}.txt",
+            chunk_id=f"doc-{index}:0",
+            text=f"text {index}",
+            score=index,
+        )
+        for index in range(2)
+    ]
+    assert ChatService._build_retrieval_context(chunks) == (
+        "Retrieved context chunks:\n[doc-0:0] text 0\n[doc-1:0] text 1"
+    )
+    citations = ChatService._citations_from_chunks(chunks)
+    assert [Citation.model_validate(c.model_dump()) for c in citations] == citations
+    assert citations[1].model_dump()["score"] == 1.0
+
+
+def test_webhook_dispatch_tasks_are_tracked_until_drained() -> None:
+    delivered: list[str] = []
+
+    class _Dispatcher:
+        def should_fire(self, event_type: WebhookEventType) -> bool:
+            return True
+
+        async def dispatch(
+            self, event_type: WebhookEventType, payload: dict[str, object]
+        ) -> list[object]:
+            await asyncio.sleep(0.01)
+            delivered.append(event_type.value)
+            return []
+
+    service = _service()
+    service._webhook_dispatcher = _Dispatcher()  # type: ignore[assignment]
+    events: list[dict[str, object]] = []
+
+    async def _run() -> None:
+        service._queue_webhook_event(WebhookEventType.REDACTION_HIT, {}, events)
+        assert len(service._webhook_tasks) == 1
+        await service.drain_webhooks()
+
+    asyncio.run(_run())
+    assert delivered == ["redaction_hit"]
+    assert not service._webhook_tasks
+    assert events == [{"event_type": "redaction_hit", "delivery_success_count": 0}]
+
+
+def test_span_without_collector_reuses_noop_span() -> None:
+    service = _service()
+    with service._span(trace_id="r1", operation="a") as first:
+        first.set_attribute("k", "v")
+    assert service._span(trace_id="r2", operation="b") is first
+
+
+def test_provider_hashes_can_be_disabled() -> None:
+    assert _service()._provider_hash({"model": "m"}) is not None
+    assert _service(audit_provider_hashes_enabled=False)._provider_hash({"model": "m"}) is None
+
+
+def test_provider_hash_from_canonical_matches_full_hash() -> None:
+    service = _service()
+    messages = [{"role": "user", "content": "héllo \"quoted\""}]
+    expected = service._provider_hash({"model": "m", "messages": messages, "max_tokens": None})
+    spliced = service._provider_hash_from_canonical(
+        {
+            "model": service._canonical_json("m"),
+            "messages": service._canonical_json(messages),
+            "max_tokens": service._canonical_json(None),
+        }
+    )
+    assert spliced == expected
+
+
+@pytest.mark.parametrize("algo", ["sha256", "blake2b"])
+def test_stream_response_hash_matches_joined_completion_hash(algo: str) -> None:
+    service = _service(audit_hash_algo=algo)
+    parts = ["héllo \"wor", "ld\"\n", "😀 tab\tend", ""]
+    expected = service._provider_hash(
+        {
+            "completion_text": "".join(parts),
+            "prompt_tokens": 12,
+            "completion_tokens": 4,
+            "chunk_id": "chatcmpl-1",
+            "model": "gpt-4o-mini",
+        }
+    )
+    streamed = service._stream_response_hash(
+        parts, prompt_tokens=12, completion_tokens=4, chunk_id="chatcmpl-1", model="gpt-4o-mini"
+    )
+    assert streamed == expected
+
+
+def test_non_stream_audit_writes_run_off_the_event_loop() -> None:
+    class _RecordingWriter:
+        def __init__(self) -> None:
+            self.threads: list[int] = []
+
+        def write_event(self, event: dict[str, object]) -> dict[str, object]:
+            self.threads.append(threading.get_ident())
+            return event
+
+    writer = _RecordingWriter()
+    service = _service()
+    service._audit_writer = writer  # type: ignore[assignment]
+
+    asyncio.run(service._persist_audit_event_off_loop({"request_id": "req-1"}))
+    assert writer.threads and writer.threads[0] != threading.get_ident()
+
+
+@pytest.mark.parametrize(
+    "deltas",
+    [
+        ["hel", "lo wor", "ld"],
+        ["one ", " two", "   ", "three\n", "four"],
+        ["a", "b", "c"],
+        ["  lead", "ing", "\ttrail  "],
+    ],
+)
+def test_continued_word_count_matches_joined_split(deltas: list[str]) -> None:
+    total = 0
+    follows_word = False
+    for delta in deltas:
+        total += _continued_word_count(delta, follows_word)
+        follows_word = not delta[-1].isspace()
+    assert total == len("".join(deltas).split())
+
+
+def test_redact_inputs_offloads_large_batches() -> None:
+    class _RecordingEngine(RedactionEngine):
+        def __init__(self) -> None:
+            super().__init__()
+            self.threads: set[int] = set()
+
+        def redact_text(self, text: str) -> TextRedactionResult:
+            self.threads.add(threading.get_ident())
+            return super().redact_text(text)
+
+    engine = _RecordingEngine()
+    service = _service()
+    service._redaction_engine = engine
+    inputs = ["ssn 123-45-6789", "plain"] + ["x" * 1000] * 5
+
+    texts, count = asyncio.run(service._redact_inputs(inputs))
+    assert texts[0] == "ssn [SSN_REDACTED]"
+    assert texts[1:] == inputs[1:]
+    assert count == 1
+    assert threading.get_ident() not in engine.threads
+
+
+@pytest.mark.parametrize("model", ["gpt-4o-mini", 'odd "model"\\ é'])
+def test_finish_sse_event_matches_sse_event(model: str) -> None:
+    expected = ChatService._sse_event(
+        {
+            "id": "chatcmpl-1",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        }
+    )
+    assert _finish_sse_event("chatcmpl-1", 1700000000, model, "stop") == expected
+
+
+def test_decision_allow_lists_are_parsed_once() -> None:
+    decision = _decision(["filesystem"])
+    decision.provider_constraints = {
+        "allowed_providers": ["openai", " "],
+        "allowed_models": "not-a-list",
+    }
+    assert decision.allowed_provider_names == {"openai"}
+    assert decision.allowed_provider_names is decision.allowed_provider_names
+    assert decision.allowed_model_names is None
+    assert decision.allowed_connector_names == {"filesystem"}
+
+    service = _service(rag_allowed_connectors="filesystem,s3")
+    assert service._allowed_connectors(_decision(None)) == {"filesystem", "s3"}
+    assert service._allowed_connectors(_decision(["postgres"])) == {"postgres"}
+
+
+def test_iso_now_ms_is_parseable_utc_with_millisecond_precision() -> None:
+    stamp = _iso_now_ms()
+    parsed = datetime.fromisoformat(stamp)
+    assert parsed.utcoffset() is not None and parsed.utcoffset().total_seconds() == 0
+    assert parsed.microsecond % 1000 == 0
+    assert _iso_now_ms() >= stamp
+
+
+class _RecordingConnector:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def search(self, query: str, filters: dict[str, str], k: int) -> list[DocumentChunk]:
+        self.queries.append(query)
+        return []
+
+    def fetch(self, doc_id: str) -> Document | None:
+        return None
+
+
+class _DenyingPolicyClient:
+    def evaluate(self, payload: dict[str, object]) -> PolicyDecision:
+        decision = _decision(["filesystem"])
+        decision.allow = False
+        decision.deny_reason = "blocked"
+        return decision
+
+
+class _ListAuditWriter:
+    def __init__(self) -> None:
+        self.events: list[dict[str, object]] = []
+
+    def write_event(self, event: dict[str, object]) -> None:
+        self.events.append(event)
+
+
+def test_denied_request_does_not_prefetch_from_disallowed_connector() -> None:
+    registry = ConnectorRegistry()
+    sharepoint = _RecordingConnector()
+    registry.register("sharepoint", sharepoint)
+    service = ChatService(
+        settings=Settings(rag_prefetch_enabled=True, rag_allowed_connectors="filesystem"),
+        policy_client=_DenyingPolicyClient(),  # type: ignore[arg-type]
+        provider=None,  # type: ignore[arg-type]
+        redaction_engine=None,  # type: ignore[arg-type]
+        audit_writer=_ListAuditWriter(),  # type: ignore[arg-type]
+        retrieval_orchestrator=RetrievalOrchestrator(registry=registry),
+    )
+    request = SimpleNamespace(
+        state=SimpleNamespace(
+            request_id="req-1",
+            tenant_id="t1",
+            user_id="u1",
+            classification="internal",
+            endpoint="/v1/chat/completions",
+        )
+    )
+    payload = ChatCompletionRequest(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": "secret question"}],
+        rag={"enabled": True, "connector": "sharepoint"},
+    )
+
+    async def _run() -> None:
+        with pytest.raises(AppError) as excinfo:
+            await service.handle_chat(request, payload)  # type: ignore[arg-type]
+        assert excinfo.value.code == "policy_denied"
+        await asyncio.sleep(0.05)
+
+    asyncio.run(_run())
+    assert sharepoint.queries == []
+
+
+def test_cached_policy_decisions_are_marked_in_audit_events() -> None:
+    service = _service(_CountingPolicyClient(), policy_cache_ttl_s=60)
+    policy_input: dict[str, object] = {"tenant_id": "t1", "requested_model": "gpt-4o-mini"}
+    fresh = service._resolve_policy_decision(policy_input, request_id="r1")
+    cached = service._resolve_policy_decision(policy_input, request_id="r2")
+
+    def _event(decision: PolicyDecision) -> dict[str, object]:
+        return service._build_audit_event(
+            request_id="r",
+            tenant_id="t1",
+            user_id="u1",
+            endpoint="/v1/chat/completions",
+            requested_model="gpt-4o-mini",
+            selected_model="gpt-4o-mini",
+            provider="stub",
+            decision=decision,
+            policy_decision_label="allow",
+            redaction_count=0,
+            request_payload_hash="h",
+            redacted_payload_hash="h",
+            provider_request_hash=None,
+            provider_response_hash=None,
+            retrieval_citations=None,
+            streaming=False,
+            tokens_in=1,
+            tokens_out=1,
+            cost_usd=0.0,
+            provider_attempts=1,
+            fallback_chain=["stub"],
+        )
+
+    assert "policy_cache_hit" not in _event(fresh)
+    assert _event(cached)["policy_cache_hit"] is True
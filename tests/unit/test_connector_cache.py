@@ -0,0 +1,112 @@
+import threading
+import time
+
+from app.rag.connectors.cache import LRUTTLCache, StaleWhileRevalidateCache
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached before timeout"
+        time.sleep(0.005)
+
+
+def test_expired_entry_is_served_stale_while_refreshing() -> None:
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl_seconds=0.01)
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_loader() -> str:
+        calls.append("refresh")
+        release.wait(timeout=2.0)
+        return "fresh"
+
+    assert cache.get_or_load("key", lambda: "stale") == "stale"
+    time.sleep(0.02)
+
+    assert cache.get_or_load("key", slow_loader) == "stale"
+    assert cache.get_or_load("key", slow_loader) == "stale"
+    release.set()
+    _wait_for(lambda: cache.get_or_load("key", lambda: "unused") == "fresh")
+    assert calls == ["refresh"]
+
+
+def test_least_recently_used_entry_is_evicted_at_capacity() -> None:
+    cache: StaleWhileRevalidateCache[int] = StaleWhileRevalidateCache(
+        ttl_seconds=60, max_entries=2
+    )
+    cache.get_or_load("a", lambda: 1)
+    cache.get_or_load("b", lambda: 2)
+    cache.get_or_load("a", lambda: -1)
+    cache.get_or_load("c", lambda: 3)
+
+    assert len(cache) == 2
+    assert cache.get_or_load("a", lambda: -1) == 1
+    assert cache.get_or_load("b", lambda: 20) == 20
+
+
+def test_zero_ttl_and_none_results_are_not_cached() -> None:
+    uncached: StaleWhileRevalidateCache[int] = StaleWhileRevalidateCache(ttl_seconds=0)
+    assert uncached.get_or_load("a", lambda: 1) == 1
+    assert uncached.get_or_load("a", lambda: 2) == 2
+
+    cache: StaleWhileRevalidateCache[int] = StaleWhileRevalidateCache(ttl_seconds=60)
+    assert cache.get_or_load("missing", lambda: None) is None
+    assert cache.get_or_load("missing", lambda: 5) == 5
+
+
+def test_lru_ttl_cache_evicts_expired_and_least_recent_entries() -> None:
+    cache: LRUTTLCache[str] = LRUTTLCache(ttl_seconds=60, max_entries=2)
+    cache.put("a", "alpha")
+    cache.put("b", "beta")
+    assert cache.get("a") == "alpha"
+    cache.put("c", "gamma")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "alpha"
+    assert len(cache) == 2
+
+    short: LRUTTLCache[str] = LRUTTLCache(ttl_seconds=0.01)
+    short.put("a", "alpha")
+    time.sleep(0.02)
+    assert short.get("a") is None
+    assert len(short) == 0
+
+    disabled: LRUTTLCache[str] = LRUTTLCache(ttl_seconds=0)
+    disabled.put("a", "alpha")
+    assert disabled.get("a") is None
+
+
+def test_refresh_returning_none_drops_the_stale_entry() -> None:
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl_seconds=0.01)
+    assert cache.get_or_load("deleted", lambda: "old") == "old"
+    time.sleep(0.02)
+
+    assert cache.get_or_load("deleted", lambda: None) == "old"
+    _wait_for(lambda: len(cache) == 0)
+    assert cache.get_or_load("deleted", lambda: None) is None
+
+
+def test_entries_past_max_stale_age_are_reloaded_inline() -> None:
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(
+        ttl_seconds=0.01, max_stale_seconds=0.02
+    )
+    assert cache.get_or_load("key", lambda: "old") == "old"
+    time.sleep(0.03)
+
+    assert cache.get_or_load("key", lambda: "new") == "new"
+    assert cache.get_or_load("key", lambda: "unused") == "new"
+
+
+def test_failed_refresh_is_logged_and_keeps_the_entry(caplog) -> None:
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl_seconds=0.01)
+    assert cache.get_or_load("key", lambda: "old") == "old"
+    time.sleep(0.02)
+
+    def failing_loader() -> str:
+        raise RuntimeError("upstream down")
+
+    with caplog.at_level("ERROR", logger="srg.rag"):
+        assert cache.get_or_load("key", failing_loader) == "old"
+        _wait_for(lambda: "connector_cache_refresh_failed" in caplog.messages)
+    assert len(cache) == 1
@@ -0,0 +1,21 @@
+from app.rag.connectors.scoring import overlap_count, token_hashes
+
+
+def test_token_hashes_are_sorted_and_unique() -> None:
+    hashes = token_hashes(["beta", "alpha", "beta"])
+    assert len(hashes) == 2
+    assert list(hashes) == sorted(hashes)
+
+
+def test_overlap_count_matches_set_intersection() -> None:
+    left = {"incident", "runbook", "latency", "db"}
+    right = {"runbook", "db", "deploy"}
+    assert overlap_count(token_hashes(left), token_hashes(right)) == len(left & right)
+    assert overlap_count(token_hashes(left), ()) == 0
+
+
+def test_overlap_count_handles_skewed_sizes() -> None:
+    record = token_hashes(f"token{index}" for index in range(500))
+    query = token_hashes(["token3", "token499", "missing"])
+    assert overlap_count(query, record) == 2
+    assert overlap_count(record, query) == 2
@@ -108,3 +108,78 @@ def test_jira_fetch_issue(monkeypatch) -> None:
     assert doc.source_id == "42"
     assert "incident response runbook" in doc.text
     assert doc.metadata["project"] == "OPS"
+
+
+def test_jira_search_fetches_remaining_pages_from_total(monkeypatch) -> None:
+    connector = JiraConnector(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="token",
+    )
+
+    pages = {
+        0: [_issue(str(index), f"OPS-{index}", "alpha") for index in range(50)],
+        50: [_issue(str(index), f"OPS-{index}", "alpha") for index in range(50, 100)],
+        100: [_issue("100", "OPS-100", "alpha beta")],
+    }
+    calls: list[int] = []
+
+    def fake_get_json(path: str, params: dict[str, object]) -> dict[str, object]:
+        assert path == "/rest/api/3/search"
+        start_at = int(params["startAt"])
+        calls.append(start_at)
+        return {"issues": pages.get(start_at, []), "total": 101}
+
+    monkeypatch.setattr(connector, "_get_json", fake_get_json)
+
+    results = connector.search(query="alpha", filters={}, k=200)
+    assert len(results) == 101
+    assert sorted(calls) == [0, 50, 100]
+    assert {chunk.source_id for chunk in results} == {str(index) for index in range(101)}
+
+
+def test_jira_extract_description_keeps_document_order_for_deep_adf() -> None:
+    node: dict[str, object] = {"type": "text", "text": "leaf"}
+    for _ in range(5000):
+        node = {"type": "paragraph", "content": [node]}
+    document = {
+        "type": "doc",
+        "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": "first"}]},
+            node,
+            {"type": "paragraph", "content": [{"type": "text", "text": " last "}]},
+        ],
+    }
+    assert JiraConnector._extract_description(document) == "first leaf last"
+
+
+def test_jira_owned_client_carries_auth_headers() -> None:
+    connector = JiraConnector(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="token-123",
+    )
+    expected = base64.b64encode(b"user@example.com:token-123").decode("ascii")
+    assert connector._http.headers["Authorization"] == f"Basic {expected}"
+    assert connector._request_headers is None
+
+
+def test_jira_search_pushes_project_filter_into_jql(monkeypatch) -> None:
+    connector = JiraConnector(
+        base_url="https://example.atlassian.net",
+        email="user@example.com",
+        api_token="token",
+        project_keys={"sec", "OPS"},
+    )
+    seen_jql: list[str] = []
+
+    def fake_get_json(path: str, params: dict[str, object]) -> dict[str, object]:
+        _ = path
+        seen_jql.append(str(params["jql"]))
+        return {"issues": [_issue("1", "OPS-1", "alpha")]}
+
+    monkeypatch.setattr(connector, "_get_json", fake_get_json)
+
+    results = connector.search(query="alpha", filters={}, k=5)
+    assert [chunk.source_id for chunk in results] == ["1"]
+    assert seen_jql == ['text ~ "\\"alpha\\"" AND project in ("OPS","SEC")']
@@ -0,0 +1,33 @@
+from app.metrics import inc_counter, observe_histogram, record_request, render_metrics
+
+
+def test_record_request_matches_per_series_helpers() -> None:
+    record_request(
+        endpoint="/v1/test-bulk",
+        provider="p-metrics",
+        model="m",
+        policy_decision="allow",
+        status_code=200,
+        latency_s=0.02,
+        tokens_in=3,
+        tokens_out=4,
+        cost_usd=0.5,
+        redaction_count=2,
+        provider_attempts=3,
+    )
+    base = {"endpoint": "/v1/test-ref", "provider": "p-metrics", "model": "m"}
+    inc_counter("srg_requests_total", {**base, "status": "200"})
+    inc_counter("srg_policy_decisions_total", {"endpoint": "/v1/test-ref", "decision": "allow"})
+    observe_histogram("srg_request_duration_seconds", base, 0.02)
+    inc_counter("srg_tokens_total", {**base, "direction": "input"}, 3.0)
+    inc_counter("srg_tokens_total", {**base, "direction": "output"}, 4.0)
+    inc_counter("srg_cost_usd_total", base, 0.5)
+    inc_counter("srg_redactions_total", {"endpoint": "/v1/test-ref"}, 2.0)
+
+    rendered = render_metrics().splitlines()
+    bulk = [line for line in rendered if "/v1/test-bulk" in line]
+    reference = [
+        line.replace("/v1/test-ref", "/v1/test-bulk") for line in rendered if "/v1/test-ref" in line
+    ]
+    assert bulk == reference
+    assert 'srg_provider_fallbacks_total{provider="p-metrics"} 2.0' in rendered
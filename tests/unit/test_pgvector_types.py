@@ -0,0 +1,21 @@
+import struct
+
+from app.rag.connectors.pgvector_types import (
+    PgVector,
+    PgVectorBinaryDumper,
+    PgVectorTextDumper,
+)
+
+
+def test_text_dumper_emits_vector_literal() -> None:
+    dumper = PgVectorTextDumper(PgVector)
+    assert dumper.dump(PgVector([0.5, -1.0])) == b"[0.500000,-1.000000]"
+
+
+def test_binary_dumper_emits_pgvector_wire_format() -> None:
+    dumper = PgVectorBinaryDumper(PgVector)
+    payload = dumper.dump(PgVector([0.5, -1.0, 2.0]))
+    dim, unused = struct.unpack_from(">HH", payload)
+    assert (dim, unused) == (3, 0)
+    assert struct.unpack_from(">3f", payload, 4) == (0.5, -1.0, 2.0)
+    assert len(payload) == 4 + 3 * 4
@@ -221,3 +221,56 @@ def test_route_stream_with_fallback_success() -> None:
 
 async def _collect_chunks(stream: AsyncIterator[dict[str, object]]) -> list[dict[str, object]]:
     return [chunk async for chunk in stream]
+
+
+class _TrackingEmbeddingsProvider(_StreamOnlyProvider):
+    def __init__(self) -> None:
+        self.inflight = 0
+        self.peak = 0
+
+    async def embeddings(self, model: str, inputs: list[str]) -> dict[str, object]:
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        await asyncio.sleep(0.01)
+        self.inflight -= 1
+        return await super().embeddings(model, inputs)
+
+
+def test_route_embeddings_respects_entry_semaphore() -> None:
+    provider = _TrackingEmbeddingsProvider()
+
+    async def _run() -> None:
+        registry = _make_registry(
+            ProviderEntry(
+                name="bounded",
+                provider=provider,  # type: ignore[arg-type]
+                embedding_semaphore=asyncio.Semaphore(2),
+            )
+        )
+        await asyncio.gather(
+            *(
+                route_embeddings_with_fallback(
+                    registry=registry,
+                    primary="bounded",
+                    model="text-embedding-3-small",
+                    inputs=["hello"],
+                )
+                for _ in range(6)
+            )
+        )
+
+    asyncio.run(_run())
+    assert provider.peak == 2
+
+
+def test_stub_embeddings_deduplicates_repeated_inputs() -> None:
+    stub = StubProvider()
+    result = asyncio.run(
+        stub.embeddings(model="text-embedding-3-small", inputs=["alpha", "beta", "alpha"])
+    )
+    data = result["data"]
+    assert isinstance(data, list)
+    assert [item["index"] for item in data] == [0, 1, 2]
+    assert data[0]["embedding"] == data[2]["embedding"]
+    assert data[0]["embedding"] != data[1]["embedding"]
+    assert result["usage"] == {"prompt_tokens": 3, "total_tokens": 3}
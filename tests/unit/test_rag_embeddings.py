@@ -5,7 +5,13 @@ import json
 import httpx
 import pytest
 
-from app.rag.embeddings import HashEmbeddingGenerator, HTTPOpenAIEmbeddingGenerator
+from app.config.settings import Settings
+from app.main import _build_rag_embedding_generator
+from app.rag.embeddings import (
+    HashEmbeddingGenerator,
+    HTTPOpenAIEmbeddingGenerator,
+    vector_literal,
+)
 
 
 def test_hash_embedding_generator_returns_requested_dim() -> None:
@@ -17,6 +23,59 @@ def test_hash_embedding_generator_returns_requested_dim() -> None:
     assert vectors[0] != vectors[1]
 
 
+def test_hash_embedding_generator_weights_repeated_tokens() -> None:
+    generator = HashEmbeddingGenerator(embedding_dim=64)
+    single, repeated, mixed = generator.embed_texts(["alpha", "alpha alpha", "alpha alpha beta"])
+
+    assert repeated == single
+    assert sorted(abs(value) for value in single)[-1] == 1.0
+    nonzero = sorted(abs(value) for value in mixed if value)
+    assert nonzero == [round(1 / 5**0.5, 6), round(2 / 5**0.5, 6)]
+
+
+def test_hash_embedding_generator_batch_matches_single_text_vectors() -> None:
+    generator = HashEmbeddingGenerator(embedding_dim=16)
+    texts = ["alpha beta", "beta gamma alpha", "", "delta"]
+
+    assert generator.embed_texts(texts) == [generator.embed_texts([text])[0] for text in texts]
+
+
+def test_hash_embedding_generator_ignores_token_case() -> None:
+    generator = HashEmbeddingGenerator(embedding_dim=16)
+    lower, mixed = generator.embed_texts(["alpha beta 42", "Alpha BETA, 42!"])
+
+    assert mixed == lower
+
+
+def test_hash_embedding_generator_hash_algo_is_selectable() -> None:
+    sha = HashEmbeddingGenerator(embedding_dim=32).embed_texts(["hello world"])
+    blake = HashEmbeddingGenerator(embedding_dim=32, hash_algo="blake2b").embed_texts(
+        ["hello world"]
+    )
+
+    assert sha == HashEmbeddingGenerator(embedding_dim=32, hash_algo="sha256").embed_texts(
+        ["hello world"]
+    )
+    assert blake != sha
+    with pytest.raises(ValueError, match="hash_algo"):
+        HashEmbeddingGenerator(embedding_dim=32, hash_algo="md5")
+
+
+def test_rag_embedding_hash_algo_setting_selects_generator_digest() -> None:
+    texts = ["hello world"]
+    default = _build_rag_embedding_generator(Settings(), embedding_dim=32)
+    blake = _build_rag_embedding_generator(
+        Settings(rag_embedding_hash_algo="blake2b"), embedding_dim=32
+    )
+
+    assert default.embed_texts(texts) == HashEmbeddingGenerator(embedding_dim=32).embed_texts(
+        texts
+    )
+    assert blake.embed_texts(texts) == HashEmbeddingGenerator(
+        embedding_dim=32, hash_algo="blake2b"
+    ).embed_texts(texts)
+
+
 def test_http_embedding_generator_success() -> None:
     def _handler(request: httpx.Request) -> httpx.Response:
         assert request.headers["authorization"] == "Bearer test-key"
@@ -64,3 +123,38 @@ def test_http_embedding_generator_dimension_mismatch() -> None:
 
     with pytest.raises(RuntimeError, match="unexpected embedding dimension"):
         generator.embed_texts(["a"])
+
+
+def test_http_embedding_generator_reuses_client_until_closed() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content.decode("utf-8"))
+        return httpx.Response(
+            status_code=200,
+            json={
+                "data": [
+                    {"index": index, "embedding": [0.5, 0.5]}
+                    for index in range(len(body["input"]))
+                ]
+            },
+        )
+
+    with HTTPOpenAIEmbeddingGenerator(
+        endpoint="https://example.local/v1/embeddings",
+        model="text-embedding-3-small",
+        embedding_dim=2,
+        transport=httpx.MockTransport(_handler),
+    ) as generator:
+        client = generator._client
+        assert generator.embed_texts(["a"]) == [[0.5, 0.5]]
+        assert generator.embed_texts(["b", "c"]) == [[0.5, 0.5], [0.5, 0.5]]
+        assert generator._client is client
+        assert not client.is_closed
+
+    assert client.is_closed
+
+
+def test_vector_literal_formats_fixed_precision() -> None:
+    assert vector_literal([]) == "[]"
+    assert vector_literal([1, -0.25, 1e-7]) == "[1.000000,-0.250000,0.000000]"
+    values = [0.123456789, -2.5, 3.0]
+    assert vector_literal(values) == "[" + ",".join(f"{value:.6f}" for value in values) + "]"
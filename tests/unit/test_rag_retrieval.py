@@ -65,3 +65,26 @@ def test_retrieve_missing_connector() -> None:
             request=RetrievalRequest(query="hello", connector="filesystem", k=1, filters={}),
             allowed_connectors=None,
         )
+
+
+def test_registry_close_closes_connectors_and_skips_failures() -> None:
+    closed: list[str] = []
+
+    class ClosingConnector(StubConnector):
+        def __init__(self, name: str, fail: bool = False) -> None:
+            self._name = name
+            self._fail = fail
+
+        def close(self) -> None:
+            closed.append(self._name)
+            if self._fail:
+                raise RuntimeError("close failed")
+
+    registry = ConnectorRegistry()
+    registry.register("broken", ClosingConnector("broken", fail=True))
+    registry.register("filesystem", StubConnector())
+    registry.register("postgres", ClosingConnector("postgres"))
+
+    registry.close()
+
+    assert closed == ["broken", "postgres"]
@@ -1,4 +1,11 @@
-from app.redaction.engine import RedactionEngine
+import re
+
+from app.redaction.engine import (
+    DEFAULT_ENGINE,
+    PatternCategory,
+    RedactionEngine,
+    RedactionPattern,
+)
 
 
 def test_redaction_engine_masks_patterns() -> None:
@@ -10,3 +17,99 @@ def test_redaction_engine_masks_patterns() -> None:
     assert result.redaction_count >= 2
     text = result.messages[0]["content"]
     assert "REDACTED" in text
+
+
+def test_redaction_engine_passes_through_text_without_matches() -> None:
+    result = RedactionEngine().redact_text("Summarise the discharge notes for the ward round.")
+
+    assert result.text == "Summarise the discharge notes for the ward round."
+    assert result.redaction_count == 0
+    assert result.matched_categories == set()
+
+
+def test_redaction_engine_keeps_pattern_order_for_adjacent_identifiers() -> None:
+    result = RedactionEngine().redact_text("4111111111111111-01/02/1990")
+
+    assert result.text == "[CREDIT_CARD_REDACTED]-[DOB_REDACTED]"
+    assert result.matched_categories == {"financial", "phi"}
+
+
+def test_redaction_engine_supports_extra_patterns_with_groups() -> None:
+    engine = RedactionEngine(
+        extra_patterns=(
+            RedactionPattern(
+                name="repeated_code",
+                regex=re.compile(r"\b(ZX)-\1\b"),
+                replacement="[CODE_REDACTED]",
+                category=PatternCategory.PII,
+            ),
+        )
+    )
+
+    result = engine.redact_text("ticket ZX-ZX closed")
+    assert result.text == "ticket [CODE_REDACTED] closed"
+    assert result.redaction_count == 1
+
+
+def test_redaction_engine_hyperscan_option_keeps_regex_results() -> None:
+    engine = RedactionEngine(use_hyperscan=True)
+
+    result = engine.redact_text("SSN 123-45-6789")
+    assert result.text == "SSN [SSN_REDACTED]"
+    assert engine.redact_text("no identifiers here").redaction_count == 0
+
+
+def test_redaction_engine_character_precheck_respects_extra_patterns() -> None:
+    core = RedactionEngine()
+    assert core.redact_text("no identifiers in this sentence").redaction_count == 0
+    assert core.redact_text("mail ops@example.com").text == "mail [EMAIL_REDACTED]"
+    assert core.redact_text("nhs ٤٨٥ ٧٧٧ ٣٤٥٦").redaction_count == 1
+
+    custom = RedactionEngine(
+        extra_patterns=(
+            RedactionPattern(
+                name="codename",
+                regex=re.compile(r"\bProject Falcon\b"),
+                replacement="[CODENAME_REDACTED]",
+                category=PatternCategory.PII,
+            ),
+        )
+    )
+    result = custom.redact_text("about Project Falcon")
+    assert result.text == "about [CODENAME_REDACTED]"
+    assert result.matched_categories == {"pii"}
+
+
+def test_default_engine_is_shared_and_uses_core_patterns() -> None:
+    assert DEFAULT_ENGINE.pattern_count == RedactionEngine().pattern_count
+    result = DEFAULT_ENGINE.redact_text("MRN 1234567")
+    assert result.text == "[MRN_REDACTED]"
+    assert not hasattr(result, "__dict__")
+
+
+def test_redaction_engine_skips_patterns_needing_more_digits() -> None:
+    engine = RedactionEngine()
+    card = engine.redact_text("card 4111111111111111")
+    assert card.text == "card [CREDIT_CARD_REDACTED]"
+    assert card.matched_categories == {"financial"}
+
+    short = engine.redact_text("ref 12.34.56.78.90.12 shipped")
+    assert short.text == "ref 12.34.56.78.90.12 shipped"
+    assert short.redaction_count == 0
+
+    # min_digits is deliberately above what the regex needs, so a skipped
+    # pattern is observable as a match that is left unredacted.
+    order_ref = RedactionPattern(
+        name="order_ref",
+        regex=re.compile(r"ORD-\d{3}"),
+        replacement="[ORDER_REDACTED]",
+        category=PatternCategory.FINANCIAL,
+        min_digits=6,
+    )
+    gated = RedactionEngine(extra_patterns=(order_ref,))
+    too_few = gated.redact_text("ORD-123 shipped")
+    assert too_few.text == "ORD-123 shipped"
+    assert too_few.redaction_count == 0
+    enough = gated.redact_text("ORD-123 shipped to 456")
+    assert enough.text == "[ORDER_REDACTED] shipped to 456"
+    assert enough.redaction_count == 1
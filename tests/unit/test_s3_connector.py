@@ -147,3 +147,84 @@ def test_s3_connector_prefix_index_loads_multiple_objects() -> None:
     results = connector.search("beta", filters={"tenant": "tenant-a"}, k=5)
     assert len(results) == 2
     assert {item.source_id for item in results} == {"doc-a", "doc-b"}
+
+
+def test_s3_connector_fetch_groups_chunks_by_source_id() -> None:
+    payload = "\n".join(
+        json.dumps(
+            {
+                "source_id": source_id,
+                "uri": f"s3://demo-bucket/docs/{source_id}.txt",
+                "chunk_id": f"{source_id}#{index}",
+                "text": text,
+                "metadata": {"tenant": "tenant-a"},
+            }
+        )
+        for index, (source_id, text) in enumerate(
+            [("doc-1", "alpha"), ("doc-2", "beta"), ("doc-1", "gamma")]
+        )
+    )
+    s3_client = FakeS3Client(payload)
+    connector = S3Connector(
+        bucket="demo-bucket",
+        index_key="rag/index.jsonl",
+        s3_client=s3_client,
+        cache_ttl_seconds=60,
+    )
+
+    doc = connector.fetch("doc-1")
+    assert doc is not None
+    assert doc.text == "alpha\ngamma"
+    assert doc.uri == "s3://demo-bucket/docs/doc-1.txt"
+    assert connector.fetch("doc-3") is None
+    assert s3_client.get_count == 1
+
+
+class _StreamingBody:
+    def __init__(self, lines: list[bytes]):
+        self._lines = lines
+        self.read_called = False
+
+    def iter_lines(self, chunk_size: int = 1024):
+        _ = chunk_size
+        yield from self._lines
+
+    def read(self) -> bytes:
+        self.read_called = True
+        return b"\n".join(self._lines)
+
+
+class StreamingS3Client:
+    def __init__(self, body: _StreamingBody):
+        self._body = body
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, object]:
+        _ = Bucket
+        _ = Key
+        return {"Body": self._body}
+
+
+def test_s3_connector_parses_streaming_body_line_by_line() -> None:
+    body = _StreamingBody(
+        [
+            json.dumps(
+                {
+                    "source_id": "doc-1",
+                    "uri": "s3://demo-bucket/docs/doc-1.txt",
+                    "chunk_id": "doc-1#0",
+                    "text": "streamed glucose reading",
+                }
+            ).encode("utf-8"),
+            b"",
+            b"not json",
+        ]
+    )
+    connector = S3Connector(
+        bucket="demo-bucket",
+        index_key="rag/index.jsonl",
+        s3_client=StreamingS3Client(body),
+    )
+
+    chunks = connector.search("glucose", filters={}, k=1)
+    assert [chunk.source_id for chunk in chunks] == ["doc-1"]
+    assert body.read_called is False
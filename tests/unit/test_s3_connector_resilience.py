@@ -2,6 +2,7 @@
 cache preservation on transient failures and edge cases."""
 
 import json
+import time
 from io import BytesIO
 
 from app.rag.connectors.s3 import S3Connector
@@ -124,3 +125,94 @@ def test_s3_cache_ttl_zero_forces_refresh_every_call() -> None:
     connector.search("test", filters={}, k=1)
     connector.search("test", filters={}, k=1)
     assert s3_client._call_count == 3, "cache_ttl=0 should refresh on every call"
+
+
+def test_s3_expired_cache_served_while_refreshing_in_background() -> None:
+    """Once the TTL lapses the cached index is still returned immediately and a
+    background refresh picks up the new index."""
+    first = json.dumps({
+        "source_id": "doc-1",
+        "uri": "s3://b/1",
+        "chunk_id": "doc-1#0",
+        "text": "original text",
+        "metadata": {},
+    })
+    second = json.dumps({
+        "source_id": "doc-2",
+        "uri": "s3://b/2",
+        "chunk_id": "doc-2#0",
+        "text": "updated text",
+        "metadata": {},
+    })
+
+    class _SwitchingS3Client:
+        def __init__(self) -> None:
+            self.payloads = [first, second]
+            self.call_count = 0
+
+        def get_object(self, Bucket: str, Key: str) -> dict[str, object]:
+            _ = Bucket
+            _ = Key
+            payload = self.payloads[min(self.call_count, 1)]
+            self.call_count += 1
+            return {"Body": BytesIO(payload.encode("utf-8"))}
+
+    s3_client = _SwitchingS3Client()
+    connector = S3Connector(
+        bucket="demo-bucket",
+        index_key="rag/index.jsonl",
+        s3_client=s3_client,
+        cache_ttl_seconds=0.01,
+    )
+
+    assert [r.source_id for r in connector.search("text", filters={}, k=5)] == ["doc-1"]
+    time.sleep(0.02)
+    assert [r.source_id for r in connector.search("text", filters={}, k=5)] == ["doc-1"]
+
+    deadline = time.monotonic() + 2.0
+    while connector.fetch("doc-2") is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    assert s3_client.call_count >= 2
+
+
+def test_s3_failed_background_refresh_is_logged(caplog) -> None:
+    payload = json.dumps({"source_id": "doc-1", "chunk_id": "doc-1#0", "text": "cached text"})
+
+    class _BrokenBody:
+        def read(self) -> bytes:
+            raise RuntimeError("connection reset")
+
+    class _FlakyBodyS3Client:
+        def __init__(self) -> None:
+            self.call_count = 0
+
+        def get_object(self, Bucket: str, Key: str) -> dict[str, object]:
+            _ = Bucket
+            _ = Key
+            self.call_count += 1
+            if self.call_count > 1:
+                return {"Body": _BrokenBody()}
+            return {"Body": BytesIO(payload.encode("utf-8"))}
+
+    connector = S3Connector(
+        bucket="demo-bucket",
+        index_key="rag/index.jsonl",
+        s3_client=_FlakyBodyS3Client(),
+        cache_ttl_seconds=0.01,
+    )
+    assert connector.fetch("doc-1") is not None
+    time.sleep(0.02)
+
+    with caplog.at_level("ERROR", logger="srg.rag"):
+        assert connector.fetch("doc-1") is not None
+        deadline = time.monotonic() + 2.0
+        while "s3_index_refresh_failed" not in caplog.messages:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+    assert connector.fetch("doc-1") is not None
+
+
+def test_s3_malformed_lines_are_not_stitched_into_one_record() -> None:
+    lines = [b'{"source_id":"a"', b'"text":"x"}, {"source_id":"b"}']
+    assert S3Connector._parse_jsonl_records(lines) == []
@@ -1,3 +1,7 @@
+import json
+import threading
+from contextlib import contextmanager
+
 import pytest
 
 from app.rag.connectors.sharepoint import ManagedIdentityTokenProvider, SharePointConnector
@@ -8,11 +12,28 @@ class _FakeResponse:
         self._payload = payload
         self.status_code = status_code
         self.text = str(payload)
+        self.content = json.dumps(payload).encode("utf-8")
 
     def json(self) -> dict[str, object]:
         return self._payload
 
 
+class _FakeStreamResponse:
+    def __init__(self, chunks: list[str], status_code: int = 200) -> None:
+        self.chunks = chunks
+        self.status_code = status_code
+        self.text = "".join(chunks)
+        self.consumed = 0
+
+    def read(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def iter_text(self, chunk_size: int | None = None):  # noqa: ANN201
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
 class _FakeHTTPClient:
     def __init__(self, payload: dict[str, object]) -> None:
         self.payload = payload
@@ -75,6 +96,39 @@ def test_sharepoint_search_pagination_merges_results(monkeypatch) -> None:
     ]
 
 
+def test_sharepoint_search_prefetches_next_page_while_parsing(monkeypatch) -> None:
+    connector = SharePointConnector(site_id="site-id", bearer_token="token")
+    next_page_requested = threading.Event()
+    overlapped: list[bool] = []
+
+    monkeypatch.setattr(
+        connector,
+        "_get_json",
+        lambda path, params: {
+            "value": [_search_item("1", "Runbook One", "/drives/drive-1/root:/Ops")],
+            "@odata.nextLink": "https://graph.microsoft.com/v1.0/next-page",
+        },
+    )
+
+    def fake_get_json_absolute(url: str) -> dict[str, object]:
+        next_page_requested.set()
+        return {"value": [_search_item("2", "Runbook Two", "/drives/drive-1/root:/Ops")]}
+
+    original_parse = connector._parse_search_result
+
+    def tracking_parse(value: dict[str, object]) -> dict[str, object] | None:
+        if value["id"] == "1":
+            overlapped.append(next_page_requested.wait(timeout=5))
+        return original_parse(value)
+
+    monkeypatch.setattr(connector, "_get_json_absolute", fake_get_json_absolute)
+    monkeypatch.setattr(connector, "_parse_search_result", tracking_parse)
+
+    records = connector._fetch_search_records("runbook")
+    assert [record["source_id"] for record in records] == ["1", "2"]
+    assert overlapped == [True]
+
+
 def test_sharepoint_search_applies_filters_and_path_prefix(monkeypatch) -> None:
     connector = SharePointConnector(
         site_id="site-id",
@@ -190,3 +244,282 @@ def test_managed_identity_token_provider_raises_on_missing_token() -> None:
 
     with pytest.raises(RuntimeError, match="access_token"):
         provider.get_token()
+
+
+def test_sharepoint_search_reuses_cached_record_tokens(monkeypatch) -> None:
+    connector = SharePointConnector(site_id="site-id", bearer_token="token")
+    monkeypatch.setattr(
+        connector,
+        "_fetch_search_records",
+        lambda query: [
+            {
+                "source_id": "1",
+                "uri": "https://contoso/doc/1",
+                "text": "Alpha runbook",
+                "metadata": {"name": "Alpha.md", "path": "/Ops"},
+            }
+        ],
+    )
+    _ = connector.search(query="alpha", filters={}, k=3)
+
+    tokenized: list[str] = []
+    original_tokens = SharePointConnector._tokens
+    monkeypatch.setattr(
+        SharePointConnector,
+        "_tokens",
+        staticmethod(lambda text: tokenized.append(text) or original_tokens(text)),
+    )
+    results = connector.search(query="alpha", filters={}, k=3)
+
+    assert [result.source_id for result in results] == ["1"]
+    assert results[0].score == 1.0
+    assert tokenized == ["alpha"]
+
+
+class _FakeBatchHTTPClient:
+    def __init__(self) -> None:
+        self.posts: list[dict[str, object]] = []
+        self.downloads: list[str] = []
+
+    def post(self, url: str, json=None, headers=None):  # noqa: ANN001
+        self.posts.append({"url": url, "json": json})
+        responses = []
+        for request in json["requests"]:
+            doc_id = request["url"].split("/items/")[1].split("?")[0]
+            if doc_id == "missing":
+                responses.append({"id": request["id"], "status": 404, "body": {}})
+                continue
+            body = _search_item(doc_id, f"{doc_id}.md", "/drives/drive-1/root:/Ops")
+            body["@microsoft.graph.downloadUrl"] = f"https://download/{doc_id}"
+            responses.append({"id": request["id"], "status": 200, "body": body})
+        return _FakeResponse(payload={"responses": list(reversed(responses))})
+
+    @contextmanager
+    def stream(self, method: str, url: str):  # noqa: ANN201
+        assert method == "GET"
+        self.downloads.append(url)
+        yield _FakeStreamResponse([f"contents of {url.rsplit('/', 1)[-1]}"])
+
+
+def test_sharepoint_fetch_many_batches_metadata_requests() -> None:
+    client = _FakeBatchHTTPClient()
+    connector = SharePointConnector(site_id="site-id", bearer_token="token", http_client=client)
+    doc_ids = [f"doc-{index}" for index in range(25)] + ["missing", "doc-3"]
+
+    documents = connector.fetch_many(doc_ids)
+
+    assert [len(post["json"]["requests"]) for post in client.posts] == [20, 6]
+    assert all(post["url"] == "https://graph.microsoft.com/v1.0/$batch" for post in client.posts)
+    assert documents[-2] is None
+    assert [document.source_id for document in documents if document is not None] == [
+        *(f"doc-{index}" for index in range(25)),
+        "doc-3",
+    ]
+    assert documents[0] is not None and documents[0].text == "contents of doc-0"
+    assert len(client.downloads) == 25
+
+    assert connector.fetch_many(["doc-1"])[0] == documents[1]
+    assert len(client.posts) == 2
+
+
+def test_sharepoint_path_prefix_normalization_is_memoized() -> None:
+    connector = SharePointConnector(
+        site_id="site-id",
+        bearer_token="token",
+        allowed_path_prefixes={"drives/drive-1/root:/Ops"},
+    )
+    metadata = {"path": " /Drives/Drive-1/root:/Ops/Runbooks "}
+    assert connector._path_allowed(metadata)
+    hits = SharePointConnector._normalize_path_prefix.cache_info().hits
+
+    assert connector._path_allowed(metadata)
+    assert SharePointConnector._normalize_path_prefix.cache_info().hits == hits + 1
+    assert not connector._path_allowed({"path": "/drives/drive-1/root:/Engineering"})
+
+
+def test_sharepoint_search_scores_token_overlap_fraction(monkeypatch) -> None:
+    connector = SharePointConnector(site_id="site-id", bearer_token="token")
+    records = [
+        {"source_id": "1", "uri": "u1", "text": "alpha beta gamma", "metadata": {}},
+        {"source_id": "2", "uri": "u2", "text": "alpha only", "metadata": {}},
+        {"source_id": "3", "uri": "u3", "text": "unrelated", "metadata": {}},
+    ]
+    monkeypatch.setattr(connector, "_search_records", lambda query: records)
+
+    results = connector.search(query="alpha beta delta", filters={}, k=3)
+    assert [(result.source_id, result.score) for result in results] == [
+        ("1", 0.666667),
+        ("2", 0.333333),
+        ("3", 0.0),
+    ]
+    assert [result.score for result in connector.search(query="!!", filters={}, k=3)] == [
+        0.0,
+        0.0,
+        0.0,
+    ]
+
+
+def test_sharepoint_download_stops_reading_after_text_limit() -> None:
+    body = _FakeStreamResponse(["word " * 2_000] * 10)
+
+    class _StreamingClient:
+        @contextmanager
+        def stream(self, method: str, url: str):  # noqa: ANN201
+            yield body
+
+    connector = SharePointConnector(
+        site_id="site-id", bearer_token="token", http_client=_StreamingClient()
+    )
+    text = connector._get_text("https://download/doc")
+
+    assert body.consumed == 2
+    assert text == " ".join(["word"] * 4_000)
+
+
+def test_sharepoint_download_error_includes_body() -> None:
+    class _FailingClient:
+        @contextmanager
+        def stream(self, method: str, url: str):  # noqa: ANN201
+            yield _FakeStreamResponse(["access denied"], status_code=403)
+
+    connector = SharePointConnector(
+        site_id="site-id", bearer_token="token", http_client=_FailingClient()
+    )
+    with pytest.raises(RuntimeError, match="403: access denied"):
+        connector._get_text("https://download/doc")
+
+
+class _ThrottledResponse(_FakeResponse):
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        super().__init__(payload={"error": "throttled"}, status_code=status_code)
+        self.headers = headers or {}
+
+
+def test_sharepoint_retries_throttled_requests(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.rag.connectors.sharepoint.sleep", sleeps.append)
+    responses = [
+        _ThrottledResponse(429, {"Retry-After": "2"}),
+        _ThrottledResponse(503),
+        _FakeResponse(payload={"value": []}),
+    ]
+
+    class _SequenceClient:
+        def get(self, url: str, params=None, headers=None):  # noqa: ANN001
+            return responses.pop(0)
+
+    connector = SharePointConnector(
+        site_id="site-id",
+        bearer_token="token",
+        http_client=_SequenceClient(),
+        backoff_base_s=0.5,
+    )
+    assert connector._get_json("/sites/site-id/drive/root", {}) == {"value": []}
+    assert sleeps[0] == 2.0
+    assert 1.0 <= sleeps[1] <= 1.5
+
+
+def test_sharepoint_gives_up_after_max_retries(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.rag.connectors.sharepoint.sleep", sleeps.append)
+
+    class _AlwaysThrottledClient:
+        def get(self, url: str, params=None, headers=None):  # noqa: ANN001
+            return _ThrottledResponse(429)
+
+    connector = SharePointConnector(
+        site_id="site-id",
+        bearer_token="token",
+        http_client=_AlwaysThrottledClient(),
+        max_retries=2,
+    )
+    with pytest.raises(RuntimeError, match="429"):
+        connector._get_json_absolute("https://graph.microsoft.com/v1.0/next")
+    assert len(sleeps) == 2
+
+
+def test_sharepoint_search_keeps_top_k_in_stable_order(monkeypatch) -> None:
+    connector = SharePointConnector(site_id="site-id", bearer_token="token")
+    records = [
+        {"source_id": str(index), "uri": f"u{index}", "text": text, "metadata": {}}
+        for index, text in enumerate(["beta", "alpha one", "alpha two", "alpha three"])
+    ]
+    monkeypatch.setattr(connector, "_search_records", lambda query: records)
+
+    results = connector.search(query="alpha", filters={}, k=2)
+    assert [result.source_id for result in results] == ["1", "2"]
+
+
+def test_sharepoint_fetch_many_rebatches_throttled_items(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.rag.connectors.sharepoint.sleep", sleeps.append)
+
+    class _ThrottlingBatchClient(_FakeBatchHTTPClient):
+        def post(self, url: str, json=None, headers=None):  # noqa: ANN001
+            payload = super().post(url, json=json, headers=headers).json()
+            if len(self.posts) == 1:
+                for item in payload["responses"]:
+                    if item["id"] == "1":
+                        item.update(status=429, headers={"retry-after": "3"}, body={})
+            return _FakeResponse(payload=payload)
+
+    client = _ThrottlingBatchClient()
+    connector = SharePointConnector(site_id="site-id", bearer_token="token", http_client=client)
+
+    documents = connector.fetch_many(["doc-0", "doc-1", "doc-2"])
+
+    assert [document.source_id for document in documents if document is not None] == [
+        "doc-0",
+        "doc-1",
+        "doc-2",
+    ]
+    assert sleeps == [3.0]
+    retried = client.posts[1]["json"]["requests"]
+    assert [request["url"].split("/items/")[1].split("?")[0] for request in retried] == ["doc-1"]
+
+
+def test_sharepoint_batch_item_throttling_gives_up_after_max_retries(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.rag.connectors.sharepoint.sleep", sleeps.append)
+
+    class _AlwaysThrottledBatchClient:
+        def post(self, url: str, json=None, headers=None):  # noqa: ANN001
+            return _FakeResponse(
+                payload={
+                    "responses": [
+                        {"id": request["id"], "status": 503, "body": {"error": "busy"}}
+                        for request in json["requests"]
+                    ]
+                }
+            )
+
+    connector = SharePointConnector(
+        site_id="site-id",
+        bearer_token="token",
+        http_client=_AlwaysThrottledBatchClient(),
+        max_retries=2,
+    )
+    with pytest.raises(RuntimeError, match="503"):
+        connector.fetch_many(["doc-0"])
+    assert len(sleeps) == 2
+
+
+def test_sharepoint_throttle_waits_stay_within_timeout_budget(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.rag.connectors.sharepoint.sleep", sleeps.append)
+
+    class _LongRetryAfterClient:
+        def get(self, url: str, params=None, headers=None):  # noqa: ANN001
+            return _ThrottledResponse(429, {"Retry-After": "120"})
+
+    connector = SharePointConnector(
+        site_id="site-id",
+        bearer_token="token",
+        http_client=_LongRetryAfterClient(),
+        timeout_s=6.0,
+        max_retries=10,
+    )
+    with pytest.raises(RuntimeError, match="429"):
+        connector._get_json_absolute("https://graph.microsoft.com/v1.0/next")
+    assert sleeps == [5.0]
+    assert sum(sleeps) <= 6.0
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+from app.webhooks.batcher import WebhookBatcher
+from app.webhooks.dispatcher import (
+    WebhookDispatcher,
+    WebhookEndpoint,
+    WebhookEventType,
+)
+
+
+def _capture_posts(monkeypatch) -> list[dict[str, object]]:  # type: ignore[no-untyped-def]  # noqa: ANN001
+    captured: list[dict[str, object]] = []
+
+    async def fake_post(self, url: str, content: str, headers: dict[str, str]):  # type: ignore[no-untyped-def]  # noqa: ANN001
+        captured.append({"url": url, "content": content, "headers": headers})
+
+        class _Response:
+            status_code = 200
+
+        return _Response()
+
+    monkeypatch.setattr("httpx.AsyncClient.post", fake_post)
+    return captured
+
+
+def _dispatcher() -> WebhookDispatcher:
+    return WebhookDispatcher(
+        endpoints=[
+            WebhookEndpoint(
+                url="https://example.test/denied",
+                secret="secret",
+                event_types=frozenset({WebhookEventType.POLICY_DENIED}),
+            ),
+            WebhookEndpoint(url="https://example.test/all"),
+        ]
+    )
+
+
+def test_dispatch_batch_sends_one_post_per_subscribed_endpoint(monkeypatch) -> None:
+    captured = _capture_posts(monkeypatch)
+    results = asyncio.run(
+        _dispatcher().dispatch_batch(
+            [
+                (WebhookEventType.POLICY_DENIED, {"request_id": "req-1"}),
+                (WebhookEventType.REDACTION_HIT, {"request_id": "req-2"}),
+            ]
+        )
+    )
+
+    assert [result.event_indexes for result in results] == [(0,), (0, 1)]
+    assert all(result.success for result in results)
+    assert len(captured) == 2
+    assert "X-SRG-Signature" in captured[0]["headers"]  # type: ignore[operator]
+
+    body = json.loads(str(captured[1]["content"]))
+    assert body["event_type"] == "batch"
+    assert body["batch_id"].startswith("batch-")
+    assert [event["event_type"] for event in body["events"]] == [
+        "policy_denied",
+        "redaction_hit",
+    ]
+    assert body["events"][1]["payload"] == {"request_id": "req-2"}
+
+
+def test_batcher_flushes_at_size_threshold(monkeypatch) -> None:
+    captured = _capture_posts(monkeypatch)
+    summaries: list[dict[str, object]] = [
+        {"event_type": "policy_denied", "delivery_success_count": None} for _ in range(3)
+    ]
+
+    async def _run() -> int:
+        batcher = WebhookBatcher(_dispatcher(), max_batch_size=3, flush_interval_s=60.0)
+        for index, summary in enumerate(summaries):
+            batcher.enqueue(WebhookEventType.POLICY_DENIED, {"n": index}, summary)
+        pending = batcher.pending_count
+        await batcher.flush()
+        return pending
+
+    assert asyncio.run(_run()) == 0
+    assert len(captured) == 2
+    assert [summary["delivery_success_count"] for summary in summaries] == [2, 2, 2]
+
+
+def test_batcher_flushes_after_interval(monkeypatch) -> None:
+    captured = _capture_posts(monkeypatch)
+
+    async def _run() -> None:
+        batcher = WebhookBatcher(_dispatcher(), max_batch_size=50, flush_interval_s=0.01)
+        batcher.enqueue(WebhookEventType.REDACTION_HIT, {"request_id": "req-1"})
+        batcher.enqueue(WebhookEventType.REDACTION_HIT, {"request_id": "req-2"})
+        assert captured == []
+        await asyncio.sleep(0.05)
+        await batcher.flush()
+
+    asyncio.run(_run())
+    assert len(captured) == 1
+    body = json.loads(str(captured[0]["content"]))
+    assert len(body["events"]) == 2
+
+
+def test_batcher_drops_events_beyond_max_pending(monkeypatch) -> None:
+    _capture_posts(monkeypatch)
+
+    async def _run() -> list[bool]:
+        batcher = WebhookBatcher(
+            _dispatcher(), max_batch_size=10, flush_interval_s=60.0, max_pending=2
+        )
+        accepted = [
+            batcher.enqueue(WebhookEventType.REDACTION_HIT, {"n": index}) for index in range(3)
+        ]
+        await batcher.flush()
+        return accepted
+
+    assert asyncio.run(_run()) == [True, True, False]